@@ -3,25 +3,20 @@ import ladybug._datacollectionbase
 import ladybug.datacollection
 import ladybug.datacollectionimmutable
 
-from ladybug.logutil import get_logger
+import os
 
-import importlib
-import pkgutil
-import sys
+from ladybug.logutil import get_logger
+from ladybug.pluginutil import CACHE_VARIABLE, load_mode, load_extensions, \
+    discover_extensions
 
 # set up the logger
 logger = get_logger(__name__)
 
 #  find and import ladybug extensions
 #  this is a critical step to add additional functionalities to ladybug core library.
+#  set the LADYBUG_EXTENSIONS environment variable to lazy or disabled to skip it.
+#  the manifest of extensions is only written here if its location has been set.
 extensions = {}
-for finder, name, ispkg in pkgutil.iter_modules():
-    if not name.startswith('ladybug_') or name.count('_') > 1:
-        continue
-    try:
-        extensions[name] = importlib.import_module(name)
-    except Exception:
-        if (sys.version_info >= (3, 0)) and name != 'ladybug_vtk':
-            logger.exception('Failed to import {0}!'.format(name))
-    else:
-        logger.info('Successfully imported Ladybug plugin: {}'.format(name))
+if load_mode() == 'eager':
+    load_extensions(
+        extensions, discover_extensions(write_cache=CACHE_VARIABLE in os.environ))
@@ -13,6 +13,7 @@ except ImportError:
     from collections import Iterable  # python >= 3.8
 from string import ascii_lowercase
 import math
+from bisect import bisect_right
 
 try:
     from itertools import izip as zip  # python 2
@@ -280,19 +281,16 @@ class BaseCollection(object):
         head = self.header
         dat_type, agg_class = head.data_type, None
         # first see if there's a specific data type for the current one
-        for typ_clss in TYPESDICT.values():
-            if typ_clss._normalized_type is None:
-                continue
-            elif dat_type.__class__ == typ_clss._normalized_type:
+        norm_types = TYPESDICT.normalizing_types()
+        for typ_clss in norm_types:
+            if dat_type.__class__ == typ_clss._normalized_type:
                 agg_class = typ_clss
                 break
         # then, check to see if there's any base type
         if agg_class is None:
-            for typ_clss_name in BASETYPES:
-                typ_clss = TYPESDICT[typ_clss_name]
-                if typ_clss._normalized_type is None:
-                    continue
-                elif isinstance(dat_type, typ_clss._normalized_type):
+            for typ_clss in norm_types:
+                if typ_clss.__name__ in BASETYPES and \
+                        isinstance(dat_type, typ_clss._normalized_type):
                     agg_class = typ_clss
                     break
         # if nothing was found, throw an error
@@ -920,37 +918,15 @@ class BaseCollection(object):
                     (0, 1, 2), key=lambda k: k[0])
             # >> [[], [(0, a), (0, b), (0.9, c)], [(1, d), (1.5, e), (1.99, f)], []]
         """
-        if key is None:
-            def key(v):
-                return v
-
-        vals = sorted(values, key=key)
-        min_bound, max_bound = min(bins), max(bins)
-        bin_bound_num = len(bins)
-
-        # Init histogram bins
-        hist = [[] for i in range(bin_bound_num + 1)]
-        bin_index = 0
-
-        for val in vals:
-            k = key(val)
-            # Ignore values out of range
-            if k < min_bound:
-                hist[0].append(val)
-                continue
-            elif k >= max_bound:
-                hist[-1].append(val)
-                continue
+        vals = values if isinstance(values, list) else list(values)
+        keys = vals if key is None else [key(v) for v in vals]
+        bin_ids = BaseCollection.histogram_bin_indices(keys, bins)
 
-            # This loop will iterate through the bin upper bounds.
-            # If the value is within the bounds, the lower bound
-            # of the bin_index is updated, and the loop is broken
-            for i in range(bin_index, bin_bound_num - 1):
-                if k < bins[i + 1]:
-                    hist[i + 1].append(val)
-                    bin_index = i
-                    break
-        return hist
+        # group the values by bin and order each bin by key
+        hist = [[] for i in xrange(len(bins) + 1)]
+        for i, val in zip(bin_ids, vals):
+            hist[i].append(val)
+        return [sorted(h, key=key) for h in hist]
 
     @staticmethod
     def histogram_circular(values, bins, hist_range=None, key=None):
@@ -983,47 +959,250 @@ class BaseCollection(object):
             histogram_circular([358, 359, 0, 1, 2, 3], (358, 0, 3))
             # >> [[358, 359], [0, 1, 2]]
         """
-        if key is None:
-            def key(v):
-                return v
+        vals = values if isinstance(values, list) else list(values)
+        keys = vals if key is None else [key(v) for v in vals]
+        if hist_range is None:
+            hist_range = (min(keys), max(keys) + 1)
+        bin_ids = BaseCollection.histogram_circular_bin_indices(keys, bins, hist_range)
 
-        vals = sorted(values, key=key)
+        # group the values by bin and order each bin by key
+        hist = [[] for i in xrange(len(bins) - 1)]
+        for i, val in zip(bin_ids, vals):
+            if i is not None:
+                hist[i].append(val)
+        return [sorted(h, key=key) for h in hist]
 
-        if hist_range is None:
-            hist_range = (key(vals[0]), key(vals[-1]) + 1)
+    @staticmethod
+    def histogram_bin_indices(values, bins):
+        """Get the index of the histogram bin that each value falls into.
 
-        bin_bound_num = len(bins) - 1
+        The indices follow the structure of the output of the histogram method
+        such that values below the first bin edge have an index of 0 and values
+        greater than or equal to the last bin edge have an index of len(bins).
+        This is a single pass over the values that does not require sorting them.
 
-        # Init histogram bins
-        hist = [[] for i in range(bin_bound_num)]
-        for val in vals:
-            k = key(val)
+        Args:
+            values: Set of numerical data as a list.
+            bins: A monotonically increasing array of bin edges, excluding
+                the rightmost edge.
 
-            # Ignore values out of range
-            if k < hist_range[0] or k >= hist_range[1]:
-                continue
+        Returns:
+            A list of integers with one bin index for each of the input values.
+        """
+        return [bisect_right(bins, v) for v in values]
+
+    @staticmethod
+    def histogram_circular_bin_indices(values, bins, hist_range):
+        """Get the index of the circular histogram bin that each value falls into.
+
+        The indices follow the structure of the output of the histogram_circular
+        method. This is a single pass over the values that does not require
+        sorting them.
+
+        Args:
+            values: Set of numerical data as a list.
+            bins: An array of bin edges, excluding the rightmost edge. These values
+                do not have to be monotonically increasing.
+            hist_range: A tuple of numbers for the lower and upper range of
+                the histogram.
+
+        Returns:
+            A list with one bin index for each of the input values. Values that are
+            outside of the hist_range or do not fall into any bin have an index of None.
+        """
+        low, high = hist_range
+        bin_bound_num = len(bins) - 1
 
-            # This loop will iterate through the bin upper bounds.
-            # If the value is within the bounds, the loop is broken.
-            # Since values at the end of the list can still be binned
-            # into the earlier histogram bars for circular
-            # data, we don't update the bin_index.
-            for i in range(bin_bound_num):
+        # each circular bin is bounded by the bin edges and the histogram range so
+        # every value shares the bin of the closest of these edges below it
+        edges = sorted(set(bins) | set(hist_range))
+        edge_bins = []
+        for k in edges:
+            edge_bin = None
+            for i in xrange(bin_bound_num):
                 if bins[i] < bins[i + 1]:
-                    if k >= bins[i] and k < bins[i + 1]:
-                        hist[i].append(val)
-                        break
-                else:
-                    # If the interval starts data from the end of the list,
-                    # split the conditional checks into two to check two
-                    # intervals.
-                    interval1 = (k <= hist_range[1] and k >= bins[i])
-                    interval2 = (k < bins[i + 1] and k >= hist_range[0])
-                    if interval1 or interval2:
-                        hist[i].append(val)
+                    if bins[i] <= k < bins[i + 1]:
+                        edge_bin = i
                         break
+                elif (bins[i] <= k <= high) or (low <= k < bins[i + 1]):
+                    edge_bin = i
+                    break
+            edge_bins.append(edge_bin)
+
+        return [edge_bins[bisect_right(edges, v) - 1] if low <= v < high else None
+                for v in values]
+
+    @staticmethod
+    def histogram_counts(values, bins, weights=None, key=None):
+        """Compute the number of values in each bin of a histogram.
+
+        This uses the same bins as the histogram method but, since it only counts
+        the values, it does not need to sort them.
+
+        Args:
+            values: Set of numerical data as a list.
+            bins: A monotonically increasing array of uniform-width bin edges, excluding
+                the rightmost edge.
+            weights: An optional list of numbers that aligns with the values. If
+                provided, the weights of the values in each bin will be summed
+                instead of counting the values.
+            key: Optional parameter to define key to bin values by, as a function. If not
+                provided, the histogram will be binned by the value.
+
+        Returns:
+            A list of numbers for the count (or weight) of the values in each bin.
+
+        Usage:
+
+        .. code-block:: python
+
+            from BaseCollection import histogram_counts
+
+            histogram_counts([0, 0, 0.9, 1, 1.5, 1.99, 2, 3], (0, 1, 2, 3))
+            # >> [0, 3, 3, 1, 1]
+        """
+        keys = values if key is None else [key(v) for v in values]
+        bin_ids = BaseCollection.histogram_bin_indices(keys, bins)
+        return BaseCollection._bin_counts(bin_ids, len(bins) + 1, weights)
+
+    @staticmethod
+    def histogram_circular_counts(values, bins, hist_range=None, weights=None,
+                                  key=None):
+        """Compute the number of values in each bin of a circular histogram.
+
+        This uses the same bins as the histogram_circular method but, since it only
+        counts the values, it does not need to sort them.
+
+        Args:
+            values: Set of numerical data as a list.
+            bins: An array of uniform-width bin edges, excluding the rightmost edge.
+                These values do not have to be monotonically increasing.
+            hist_range: Optional parameter to define the lower and upper range of the
+                histogram as a tuple of numbers. If not provided the range is
+                ``(min(key(values)), max(key(values))+1)``.
+            weights: An optional list of numbers that aligns with the values. If
+                provided, the weights of the values in each bin will be summed
+                instead of counting the values.
+            key: Optional parameter to define key to bin values by, as a function. If not
+                provided, the histogram will be binned by the value.
+
+        Returns:
+            A list of numbers for the count (or weight) of the values in each bin.
+
+        Usage:
+
+        .. code-block:: python
+
+            from BaseCollection import histogram_circular_counts
+
+            histogram_circular_counts([358, 359, 0, 1, 2, 3], (358, 0, 3))
+            # >> [2, 3]
+        """
+        keys = values if key is None else [key(v) for v in values]
+        if hist_range is None:
+            hist_range = (min(keys), max(keys) + 1)
+        bin_ids = BaseCollection.histogram_circular_bin_indices(keys, bins, hist_range)
+        return BaseCollection._bin_counts(bin_ids, len(bins) - 1, weights)
+
+    @staticmethod
+    def histogram_stacked(values, bins, stack_values, stack_bins, weights=None):
+        """Compute a histogram where each bin is subdivided by a second set of values.
 
-        return hist
+        For example, this can be used to get the number of hours in each range of
+        dry bulb temperature that fall within each range of relative humidity.
+
+        Args:
+            values: Set of numerical data as a list.
+            bins: A monotonically increasing array of bin edges for the values,
+                excluding the rightmost edge.
+            stack_values: Set of numerical data that aligns with the values, which
+                will be used to subdivide each bin.
+            stack_bins: A monotonically increasing array of bin edges for the
+                stack_values, excluding the rightmost edge.
+            weights: An optional list of numbers that aligns with the values. If
+                provided, the weights will be summed instead of counting the values.
+
+        Returns:
+            A list of lists where each sub-list is for a bin of the values and
+            contains the count (or weight) for each of the stack_bins. Both levels
+            follow the structure of the output of the histogram method.
+        """
+        bin_ids = BaseCollection.histogram_bin_indices(values, bins)
+        return BaseCollection._stacked_bin_counts(
+            bin_ids, len(bins) + 1, stack_values, stack_bins, weights)
+
+    @staticmethod
+    def histogram_circular_stacked(values, bins, stack_values, stack_bins,
+                                   hist_range=None, weights=None):
+        """Compute a circular histogram with bins subdivided by a second set of values.
+
+        For example, this can be used to get the number of hours that the wind
+        blows from each direction within each range of wind speed.
+
+        Args:
+            values: Set of circular numerical data as a list.
+            bins: An array of bin edges for the values, excluding the rightmost
+                edge. These values do not have to be monotonically increasing.
+            stack_values: Set of numerical data that aligns with the values, which
+                will be used to subdivide each bin.
+            stack_bins: A monotonically increasing array of bin edges for the
+                stack_values, excluding the rightmost edge.
+            hist_range: Optional parameter to define the lower and upper range of the
+                histogram as a tuple of numbers. If not provided the range is
+                ``(min(values), max(values)+1)``.
+            weights: An optional list of numbers that aligns with the values. If
+                provided, the weights will be summed instead of counting the values.
+
+        Returns:
+            A list of lists where each sub-list is for a bin of the values
+            following the structure of the output of the histogram_circular method.
+            Each sub-list contains the count (or weight) for each of the stack_bins
+            following the structure of the output of the histogram method.
+        """
+        if hist_range is None:
+            hist_range = (min(values), max(values) + 1)
+        bin_ids = BaseCollection.histogram_circular_bin_indices(values, bins, hist_range)
+        return BaseCollection._stacked_bin_counts(
+            bin_ids, len(bins) - 1, stack_values, stack_bins, weights)
+
+    @staticmethod
+    def _bin_counts(bin_ids, bin_count, weights=None):
+        """Count (or sum the weights of) the values in each bin from their bin indices."""
+        counts = [0] * bin_count
+        if weights is None:
+            for i in bin_ids:
+                if i is not None:
+                    counts[i] += 1
+        else:
+            assert len(weights) == len(bin_ids), 'Length of histogram weights ({}) ' \
+                'does not match the number of values ({}).'.format(
+                    len(weights), len(bin_ids))
+            for i, w in zip(bin_ids, weights):
+                if i is not None:
+                    counts[i] += w
+        return counts
+
+    @staticmethod
+    def _stacked_bin_counts(bin_ids, bin_count, stack_values, stack_bins, weights=None):
+        """Count the values in each bin subdivided by the bins of the stack_values."""
+        assert len(stack_values) == len(bin_ids), 'Length of histogram stack_values ' \
+            '({}) does not match the number of values ({}).'.format(
+                len(stack_values), len(bin_ids))
+        stack_ids = BaseCollection.histogram_bin_indices(stack_values, stack_bins)
+        stack_count = len(stack_bins) + 1
+        counts = [[0] * stack_count for i in xrange(bin_count)]
+        if weights is None:
+            for i, j in zip(bin_ids, stack_ids):
+                if i is not None:
+                    counts[i][j] += 1
+        else:
+            assert len(weights) == len(bin_ids), 'Length of histogram weights ({}) ' \
+                'does not match the number of values ({}).'.format(
+                    len(weights), len(bin_ids))
+            for i, j, w in zip(bin_ids, stack_ids, weights):
+                if i is not None:
+                    counts[i][j] += w
+        return counts
 
     def _filter_by_statement(self, statement):
         """Filter the data collection based on a conditional statement."""
@@ -59,6 +59,9 @@ import logging
 import json
 
 from ..config import folders
+from ladybug import extensions
+from ladybug.pluginutil import load_mode, load_extensions, load_report, \
+    save_manifest
 from ladybug.cli.setconfig import set_config
 from ladybug.cli.translate import translate
 
@@ -68,7 +71,8 @@ _logger = logging.getLogger(__name__)
 @click.group()
 @click.version_option()
 def main():
-    pass
+    # write the manifest of any extensions discovered upon import of ladybug
+    save_manifest()
 
 
 @main.command('config')
@@ -96,8 +100,33 @@ def viz():
     click.echo('viiiiiiiiiiiiizzzzzzzzz!')
 
 
+@main.command('extensions')
+@click.option('--output-file', help='Optional file to output the JSON string of '
+              'the extension load report. By default, it will be printed out to stdout',
+              type=click.File('w'), default='-', show_default=True)
+def extensions_report(output_file):
+    """Get a JSON object with the time spent discovering and importing extensions.
+
+    Set the LADYBUG_EXTENSIONS environment variable to eager, lazy or disabled in
+    order to change when the extensions are imported.
+    """
+    try:
+        report = load_report()
+        report['extensions'] = sorted(extensions.keys())
+        output_file.write(json.dumps(report, indent=4))
+    except Exception as e:
+        _logger.exception('Failed to generate extension report.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
 main.add_command(set_config, name='set-config')
 main.add_command(translate)
 
+# extensions that were not imported with ladybug add their commands on first CLI use
+if load_mode() == 'lazy':
+    load_extensions(extensions)
+
 if __name__ == "__main__":
     main()
@@ -60,6 +60,7 @@ class Compass(object):
     MINOR_TEXT = ('NNE', 'NE', 'ENE', 'ESE', 'SE', 'SSE', 'SSW', 'SW', 'WSW',
                   'WNW', 'NW', 'NNW')
     ALTITUDES = (10, 20, 30, 40, 50, 60, 70, 80)
+    PROJECTIONS = ('Orthographic', 'Stereographic', 'Equidistant', 'Equisolid')
     PI = math.pi
 
     def __init__(self, radius=100, center=Point2D(), north_angle=0,
@@ -392,6 +393,138 @@ class Compass(object):
         # move the point back to its original location and scale
         return Point2D(proj_pt[0] * radius + origin.x, proj_pt[1] * radius + origin.y)
 
+    @staticmethod
+    def point3d_to_projection(
+            point, projection='Orthographic', radius=100, origin=Point3D()):
+        """Get a Point2D for a given Point3D using a projection with a given name.
+
+        Args:
+            point: A ladybug_geometry Point3D to be projected into 2D space.
+            projection: Text for the name of the projection to use from the sky
+                dome hemisphere to the 2D plane. (Default: 'Orthographic'). Choose
+                from the following:
+
+                * Orthographic
+                * Stereographic
+                * Equidistant
+                * Equisolid
+
+            radius: A positive number for the radius of the sphere on which the
+                point exists. (Default: 100).
+            origin: An optional ladybug_geometry Point3D representing the origin
+                of the coordinate system in which the projection is happening.
+                (eg. the center of the compass).
+        """
+        u, v = Compass.project_coordinates(
+            (point.x, point.y, point.z), projection, radius, origin)
+        return Point2D(u, v)
+
+    @staticmethod
+    def points3d_to_projection(
+            points, projection='Orthographic', radius=100, origin=Point3D()):
+        """Get a list of Point2Ds for a list of Point3Ds using a given projection.
+
+        Args:
+            points: A list of ladybug_geometry Point3D to be projected into 2D space.
+            projection: Text for the name of the projection to use from the sky
+                dome hemisphere to the 2D plane. (Default: 'Orthographic'). Choose
+                from the following:
+
+                * Orthographic
+                * Stereographic
+                * Equidistant
+                * Equisolid
+
+            radius: A positive number for the radius of the sphere on which the
+                points exist. (Default: 100).
+            origin: An optional ladybug_geometry Point3D representing the origin
+                of the coordinate system in which the projection is happening.
+                (eg. the center of the compass).
+        """
+        coords = [c for pt in points for c in (pt.x, pt.y, pt.z)]
+        proj = Compass.project_coordinates(coords, projection, radius, origin)
+        return [Point2D(proj[i], proj[i + 1]) for i in range(0, len(proj), 2)]
+
+    @staticmethod
+    def project_coordinates(
+            coordinates, projection='Orthographic', radius=100, origin=Point3D()):
+        """Project a flat list of 3D coordinates into a flat list of 2D coordinates.
+
+        This is much faster than projecting each Point3D individually when working
+        with a large number of points (eg. hourly sun positions or the vertices of
+        a high-resolution sky dome) and the results are identical to those of the
+        point3d_to_[projection] methods.
+
+        Args:
+            coordinates: A flat list of numbers for the 3D coordinates to be
+                projected (eg. [x0, y0, z0, x1, y1, z1, ...]).
+            projection: Text for the name of the projection to use from the sky
+                dome hemisphere to the 2D plane. (Default: 'Orthographic'). Choose
+                from the following:
+
+                * Orthographic
+                * Stereographic
+                * Equidistant
+                * Equisolid
+
+            radius: A positive number for the radius of the sphere on which the
+                points exist. (Default: 100).
+            origin: An optional ladybug_geometry Point3D representing the origin
+                of the coordinate system in which the projection is happening.
+                (eg. the center of the compass).
+
+        Returns:
+            A flat list of numbers for the projected 2D coordinates
+            (eg. [u0, v0, u1, v1, ...]).
+        """
+        assert len(coordinates) % 3 == 0, 'Length of coordinates for projection ' \
+            'must be a multiple of 3. Got {}.'.format(len(coordinates))
+        clean_proj = projection.title()
+        if clean_proj == 'Orthographic':
+            return [c for i in range(0, len(coordinates), 3)
+                    for c in (coordinates[i], coordinates[i + 1])]
+        o_x, o_y, o_z = origin.x, origin.y, origin.z
+        xs = [x - o_x for x in coordinates[0::3]]
+        ys = [y - o_y for y in coordinates[1::3]]
+        zs = [z - o_z for z in coordinates[2::3]]
+        if clean_proj == 'Stereographic':
+            projected = []
+            for x, y, z in zip(xs, ys, zs):
+                # perform the projection while scaling it to the unit sphere
+                proj_x, proj_y = x / (radius + z), y / (radius + z)
+                projected.append(proj_x * radius + o_x)
+                projected.append(proj_y * radius + o_y)
+            return projected
+        if clean_proj == 'Equidistant':
+            radius_func = Compass._equidistant_radius
+        elif clean_proj == 'Equisolid':
+            radius_func = Compass._equisolid_radius
+        else:
+            raise ValueError('Projection "{}" is not supported.'.format(projection))
+        projected = []
+        for x, y, z in zip(xs, ys, zs):
+            dist_xy = math.sqrt(x ** 2 + y ** 2)
+            if dist_xy == 0:
+                projected.append(o_x)
+                projected.append(o_y)
+                continue
+            z_ratio = z / radius
+            z_ratio = min(1, max(-1, z_ratio))
+            scale = radius_func(math.acos(z_ratio), radius) / dist_xy
+            projected.append(x * scale + o_x)
+            projected.append(y * scale + o_y)
+        return projected
+
+    @staticmethod
+    def _equidistant_radius(zenith_angle, radius):
+        """Get the projected radius for a zenith angle in an equidistant projection."""
+        return radius * ((2 * zenith_angle) / math.pi)
+
+    @staticmethod
+    def _equisolid_radius(zenith_angle, radius):
+        """Get the projected radius for a zenith angle in an equisolid projection."""
+        return radius * (math.sin(zenith_angle / 2) / math.sin(math.pi / 4))
+
     def __key(self):
         """A tuple based on the object properties, useful for hashing."""
         return (self.radius, hash(self.center), self.north_angle, self.spacing_factor)
@@ -14,12 +14,13 @@ Properties:
     keys of this dictionary are the base type names (eg. 'Temperature').
 
     TYPESDICT: A dictionary containing pointers to the classes of each data type.
-    The keys of this dictionary are the data type names.
+    The keys of this dictionary are the data type names. The module of each
+    data type is only imported once its class is requested from the dictionary.
 """
 
 from .base import _DataTypeEnumeration
 
-_data_types = _DataTypeEnumeration(import_modules=True)
+_data_types = _DataTypeEnumeration(import_modules=False)
 TYPES = _data_types.types
 BASETYPES = _data_types.base_types
 UNITS = _data_types.units
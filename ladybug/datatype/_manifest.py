@@ -0,0 +1,123 @@
+# coding=utf-8
+"""Static manifest of the data types in this package and the modules containing them.
+
+This manifest allows data types and units to be looked up without importing all
+of the data type modules. It must be updated whenever a data type is added.
+"""
+
+# the names of the data types within each module of this package
+TYPE_MODULES = {
+    'angle': ('Angle', 'WindDirection'),
+    'area': ('Area',),
+    'conductance': ('Conductance',),
+    'conductivity': ('Conductivity',),
+    'current': ('Current',),
+    'density': ('Density',),
+    'distance': (
+        'CeilingHeight', 'Distance', 'LiquidPrecipitationDepth', 'PrecipitableWater',
+        'SnowDepth', 'Visibility'),
+    'energy': ('Energy',),
+    'energyflux': (
+        'DiffuseHorizontalIrradiance', 'DirectHorizontalIrradiance',
+        'DirectNormalIrradiance', 'EffectiveRadiantField', 'EnergyFlux',
+        'GlobalHorizontalIrradiance', 'HorizontalInfraredRadiationIntensity',
+        'Irradiance', 'MetabolicRate'),
+    'energyintensity': (
+        'DiffuseHorizontalRadiation', 'DirectHorizontalRadiation',
+        'DirectNormalRadiation', 'EnergyIntensity',
+        'ExtraterrestrialDirectNormalRadiation', 'ExtraterrestrialHorizontalRadiation',
+        'GlobalHorizontalRadiation', 'Radiation'),
+    'fraction': (
+        'AerosolOpticalDepth', 'Albedo', 'Fraction', 'HumidityRatio',
+        'LiquidPrecipitationQuantity', 'OpaqueSkyCover', 'PercentagePeopleDissatisfied',
+        'RelativeHumidity', 'TotalSkyCover'),
+    'illuminance': (
+        'DiffuseHorizontalIlluminance', 'DirectNormalIlluminance',
+        'GlobalHorizontalIlluminance', 'Illuminance'),
+    'luminance': ('Luminance', 'ZenithLuminance'),
+    'mass': ('Mass',),
+    'massflowrate': ('MassFlowRate',),
+    'power': ('ActivityLevel', 'Power'),
+    'pressure': ('AtmosphericStationPressure', 'Pressure'),
+    'resistance': ('Resistance',),
+    'resistivity': ('Resistivity',),
+    'rvalue': ('ClothingInsulation', 'RValue'),
+    'specificenergy': ('Enthalpy', 'SpecificEnergy'),
+    'specificheatcapacity': ('SpecificHeatCapacity',),
+    'speed': ('AirSpeed', 'Speed', 'WindSpeed'),
+    'temperature': (
+        'AirTemperature', 'ClothingTemperature', 'CoreBodyTemperature',
+        'DewPointTemperature', 'DryBulbTemperature', 'GroundTemperature',
+        'HeatIndexTemperature', 'MeanRadiantTemperature', 'NeutralTemperature',
+        'OperativeTemperature', 'PhysiologicalEquivalentTemperature',
+        'PrevailingOutdoorTemperature', 'RadiantTemperature', 'SkinTemperature',
+        'SkyTemperature', 'StandardEffectiveTemperature', 'Temperature',
+        'UniversalThermalClimateIndex', 'WetBulbGlobeTemperature', 'WetBulbTemperature',
+        'WindChillTemperature'),
+    'temperaturedelta': (
+        'AirTemperatureDelta', 'OperativeTemperatureDelta', 'RadiantTemperatureDelta',
+        'TemperatureDelta'),
+    'temperaturetime': ('CoolingDegreeTime', 'HeatingDegreeTime', 'TemperatureTime'),
+    'thermalcondition': (
+        'CoreTemperatureCategory', 'DiscomfortReason', 'PredictedMeanVote',
+        'ThermalComfort', 'ThermalCondition', 'ThermalConditionElevenPoint',
+        'ThermalConditionFivePoint', 'ThermalConditionNinePoint',
+        'ThermalConditionSevenPoint', 'UTCICategory'),
+    'time': ('Time',),
+    'uvalue': ('ConvectionCoefficient', 'RadiantCoefficient', 'UValue'),
+    'voltage': ('Voltage',),
+    'volume': ('Volume',),
+    'volumeflowrate': ('VolumeFlowRate',),
+    'volumeflowrateintensity': ('VolumeFlowRateIntensity',),
+    'volumeheatcapacity': ('VolumetricHeatCapacity',),
+}
+
+# the units of each base type, which are the data types on which units are defined
+BASE_TYPE_UNITS = {
+    'Angle': ('degrees', 'radians'),
+    'Area': ('m2', 'ft2', 'mm2', 'in2', 'km2', 'mi2', 'cm2', 'ha', 'acre'),
+    'Conductance': ('W/K', 'Btu/h-F'),
+    'Conductivity': ('W/m-K', 'Btu/h-ft-F', 'cal/s-cm-C'),
+    'Current': ('A', 'mA'),
+    'Density': ('kg/m3', 'lb/ft3', 'g/cm3', 'oz/in3'),
+    'Distance': ('m', 'ft', 'mm', 'in', 'km', 'mi', 'cm'),
+    'Energy': (
+        'kWh', 'kBtu', 'Wh', 'Btu', 'MMBtu', 'J', 'kJ', 'MJ', 'GJ', 'therm', 'cal',
+        'kcal'),
+    'EnergyFlux': ('W/m2', 'Btu/h-ft2', 'kW/m2', 'kBtu/h-ft2', 'W/ft2', 'met'),
+    'EnergyIntensity': ('kWh/m2', 'kBtu/ft2', 'Wh/m2', 'Btu/ft2', 'kWh/ft2', 'kBtu/m2'),
+    'Fraction': ('fraction', '%', 'tenths', 'thousandths', 'okta'),
+    'Illuminance': ('lux', 'fc'),
+    'Luminance': ('cd/m2', 'cd/ft2'),
+    'Mass': ('kg', 'lb', 'g', 'tonne', 'ton', 'oz'),
+    'MassFlowRate': ('kg/s', 'lb/s', 'g/s', 'oz/s'),
+    'Power': ('W', 'Btu/h', 'kW', 'kBtu/h', 'TR', 'hp'),
+    'Pressure': ('Pa', 'inHg', 'atm', 'bar', 'Torr', 'psi', 'inH2O'),
+    'RValue': ('K-m2/W', 'F-ft2-h/Btu', 'clo', 'm2-K/W', 'h-ft2-F/Btu'),
+    'Resistance': ('K/W', 'F-h/Btu'),
+    'Resistivity': ('K-m/W', 'F-ft-h/Btu'),
+    'SpecificEnergy': ('kWh/kg', 'kBtu/lb', 'Wh/kg', 'Btu/lb', 'J/kg', 'kJ/kg'),
+    'SpecificHeatCapacity': ('J/kg-K', 'Btu/lb-F', 'kWh/kg-K', 'kBtu/lb-F', 'kJ/kg-K'),
+    'Speed': ('m/s', 'mph', 'km/h', 'knot', 'ft/s', 'ft/min'),
+    'Temperature': ('C', 'F', 'K'),
+    'TemperatureDelta': ('dC', 'dF', 'dK'),
+    'TemperatureTime': ('degC-days', 'degF-days', 'degC-hours', 'degF-hours'),
+    'ThermalCondition': ('condition', 'PMV'),
+    'Time': ('hr', 'min', 'sec', 'day'),
+    'UValue': ('W/m2-K', 'Btu/h-ft2-F'),
+    'Voltage': ('V', 'kV'),
+    'Volume': ('m3', 'ft3', 'mm3', 'in3', 'km3', 'mi3', 'L', 'mL', 'gal', 'fl oz'),
+    'VolumeFlowRate': (
+        'm3/s', 'ft3/s', 'L/s', 'cfm', 'gpm', 'mL/s', 'fl oz/s', 'L/h', 'gph'),
+    'VolumeFlowRateIntensity': (
+        'm3/s-m2', 'ft3/s-ft2', 'L/s-m2', 'cfm/ft2', 'L/h-m2', 'gph/ft2'),
+    'VolumetricHeatCapacity': (
+        'J/m3-K', 'Btu/ft3-F', 'kWh/m3-K', 'kBtu/ft3-F', 'kJ/m3-K', 'MJ/m3-K'),
+}
+
+# the data types that define a normalized_type and the name of that normalized type
+NORMALIZED_TYPES = {
+    'Energy': 'EnergyIntensity',
+    'Power': 'EnergyFlux',
+    'VolumeFlowRate': 'VolumeFlowRateIntensity',
+}
@@ -2,10 +2,11 @@
 """Base data type."""
 from __future__ import division
 
-import os
 import importlib
 import re
 
+from ._manifest import TYPE_MODULES, BASE_TYPE_UNITS, NORMALIZED_TYPES
+
 
 class DataTypeBase(object):
     """Base class for data types.
@@ -43,6 +44,7 @@ class DataTypeBase(object):
     _time_aggregated_factor = None
 
     _type_enumeration = None
+    _unit_converters = {}  # cache of unit converters shared by all data types
 
     def __init__(self, name=None):
         """Initialize DataType.
@@ -147,6 +149,31 @@ class DataTypeBase(object):
             'to_si is not implemented on %s' % self.__class__.__name__
         )
 
+    def unit_converter(self, from_unit, to_unit):
+        """Get a function that converts a list of values between two units.
+
+        The function is built the first time that it is requested for each data
+        type and pair of units, after which the same function is returned.
+
+        Args:
+            from_unit: Text for the unit of the values to be converted. This
+                must be one of the data type's units.
+            to_unit: Text for the unit to which the values will be converted.
+                This must be one of the data type's units.
+
+        Returns:
+            A function that accepts a list of values in the from_unit and returns
+            a list of values in the to_unit. If the two units are the same, the
+            function returns the input values.
+        """
+        key = (self.__class__, from_unit, to_unit)
+        try:
+            return self._unit_converters[key]
+        except KeyError:
+            converter = self._build_unit_converter(from_unit, to_unit)
+            self._unit_converters[key] = converter
+            return converter
+
     def is_in_range(self, values, unit=None, raise_exception=True):
         """Check if a list of values is within physically/mathematically possible range.
 
@@ -161,14 +188,8 @@ class DataTypeBase(object):
             minimum = self.min
             maximum = self.max
         else:
-            namespace = {'self': self}
-            self.is_unit_acceptable(unit, True)
-            min_statement = "self._{}_to_{}(self.min)".format(
-                self._clean(self.units[0]), self._clean(unit))
-            max_statement = "self._{}_to_{}(self.max)".format(
-                self._clean(self.units[0]), self._clean(unit))
-            minimum = eval(min_statement, namespace)
-            maximum = eval(max_statement, namespace)
+            minimum, maximum = \
+                self.unit_converter(self.units[0], unit)([self.min, self.max])
 
         for value in values:
             if value < minimum or value > maximum:
@@ -209,19 +230,41 @@ class DataTypeBase(object):
     def _to_unit_base(self, base_unit, values, unit, from_unit):
         """Return values in a given unit given the input from_unit."""
         self._is_numeric(values)
-        namespace = {'self': self, 'values': values}
-        if not from_unit == base_unit:
+        return self.unit_converter(from_unit, unit)(values)
+
+    def _build_unit_converter(self, from_unit, to_unit):
+        """Build a function that converts a list of values between two units.
+
+        Conversions go through the first unit of the data type (the base unit)
+        using the data type's _X_to_Y methods, which are looked up only once.
+        These methods do not depend on the data type instance and so the function
+        can be shared across all instances of the same data type class.
+        """
+        base_unit = self.units[0]
+        steps = []
+        if from_unit != base_unit:
             self.is_unit_acceptable(from_unit, True)
-            statement = '[self._{}_to_{}(val) for val in values]'.format(
-                self._clean(from_unit), self._clean(base_unit))
-            values = eval(statement, namespace)
-            namespace['values'] = values
-        if not unit == base_unit:
-            self.is_unit_acceptable(unit, True)
-            statement = '[self._{}_to_{}(val) for val in values]'.format(
-                self._clean(base_unit), self._clean(unit))
-            values = eval(statement, namespace)
-        return values
+            steps.append(getattr(self, '_{}_to_{}'.format(
+                self._clean(from_unit), self._clean(base_unit))))
+        if to_unit != base_unit:
+            self.is_unit_acceptable(to_unit, True)
+            steps.append(getattr(self, '_{}_to_{}'.format(
+                self._clean(base_unit), self._clean(to_unit))))
+
+        if len(steps) == 0:
+            def converter(values):
+                return values
+        elif len(steps) == 1:
+            convert = steps[0]
+
+            def converter(values):
+                return [convert(val) for val in values]
+        else:
+            to_base, from_base = steps
+
+            def converter(values):
+                return [from_base(to_base(val)) for val in values]
+        return converter
 
     def _clean(self, unit):
         """Clean out special characters from unit abbreviations."""
@@ -367,26 +410,111 @@ class DataTypeBase(object):
         return self.name
 
 
+class _DataTypeDict(dict):
+    """A dictionary of data type classes, which imports the classes when requested.
+
+    The names of the data types in the package are known from the manifest and
+    the module of each data type is only imported when its class is first
+    requested (or when all of the classes are requested through the values or
+    items). Data types defined outside the package can be added with register.
+
+    The keys follow the order of the manifest with the base type of each module
+    listed before the other types of the module, followed by any registered data
+    types in the order that they were registered.
+    """
+
+    def __init__(self):
+        dict.__init__(self)
+        self._modules = {}
+        self._order = []
+        for module, type_names in TYPE_MODULES.items():
+            base_names = [t for t in type_names if t in BASE_TYPE_UNITS]
+            for type_name in base_names + [t for t in type_names if t not in base_names]:
+                self._modules[type_name] = module
+                self._order.append(type_name)
+
+    def register(self, clss):
+        """Register a data type class that has already been imported."""
+        dict.__setitem__(self, clss.__name__, clss)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self._order + [key for key in dict.keys(self) if key not in self._modules]
+
+    def normalizing_types(self):
+        """Get a list of the data type classes that define their own normalized_type.
+
+        Only the modules of these data types are imported, making this faster
+        than looping through all of the values to find such types.
+        """
+        types = [self[key] for key in NORMALIZED_TYPES]
+        for key, clss in dict.items(self):
+            if key not in self._modules and \
+                    clss.__dict__.get('_normalized_type') is not None:
+                types.append(clss)
+        return types
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def copy(self):
+        return dict(self.items())
+
+    def __missing__(self, key):
+        module = importlib.import_module(
+            '.{}'.format(self._modules[key]), 'ladybug.datatype')
+        clss = getattr(module, key)
+        self.register(clss)
+        return clss
+
+    def __contains__(self, key):
+        return key in self._modules or dict.__contains__(self, key)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
 class _DataTypeEnumeration(object):
-    """Enumerates all data types, base types, and units."""
-    _TYPES = {}
-    _BASETYPES = {}
-    _UNITS = {}
+    """Enumerates all data types, base types, and units.
+
+    The data types of this package are enumerated from a static manifest such
+    that their modules are only imported when the classes are requested. Any
+    subclasses of DataTypeBase that have already been imported (eg. those of
+    extensions) are also included.
+    """
+    _TYPES = _DataTypeDict()
+    _BASETYPES = dict.fromkeys(BASE_TYPE_UNITS)
+    _UNITS = dict(BASE_TYPE_UNITS)
     _GENERICTYPE = None
 
     def __init__(self, import_modules=True):
         if import_modules:
             self._import_modules()
+        if self._GENERICTYPE is None:
+            from .generic import GenericType
+            _DataTypeEnumeration._GENERICTYPE = GenericType
 
         for clss in DataTypeBase.__subclasses__():
             if clss.__name__ != 'GenericType':
-                self._TYPES[clss.__name__] = clss
+                self._TYPES.register(clss)
                 self._BASETYPES[clss.__name__] = clss
                 self._UNITS[clss.__name__] = clss._units
                 for subclss in self._all_subclasses(clss):
-                    self._TYPES[subclss.__name__] = subclss
-            else:
-                self._GENERICTYPE = clss
+                    self._TYPES.register(subclss)
 
     @property
     def types(self):
@@ -413,20 +541,14 @@ class _DataTypeEnumeration(object):
     def types_dict(self):
         """A dictionary containing pointers to the classes of each data type.
 
-        The keys of this dictionary are the data types.
+        The keys of this dictionary are the data types. The module of each data
+        type is only imported once its class is requested from the dictionary.
         """
         return self._TYPES
 
     def _import_modules(self):
-        root_dir = os.path.dirname(__file__)
-        modules = os.listdir(os.path.dirname(__file__))
-        modules = [os.path.join(root_dir, mod) for mod in modules]
-        importable = ['.{}'.format(os.path.basename(f)[:-3]) for f in modules
-                      if os.path.isfile(f) and f.endswith('.py')
-                      and not f.endswith('__init__.py')
-                      and not f.endswith('base.py')]
-        for mod in importable:
-            importlib.import_module(mod, 'ladybug.datatype')
+        for module in TYPE_MODULES:
+            importlib.import_module('.{}'.format(module), 'ladybug.datatype')
 
     def _all_subclasses(self, clss):
         return set(clss.__subclasses__()).union(
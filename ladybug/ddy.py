@@ -7,6 +7,7 @@ from .futil import write_to_file
 
 import os
 import re
+import json
 import platform
 import codecs
 
@@ -70,30 +71,26 @@ class DDY(object):
             raise ValueError(
                 'DDY file does not have a .ddy extension.')
 
-        # check the python version and open the file
-        if platform.python_implementation() == 'IronPython':
-            ddywin = codecs.open(file_path, 'r')
-        else:
-            ddywin = codecs.open(file_path, 'r', encoding='utf-8', errors='ignore')
-
         # extract all location and design day definitions from the file
-        loc_p = re.compile(r"(Site:Location,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
-        dday_p = re.compile(r"(SizingPeriod:DesignDay,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
+        ddywin = cls._open_ddy_file(file_path)
         try:
-            ddytxt = ddywin.read()
-            loc_matches = loc_p.findall(ddytxt)
-            dday_matches = dday_p.findall(ddytxt)
+            loc_strs, dday_strs = [], []
+            for idf_string in cls._idf_objects(ddywin):
+                if idf_string.startswith('Site:Location,'):
+                    loc_strs.append(idf_string)
+                elif idf_string.startswith('SizingPeriod:DesignDay,'):
+                    dday_strs.append(idf_string)
         except Exception as e:  # the file likely doesn't exist
             import traceback
             raise Exception('{}\n{}'.format(e, traceback.format_exc()))
         else:
             # check to be sure a location and a design day was found
-            assert len(loc_matches) > 0, 'No location objects found in .ddy file.'
-            assert len(dday_matches) > 0, 'No design day objects found in .ddy file.'
+            assert len(loc_strs) > 0, 'No location objects found in .ddy file.'
+            assert len(dday_strs) > 0, 'No design day objects found in .ddy file.'
 
             # build design day and location objects
-            location = Location.from_idf(loc_matches[0][0])
-            ddays = [DesignDay.from_idf(match[0], location) for match in dday_matches]
+            location = Location.from_idf(loc_strs[0])
+            ddays = [DesignDay.from_idf(dday_str, location) for dday_str in dday_strs]
         finally:
             ddywin.close()
 
@@ -207,6 +204,36 @@ class DDY(object):
         """Get a copy of this object."""
         return self.__copy__()
 
+    @staticmethod
+    def _open_ddy_file(file_path):
+        """Open a .ddy file for reading using the encoding of the Python version."""
+        if platform.python_implementation() == 'IronPython':
+            return codecs.open(file_path, 'r')
+        return codecs.open(file_path, 'r', encoding='utf-8', errors='ignore')
+
+    @staticmethod
+    def _idf_objects(lines):
+        """Yield the text of each EnergyPlus object within lines of IDF text.
+
+        The IDF text is read in a single pass over the lines and the yielded
+        object strings have all comments removed and always end with a semicolon.
+
+        Args:
+            lines: An iterable of text lines, such as an open .ddy file.
+        """
+        obj_lines = []
+        for line in lines:
+            line = line.split('!', 1)[0].strip()
+            while line:
+                end = line.find(';')
+                if end == -1:
+                    obj_lines.append(line)
+                    break
+                obj_lines.append(line[:end + 1])
+                yield '\n'.join(obj_lines)
+                obj_lines = []
+                line = line[end + 1:].strip()
+
     def ToString(self):
         """Overwrite .NET ToString."""
         return self.__repr__()
@@ -250,3 +277,431 @@ class DDY(object):
         """DDY object representation."""
         return "DDY File - {} [# days: {}]".format(
             self.location.city, str(len(self._design_days)))
+
+
+class DDYIndex(object):
+    """An index of the locations and design days across a folder of .ddy files.
+
+    The index stores the location of each .ddy file along with the name, type and
+    key conditions of each of its design days. This allows design days to be
+    searched across a large library of .ddy files without parsing the files again
+    and full DesignDay objects are only built from the .ddy files once they are
+    requested. The index can be written to a JSON file and loaded with the
+    from_file method such that the folder only needs to be scanned once.
+
+    Args:
+        folder: Text for the path to a folder containing .ddy files.
+        recursive: Boolean to note whether .ddy files in all sub-folders of the
+            folder should also be indexed. (Default: False).
+
+    Properties:
+        * folder
+        * recursive
+        * file_paths
+        * locations
+        * design_days
+    """
+    __slots__ = ('_folder', '_recursive', '_files')
+
+    # the key properties of each design day that are stored in the index
+    DESIGN_DAY_FIELDS = (
+        'name', 'day_type', 'month', 'day', 'dry_bulb_max', 'dry_bulb_range',
+        'humidity_type', 'humidity_value', 'barometric_pressure', 'wind_speed',
+        'wind_direction', 'sky_model', 'percentile')
+    _WMO_PATTERN = re.compile(r'WMO=\s*(\d+)')
+    _PERCENT_PATTERN = re.compile(r'(\d*\.?\d+)%')
+
+    def __init__(self, folder, recursive=False):
+        assert os.path.isdir(folder), 'No folder was found at {}'.format(folder)
+        self._folder = os.path.abspath(folder)
+        self._recursive = bool(recursive)
+        self._files = {}
+        self.update()
+
+    @classmethod
+    def from_dict(cls, data, folder=None):
+        """Create a DDYIndex from a dictionary.
+
+        Args:
+            data: A python dictionary in the following format
+            folder: Optional text for the path to the folder of .ddy files, which
+                can be used if the folder has moved since the index was created.
+                If None, the folder in the dictionary will be used. (Default: None).
+
+        .. code-block:: python
+
+            {
+            "type": "DDYIndex",
+            "folder": "C:/ladybug/ddy",
+            "recursive": False,
+            "fields": [],  # the DESIGN_DAY_FIELDS of the design day lists
+            "files": {
+                "chicago.ddy": {
+                    "modified": 1579620000.0,  # time that the file was modified
+                    "station_id": "725300",  # WMO station ID or None
+                    "location": {},  # ladybug Location schema
+                    "design_days": [[]]  # list of lists for the design day fields
+                    }
+                }
+            }
+        """
+        assert data['type'] == 'DDYIndex', \
+            'Expected DDYIndex dictionary. Got {}.'.format(data['type'])
+        assert tuple(data['fields']) == cls.DESIGN_DAY_FIELDS, 'The design day ' \
+            'fields of the DDYIndex dictionary do not match those of this version.'
+        index = cls.__new__(cls)
+        index._folder = os.path.abspath(folder) if folder else data['folder']
+        index._recursive = data['recursive']
+        index._files = data['files']
+        return index
+
+    @classmethod
+    def from_file(cls, file_path, folder=None):
+        """Load a DDYIndex from a JSON file written with the write method.
+
+        Args:
+            file_path: Text for the path to a JSON file of a DDYIndex.
+            folder: Optional text for the path to the folder of .ddy files, which
+                can be used if the folder has moved since the index was created.
+                If None, the folder in the file will be used. (Default: None).
+        """
+        with open(file_path, 'r') as fp:
+            data = json.load(fp)
+        return cls.from_dict(data, folder)
+
+    @property
+    def folder(self):
+        """Get the path to the folder of .ddy files."""
+        return self._folder
+
+    @property
+    def recursive(self):
+        """Get a boolean for whether sub-folders of the folder are indexed."""
+        return self._recursive
+
+    @property
+    def file_paths(self):
+        """Get a tuple with the path to each indexed .ddy file."""
+        return tuple(os.path.join(self._folder, f) for f in sorted(self._files))
+
+    @property
+    def locations(self):
+        """Get a tuple with the Location of each indexed .ddy file."""
+        return tuple(Location.from_dict(self._files[f]['location'])
+                     for f in sorted(self._files))
+
+    @property
+    def design_days(self):
+        """Get a tuple of IndexedDesignDay for all design days in the index."""
+        return tuple(self.query())
+
+    def update(self):
+        """Update the index to match the current .ddy files in the folder.
+
+        Only the files that have been added or modified since they were last
+        indexed are parsed and the files that no longer exist are removed.
+
+        Returns:
+            The number of .ddy files that were (re)indexed.
+        """
+        indexed_count = 0
+        current_files = set()
+        for file_path in self._ddy_files():
+            rel_path = os.path.relpath(file_path, self._folder)
+            modified = os.path.getmtime(file_path)
+            current_files.add(rel_path)
+            entry = self._files.get(rel_path)
+            if entry is not None and entry['modified'] == modified:
+                continue
+            try:
+                entry = self._index_file(file_path)
+            except Exception:  # malformed ddy file that cannot be parsed
+                entry = None
+            if entry is None:  # not a valid ddy file
+                self._files.pop(rel_path, None)
+                continue
+            entry['modified'] = modified
+            self._files[rel_path] = entry
+            indexed_count += 1
+        for rel_path in set(self._files) - current_files:
+            del self._files[rel_path]
+        return indexed_count
+
+    def query(self, station=None, keyword=None, percentile=None, day_type=None):
+        """Get the design days in the index that meet a set of criteria.
+
+        Args:
+            station: Optional text for the station of the design days. This will
+                be matched against either the WMO station ID of the .ddy file or
+                any part of the location city (ignoring case). (Default: None).
+            keyword: Optional text that must be in the name of the design days
+                (eg. 'Condns DB'). (Default: None).
+            percentile: Optional number for the annual (or monthly) percentile of
+                the design days, as noted in their name (eg. 0.4 for the
+                '.4%' cooling design days). (Default: None).
+            day_type: Optional text for the type of the design days. Choose from
+                'SummerDesignDay' or 'WinterDesignDay'. (Default: None).
+
+        Returns:
+            A list of IndexedDesignDay for the design days meeting the criteria.
+            The DesignDay objects are only built from the .ddy files upon calling
+            the design_day property of each IndexedDesignDay.
+        """
+        station = station.lower() if station is not None else None
+        percentile = float(percentile) if percentile is not None else None
+        pct_i, name_i, type_i = 12, 0, 1
+        matches = []
+        for rel_path in sorted(self._files):
+            entry = self._files[rel_path]
+            if station is not None and station != entry['station_id'] and \
+                    station not in entry['location']['city'].lower():
+                continue
+            file_path = os.path.join(self._folder, rel_path)
+            for i, row in enumerate(entry['design_days']):
+                if keyword is not None and keyword not in row[name_i]:
+                    continue
+                if day_type is not None and day_type != row[type_i]:
+                    continue
+                if percentile is not None and (row[pct_i] is None or
+                                               abs(row[pct_i] - percentile) > 1e-6):
+                    continue
+                matches.append(
+                    IndexedDesignDay(file_path, i, entry['location'], row))
+        return matches
+
+    def to_dict(self):
+        """Get DDYIndex as a dictionary."""
+        return {
+            'type': 'DDYIndex',
+            'folder': self._folder,
+            'recursive': self._recursive,
+            'fields': list(self.DESIGN_DAY_FIELDS),
+            'files': self._files
+        }
+
+    def write(self, file_path):
+        """Write the DDYIndex to a JSON file, which can be loaded with from_file.
+
+        Args:
+            file_path: Text for the full path to where the JSON file will be written.
+
+        Returns:
+            The path to the written file.
+        """
+        with open(file_path, 'w') as fp:
+            json.dump(self.to_dict(), fp)
+        return file_path
+
+    def _ddy_files(self):
+        """Get a list of paths to all .ddy files in the folder."""
+        if not self._recursive:
+            return [os.path.join(self._folder, f) for f in os.listdir(self._folder)
+                    if f.lower().endswith('.ddy')
+                    and os.path.isfile(os.path.join(self._folder, f))]
+        return [os.path.join(root, f) for root, _, files in os.walk(self._folder)
+                for f in files if f.lower().endswith('.ddy')]
+
+    @staticmethod
+    def _index_file(file_path):
+        """Get a dictionary of the location and design days of a .ddy file.
+
+        None will be returned if the file lacks a location or a design day.
+        """
+        ddywin = DDY._open_ddy_file(file_path)
+        try:
+            ddytxt = ddywin.read()
+        finally:
+            ddywin.close()
+
+        location, design_days = None, []
+        for idf_string in DDY._idf_objects(ddytxt.splitlines()):
+            if idf_string.startswith('SizingPeriod:DesignDay,'):
+                design_days.append(DDYIndex._design_day_fields(idf_string))
+            elif location is None and idf_string.startswith('Site:Location,'):
+                location = Location.from_idf(idf_string).to_dict()
+        if location is None or len(design_days) == 0:
+            return None
+
+        wmo = DDYIndex._WMO_PATTERN.search(ddytxt)
+        return {
+            'station_id': wmo.group(1) if wmo is not None else None,
+            'location': location,
+            'design_days': design_days
+        }
+
+    @staticmethod
+    def _design_day_fields(idf_string):
+        """Get a list of the DESIGN_DAY_FIELDS from a SizingPeriod:DesignDay string."""
+        dd_props = DesignDay._idf_properties(DesignDay._idf_fields(idf_string))
+        pct = DDYIndex._PERCENT_PATTERN.search(dd_props[0])
+        return list(dd_props) + [float(pct.group(1)) if pct is not None else None]
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self._files)
+
+    def __repr__(self):
+        """DDYIndex object representation."""
+        return 'DDY Index - {} [# files: {}]'.format(self._folder, len(self._files))
+
+
+class IndexedDesignDay(object):
+    """A design day of a DDYIndex, which only builds the full DesignDay on request.
+
+    Args:
+        file_path: Text for the path to the .ddy file containing the design day.
+        index: An integer for the index of the design day within the .ddy file.
+        location: A dictionary of the Location of the .ddy file.
+        fields: A list of the DDYIndex.DESIGN_DAY_FIELDS for the design day.
+
+    Properties:
+        * file_path
+        * index
+        * location
+        * name
+        * day_type
+        * month
+        * day
+        * dry_bulb_max
+        * dry_bulb_range
+        * humidity_type
+        * humidity_value
+        * barometric_pressure
+        * wind_speed
+        * wind_direction
+        * sky_model
+        * percentile
+        * design_day
+    """
+    __slots__ = ('_file_path', '_index', '_location', '_fields', '_design_day')
+
+    def __init__(self, file_path, index, location, fields):
+        self._file_path = file_path
+        self._index = index
+        self._location = location
+        self._fields = fields
+        self._design_day = None
+
+    @property
+    def file_path(self):
+        """Get the path to the .ddy file containing the design day."""
+        return self._file_path
+
+    @property
+    def index(self):
+        """Get the index of the design day within the .ddy file."""
+        return self._index
+
+    @property
+    def location(self):
+        """Get the Location of the .ddy file."""
+        return Location.from_dict(self._location)
+
+    @property
+    def name(self):
+        """Get the name of the design day."""
+        return self._fields[0]
+
+    @property
+    def day_type(self):
+        """Get the type of the design day (eg. 'SummerDesignDay')."""
+        return self._fields[1]
+
+    @property
+    def month(self):
+        """Get an integer for the month of the design day."""
+        return self._fields[2]
+
+    @property
+    def day(self):
+        """Get an integer for the day of the month of the design day."""
+        return self._fields[3]
+
+    @property
+    def dry_bulb_max(self):
+        """Get the maximum dry bulb temperature of the design day in C."""
+        return self._fields[4]
+
+    @property
+    def dry_bulb_range(self):
+        """Get the dry bulb temperature range of the design day in C."""
+        return self._fields[5]
+
+    @property
+    def humidity_type(self):
+        """Get the type of humidity condition (eg. 'Wetbulb', 'Dewpoint')."""
+        return self._fields[6]
+
+    @property
+    def humidity_value(self):
+        """Get the value of the humidity condition."""
+        return self._fields[7]
+
+    @property
+    def barometric_pressure(self):
+        """Get the barometric pressure of the design day in Pa."""
+        return self._fields[8]
+
+    @property
+    def wind_speed(self):
+        """Get the wind speed of the design day in m/s."""
+        return self._fields[9]
+
+    @property
+    def wind_direction(self):
+        """Get the wind direction of the design day in degrees."""
+        return self._fields[10]
+
+    @property
+    def sky_model(self):
+        """Get the name of the sky model of the design day (eg. 'ASHRAEClearSky')."""
+        return self._fields[11]
+
+    @property
+    def percentile(self):
+        """Get the percentile in the name of the design day or None if it has none."""
+        return self._fields[12]
+
+    @property
+    def design_day(self):
+        """Get the full DesignDay object, which is loaded from the .ddy file on request.
+        """
+        if self._design_day is None:
+            self._design_day = self._load_design_day()
+        return self._design_day
+
+    def _load_design_day(self):
+        """Load the DesignDay from the .ddy file without building the other days."""
+        assert os.path.isfile(self._file_path), \
+            'Cannot find a .ddy file at {}'.format(self._file_path)
+        dday_count = 0
+        ddywin = DDY._open_ddy_file(self._file_path)
+        try:
+            for idf_string in DDY._idf_objects(ddywin):
+                if idf_string.startswith('SizingPeriod:DesignDay,'):
+                    if dday_count == self._index:
+                        design_day = DesignDay.from_idf(idf_string, self.location)
+                        break
+                    dday_count += 1
+            else:
+                design_day = None
+        finally:
+            ddywin.close()
+        if design_day is None or design_day.name != self.name:
+            raise ValueError(
+                'The design day "{}" was not found in {}.\nThe DDYIndex should be '
+                'updated to match the current .ddy files.'.format(
+                    self.name, self._file_path))
+        return design_day
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """IndexedDesignDay object representation."""
+        return 'Indexed Design Day: {} [{}]'.format(
+            self.name, os.path.basename(self._file_path))
@@ -167,61 +167,73 @@ class DesignDay(object):
                 over the course of the design day.
         """
         # format the object into a list of properties
-        idf_string = idf_string.strip()
-        assert idf_string.startswith('SizingPeriod:DesignDay'), 'Expected SizingPeriod' \
-            ':DesignDay but received a different object: {}'.format(idf_string)
-        idf_string = idf_string.replace(';', ',')
-        idf_string = re.sub(r'!.*\n', '', idf_string)
-        ep_fields = [e_str.strip() for e_str in idf_string.split(',')]
+        ep_fields = cls._idf_fields(idf_string)
+        name, day_type, month, day, db_max, db_range, h_type, h_val, pressure, \
+            wind_speed, wind_dir, sky_model = cls._idf_properties(ep_fields)
 
-        # extract primary properties
-        name = ep_fields[1]
-        day_type = ep_fields[4]
-
-        # extract dry bulb temperatures
+        # extract dry bulb and humidity conditions
         dry_bulb_condition = DryBulbCondition(
-            float(ep_fields[5]), float(ep_fields[6]), ep_fields[7], ep_fields[8])
-
-        # extract humidity conditions
-        h_type = ep_fields[9]
-        h_val = 0 if ep_fields[10] == '' else float(ep_fields[10])
+            db_max, db_range, ep_fields[7], ep_fields[8])
         rain = True if len(ep_fields) > 18 and ep_fields[18].lower() == 'yes' else False
         snow = True if len(ep_fields) > 19 and ep_fields[19].lower() == 'yes' else False
-        if h_type == 'HumidityRatio':
-            h_val = float(ep_fields[12])
-        elif h_type == 'Enthalpy':
-            h_val = float(ep_fields[13])
         humidity_condition = HumidityCondition(
-            h_type, h_val, float(ep_fields[15]), rain, snow, ep_fields[11])
+            h_type, h_val, pressure, rain, snow, ep_fields[11])
 
         # extract wind conditions
-        wind_condition = WindCondition(float(ep_fields[16]), float(ep_fields[17]))
+        wind_condition = WindCondition(wind_speed, wind_dir)
 
         # extract the sky conditions
-        date_obj = Date(int(ep_fields[2]), int(ep_fields[3]))
+        date_obj = Date(month, day)
         dl_save = True if len(ep_fields) > 20 and ep_fields[20].lower() == 'yes' \
             else False
-        if len(ep_fields) > 21:
-            sky_model = ep_fields[21]
-            if sky_model == 'ASHRAEClearSky':
-                sky_clr = float(ep_fields[26]) if len(ep_fields) > 26 else 0
-                sky_condition = ASHRAEClearSky(date_obj, sky_clr, dl_save)
-            elif sky_model in ('ASHRAETau', 'ASHRAETau2017'):
-                use_2017 = True if sky_model.endswith('2017') else False
-                t_b = float(ep_fields[24]) if len(ep_fields) > 24 else 0
-                t_d = float(ep_fields[25]) if len(ep_fields) > 25 else 0
-                sky_condition = ASHRAETau(date_obj, t_b, t_d, use_2017, dl_save)
-            else:
-                sky_condition = _SkyCondition(date_obj, dl_save)
-            if sky_model == 'Schedule':
-                sky_condition.beam_schedule = ep_fields[22]
-                sky_condition.diffuse_schedule = ep_fields[23]
-        else:  # default of no sky condition
-            sky_condition = ASHRAEClearSky(date_obj, 0, dl_save)
+        if sky_model == 'ASHRAEClearSky':
+            sky_clr = float(ep_fields[26]) if len(ep_fields) > 26 else 0
+            sky_condition = ASHRAEClearSky(date_obj, sky_clr, dl_save)
+        elif sky_model in ('ASHRAETau', 'ASHRAETau2017'):
+            use_2017 = True if sky_model.endswith('2017') else False
+            t_b = float(ep_fields[24]) if len(ep_fields) > 24 else 0
+            t_d = float(ep_fields[25]) if len(ep_fields) > 25 else 0
+            sky_condition = ASHRAETau(date_obj, t_b, t_d, use_2017, dl_save)
+        else:
+            sky_condition = _SkyCondition(date_obj, dl_save)
+        if sky_model == 'Schedule':
+            sky_condition.beam_schedule = ep_fields[22]
+            sky_condition.diffuse_schedule = ep_fields[23]
 
         return cls(name, day_type, location, dry_bulb_condition,
                    humidity_condition, wind_condition, sky_condition)
 
+    @staticmethod
+    def _idf_fields(idf_string):
+        """Get a list of the fields of a SizingPeriod:DesignDay IDF string."""
+        idf_string = idf_string.strip()
+        assert idf_string.startswith('SizingPeriod:DesignDay'), 'Expected SizingPeriod' \
+            ':DesignDay but received a different object: {}'.format(idf_string)
+        idf_string = idf_string.replace(';', ',')
+        idf_string = re.sub(r'!.*\n', '', idf_string)
+        return [e_str.strip() for e_str in idf_string.split(',')]
+
+    @staticmethod
+    def _idf_properties(ep_fields):
+        """Get the key properties of a design day from a list of its IDF fields.
+
+        Returns:
+            A tuple with the name, day type, month, day, maximum dry bulb, dry bulb
+            range, humidity type, humidity value, barometric pressure, wind speed,
+            wind direction and sky model of the design day.
+        """
+        h_type = ep_fields[9]
+        h_val = 0 if ep_fields[10] == '' else float(ep_fields[10])
+        if h_type == 'HumidityRatio':
+            h_val = float(ep_fields[12])
+        elif h_type == 'Enthalpy':
+            h_val = float(ep_fields[13])
+        sky_model = ep_fields[21] if len(ep_fields) > 21 else 'ASHRAEClearSky'
+        return (ep_fields[1], ep_fields[4], int(ep_fields[2]), int(ep_fields[3]),
+                float(ep_fields[5]), float(ep_fields[6]), h_type, h_val,
+                float(ep_fields[15]), float(ep_fields[16]), float(ep_fields[17]),
+                sky_model)
+
     @classmethod
     def from_design_day_properties(cls, name, day_type, location, date,
                                    dry_bulb_max, dry_bulb_range, humidity_type,
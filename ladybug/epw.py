@@ -3,6 +3,7 @@ from __future__ import division
 
 import os
 import math
+import itertools
 
 from ladybug_geometry.geometry2d.pointvector import Vector2D
 
@@ -14,19 +15,19 @@ from .datatype import angle, distance, energyflux, energyintensity, generic, \
     illuminance, luminance, fraction, pressure, speed, temperature
 from .designday import DesignDay
 from .ddy import DDY
-from .futil import write_to_file
+from .futil import write_to_file, preparedir
 from .header import Header
 from .location import Location
 from .climatezone import ashrae_climate_zone
 from .skymodel import calc_sky_temperature
 from .psychrometrics import rel_humid_from_db_dpt, wet_bulb_from_db_rh
 
-readmode = 'rb'
+readmode, writemode = 'rb', 'wb'
 try:
     from itertools import izip as zip  # python 2
 except ImportError:
     xrange = range  # python 3
-    readmode = 'r'
+    readmode, writemode = 'r', 'w'
 
 
 class EPW(object):
@@ -1730,31 +1731,19 @@ climate-calculations.html#energyplus-sky-temperature-calculation
         if not file_path.lower().endswith('.wea'):
             file_path += '.wea'
 
-        originally_ip = False
-        if self.is_ip:
-            self.convert_to_si()
-            originally_ip = True
+        # get the radiation values in SI units without converting the EPW
+        dir_rad = self._si_values(self.direct_normal_radiation)
+        dif_rad = self._si_values(self.diffuse_horizontal_radiation)
+        datetimes = self.direct_normal_radiation.datetimes
 
-        # write header
+        # write header and values
         lines = [self._get_wea_header()]
-        # write values
-        datetimes = self.direct_normal_radiation.datetimes
         for hoy in hoys:
-            dir_rad = self.direct_normal_radiation[hoy]
-            dif_rad = self.diffuse_horizontal_radiation[hoy]
-            line = "%d %d %.3f %d %d\n" \
-                % (datetimes[hoy].month,
-                   datetimes[hoy].day,
-                   datetimes[hoy].hour + 0.5,
-                   dir_rad, dif_rad)
-            lines.append(line)
-
+            dt = datetimes[hoy]
+            lines.append('%d %d %.3f %d %d\n' % (
+                dt.month, dt.day, dt.hour + 0.5, dir_rad[hoy], dif_rad[hoy]))
         file_data = ''.join(lines)
         write_to_file(file_path, file_data, True)
-
-        if originally_ip:
-            self.convert_to_ip()
-
         return file_path
 
     def to_mos(self, file_path):
@@ -1812,11 +1801,10 @@ climate-calculations.html#energyplus-sky-temperature-calculation
             file_contents.append('{}\n'.format(com_str))
 
         # append all of the data to the file contents
-        time_sec = [float(h * 3660) for h in range(len(self.dry_bulb_temperature))]
-        for i, line in enumerate(zip(*self._data[6:])):
-            data_line = (time_sec[i],) + line
-            data_str = '	'.join(str(v) for v in data_line) + '\n'
-            file_contents.append(data_str)
+        time_sec = [str(float(h * 3660)) for h in range(len(self.dry_bulb_temperature))]
+        columns = [time_sec] + [self._str_column(coll._values) for coll in self._data[6:]]
+        columns[-1] = [v + '\n' for v in columns[-1]]
+        file_contents.extend('	'.join(line) for line in zip(*columns))
 
         # write the contents to a file
         if not file_path.endswith('.mos'):
@@ -1833,6 +1821,69 @@ climate-calculations.html#energyplus-sky-temperature-calculation
             "site_elevation %.1f\n" % self.location.elevation + \
             "weather_data_file_units 1\n"
 
+    def _file_lines(self):
+        """Get an iterator over the lines of the EPW file contents.
+
+        The lines are always written in SI units and the data collections of the
+        EPW are not mutated in the process, even if the EPW is in IP units. All
+        checks of the data are run before this method returns such that any
+        errors are raised before the lines are consumed.
+        """
+        # load data if it's not loaded
+        if not self.is_data_loaded:
+            self._import_data()
+
+        # format each field as a column of text, which all are a full year long
+        hour_count = 8784 if self.is_leap_year else 8760
+        columns = []
+        for coll in self._data[:self._num_of_fields]:
+            values = self._si_values(coll)
+            if len(values) < hour_count:
+                raise ValueError('Data length is not for a full year and cannot '
+                                 'be saved as an EPW file.')
+            if coll.header.data_type.point_in_time:
+                # the first value is at 1AM and so the first item goes to the end
+                values = values[1:hour_count] + values[:1]
+            columns.append(self._str_column(values[:hour_count]))
+        columns[-1] = [v + '\n' for v in columns[-1]]
+
+        # chain the header with the lines of data, which are joined as they are used
+        return itertools.chain(self.header, (','.join(line) for line in zip(*columns)))
+
+    def _si_values(self, data_collection):
+        """Get the values of one of this EPW's data collections in SI units.
+
+        The data collection is not mutated and the returned list must not be
+        edited since it may be the values of the data collection itself.
+        """
+        if not self._is_ip:
+            return data_collection._values
+        header = data_collection.header
+        return header.data_type.to_si(data_collection._values, header.unit)[0]
+
+    @staticmethod
+    def _str_column(values):
+        """Get a list of text for a list of values, formatting repeated values once.
+
+        EPW fields often repeat the same value for many hours (eg. 0 radiation at
+        night or missing values) and so the text of each unique value is cached.
+        The type of each value is checked since equal values like 1 and 1.0 have
+        different text and zeros are cached with their sign since 0.0 == -0.0.
+        """
+        formatted, column = {}, []
+        for val in values:
+            try:
+                key = val if val else (val, math.copysign(1, val))
+                val_type, val_str = formatted[key]
+                column.append(val_str if val.__class__ is val_type else str(val))
+            except KeyError:
+                val_str = str(val)
+                formatted[key] = (val.__class__, val_str)
+                column.append(val_str)
+            except TypeError:  # unhashable value
+                column.append(str(val))
+        return column
+
     def to_dict(self):
         """Convert the EPW to a dictionary."""
         # load data if it's not loaded
@@ -1871,56 +1922,26 @@ climate-calculations.html#energyplus-sky-temperature-calculation
 
     def to_file_string(self):
         """Get a text string for the entirety of the EPW file contents."""
-        # load data if it's  not loaded convert to SI if it is in IP
-        if not self.is_data_loaded:
-            self._import_data()
-        originally_ip = False
-        if self.is_ip:
-            self.convert_to_si()
-            originally_ip = True
-
-        # write the file
-        lines = self.header
-        try:
-            # if the first value is at 1AM, move first item to end position
-            for field in xrange(0, self._num_of_fields):
-                point_in_time = self._data[field].header.data_type.point_in_time
-                if point_in_time:
-                    first_hour = self._data[field]._values.pop(0)
-                    self._data[field]._values.append(first_hour)
-
-            annual_a_per = AnalysisPeriod(is_leap_year=self.is_leap_year)
-            for hour in xrange(0, len(annual_a_per.datetimes)):
-                line = []
-                for field in xrange(0, self._num_of_fields):
-                    line.append(str(self._data[field]._values[hour]))
-                lines.append(",".join(line) + "\n")
-        except IndexError:
-            length_error_msg = 'Data length is not for a full year and cannot be ' + \
-                'saved as an EPW file.'
-            raise ValueError(length_error_msg)
-        finally:  # move last item to start position for fields on the hour
-            for field in xrange(0, self._num_of_fields):
-                point_in_time = self._data[field].header.data_type.point_in_time
-                if point_in_time:
-                    last_hour = self._data[field]._values.pop()
-                    self._data[field]._values.insert(0, last_hour)
-
-        if originally_ip:  # put back the object as it was
-            self.convert_to_ip()
-        return ''.join(lines)
+        return ''.join(self._file_lines())
 
     def write(self, file_path):
         """Write EPW object as an .epw file and return the file path.
 
+        The lines of the file are streamed to the file as they are formatted
+        such that the full text of the file is never held in memory.
+
         Args:
             file_path: Text for the full path to where the .epw file will be written.
         """
         if not file_path.lower().endswith('.epw'):
             file_path += '.epw'
-        file_data = self.to_file_string()
-        write_to_file(file_path, file_data, True)
-        return file_data
+        lines = self._file_lines()  # check and format the data before opening file
+        folder = os.path.dirname(file_path)
+        if folder and not os.path.isdir(folder):
+            preparedir(folder)
+        with open(file_path, writemode) as outf:
+            outf.writelines(lines)
+        return file_path
 
     def save(self, file_path):
         """Write EPW object as a file.
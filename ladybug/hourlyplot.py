@@ -1,6 +1,7 @@
 # coding=utf-8
 """Module for visualization of hourly data collections."""
 from __future__ import division
+from collections import OrderedDict
 
 from .analysisperiod import AnalysisPeriod
 from .datacollection import HourlyContinuousCollection, HourlyDiscontinuousCollection
@@ -17,6 +18,10 @@ from ladybug_geometry.geometry3d.plane import Plane
 from ladybug_geometry.geometry3d.polyline import Polyline3D
 from ladybug_geometry.geometry3d.mesh import Mesh3D
 
+import sys
+if (sys.version_info >= (3, 0)):
+    xrange = range
+
 
 class HourlyPlot(object):
     """Object for visualization of hourly data collections.
@@ -72,10 +77,15 @@ class HourlyPlot(object):
     __slots__ = (
         '_data_collection', '_base_point', '_x_dim', '_y_dim', '_z_dim',
         '_num_y', '_num_x', '_container', '_hour_points', '_hour_text', '_hour_text_24',
-        '_month_points', '_month_label_points', '_month_text', '_reverse_y')
+        '_month_points', '_month_label_points', '_month_text', '_reverse_y',
+        '_face_layout_cache')
 
     # editing HOUR_LABELS will change the labels produced for the entire chart
     HOUR_LABELS = (0, 6, 12, 18, 24)
+    # maximum number of face layouts that are kept in the cache below
+    FACE_LAYOUT_CACHE_SIZE = 16
+    # face layouts of continuous collections keyed by (analysis period, reverse_y)
+    _FACE_LAYOUTS = OrderedDict()
 
     def __init__(self, data_collection, legend_parameters=None, base_point=Point3D(),
                  x_dim=1, y_dim=4, z_dim=0, reverse_y=False):
@@ -108,6 +118,7 @@ class HourlyPlot(object):
         self._month_points = None
         self._month_label_points = None
         self._month_text = None
+        self._face_layout_cache = None
 
         # create the graphic container from the inputs
         a_per = self.analysis_period
@@ -357,22 +368,10 @@ class HourlyPlot(object):
 
         These will align correctly with the mesh faces, even when reverse_y is True.
         """
-        if self._reverse_y:  # reverse each day of values before returning it
-            rev_values = []
-            dts = self._data_collection.datetimes
-            day_values = []
-            current_day = dts[0].day
-            for dat_t, col in zip(dts, self._data_collection.values):
-                if dat_t.day == current_day:
-                    day_values.append(col)
-                else:
-                    day_values.reverse()
-                    rev_values.extend(day_values)
-                    current_day = dat_t.day
-                    day_values = [col]
-            day_values.reverse()
-            rev_values.extend(day_values)
-            return rev_values
+        value_order = self._face_layout()[0]
+        if value_order is not None:  # reorder the values to align with the faces
+            values = self._data_collection.values
+            return [values[i] for i in value_order]
         return self._data_collection.values
 
     @property
@@ -381,22 +380,10 @@ class HourlyPlot(object):
 
         These will align correctly with the mesh faces, even when reverse_y is True.
         """
-        if self._reverse_y:  # reverse each day of colors before returning it
-            rev_colors = []
-            dts = self._data_collection.datetimes
-            day_colors = []
-            current_day = dts[0].day
-            for dat_t, col in zip(dts, self._container.value_colors):
-                if dat_t.day == current_day:
-                    day_colors.append(col)
-                else:
-                    day_colors.reverse()
-                    rev_colors.extend(day_colors)
-                    current_day = dat_t.day
-                    day_colors = [col]
-            day_colors.reverse()
-            rev_colors.extend(day_colors)
-            return rev_colors
+        value_order = self._face_layout()[0]
+        if value_order is not None:  # reorder the colors to align with the faces
+            colors = self._container.value_colors
+            return [colors[i] for i in value_order]
         return self._container.value_colors
 
     def custom_hour_lines2d(self, hour_labels):
@@ -464,32 +451,9 @@ class HourlyPlot(object):
             self.base_point, self._num_x, self._num_y, self.x_dim, self.y_dim)
 
         # remove any faces in the base mesh that do not represent the data
-        if not isinstance(self.data_collection, HourlyContinuousCollection):
-            # get a pattern of booleans for whether mesh faces should be included
-            data_coll_moys = [dt.moy for dt in self.data_collection.datetimes]
-            data_coll_moys.append(527100)  # extra value for the end of the list
-            found_i = 0
-            mesh_pattern = []
-            s_aper = self.analysis_period
-            m_aper = s_aper if s_aper.st_hour <= s_aper.end_hour else \
-                AnalysisPeriod(s_aper.st_month, s_aper.st_day, 0, s_aper.end_month,
-                               s_aper.end_day, 23, s_aper.timestep, s_aper.is_leap_year)
-            for moy in m_aper.moys:
-                if moy == data_coll_moys[found_i]:
-                    mesh_pattern.append(True)
-                    found_i += 1
-                else:
-                    mesh_pattern.append(False)
-            if self._reverse_y:
-                hr_diff = abs(m_aper.end_hour - m_aper.st_hour)
-                t_step = m_aper.timestep
-                t_diff = t_step * hr_diff + 1 if t_step == 1 or hr_diff != 23 else \
-                    t_step * (hr_diff + 1)
-                mesh_pat_rev = []
-                for i in range(0, len(mesh_pattern), t_diff):
-                    mesh_pat_rev.extend(reversed(mesh_pattern[i:i + t_diff]))
-                mesh_pattern = mesh_pat_rev
-            _colored_mesh2d = _colored_mesh2d.remove_faces_only(mesh_pattern)
+        face_pattern = self._face_layout()[1]
+        if face_pattern is not None:
+            _colored_mesh2d = _colored_mesh2d.remove_faces_only(face_pattern)
 
         # assign the colors to the mesh
         _colored_mesh2d.colors = self.colors
@@ -504,6 +468,76 @@ class HourlyPlot(object):
                 self.data_collection.values, (0, self.z_dim))
         return _colored_mesh3d
 
+    def _face_layout(self):
+        """Get the indices that align the data collection values with the mesh faces.
+
+        The layout is computed once for each plot. Layouts of continuous collections
+        are also shared between all plots with the same analysis_period and reverse_y.
+
+        Returns:
+            A tuple with two items.
+
+            -   value_order: A tuple with the index of the data collection value
+                that belongs to each of the mesh faces. None if the values are
+                already in the order of the mesh faces.
+
+            -   face_pattern: A tuple of booleans for whether each face of the full
+                mesh grid represents the data. None if all faces represent the data.
+        """
+        if self._face_layout_cache is not None:
+            return self._face_layout_cache
+        num_y, num_faces = self._num_y, self._num_x * self._num_y
+        coll = self._data_collection
+        continuous = isinstance(coll, HourlyContinuousCollection) and \
+            len(coll.values) == num_faces
+        key = (self.analysis_period, self._reverse_y)
+        if continuous and key in self._FACE_LAYOUTS:
+            # move the recently-used layout to the end of the cache
+            self._face_layout_cache = self._FACE_LAYOUTS.pop(key)
+            self._FACE_LAYOUTS[key] = self._face_layout_cache
+            return self._face_layout_cache
+
+        # get the index of the grid face that each of the values belongs to
+        grid_i = xrange(num_faces) if continuous else self._grid_indices()
+        if self._reverse_y:  # flip the position of each face within its day
+            top = num_y - 1
+            grid_i = [i + top - 2 * (i % num_y) for i in grid_i]
+            sorted_i = sorted(xrange(len(grid_i)), key=grid_i.__getitem__)
+            value_order = tuple(sorted_i)
+            grid_i = [grid_i[i] for i in sorted_i]
+        else:
+            value_order = None
+        face_pattern = None
+        if not continuous:
+            face_pattern = [False] * num_faces
+            for i in grid_i:
+                face_pattern[i] = True
+            face_pattern = tuple(face_pattern)
+
+        self._face_layout_cache = (value_order, face_pattern)
+        if continuous:
+            self._FACE_LAYOUTS[key] = self._face_layout_cache
+            while len(self._FACE_LAYOUTS) > self.FACE_LAYOUT_CACHE_SIZE:
+                self._FACE_LAYOUTS.popitem(last=False)
+        return self._face_layout_cache
+
+    def _grid_indices(self):
+        """Get a list with the index of the mesh grid face for each datetime."""
+        a_per = self.analysis_period
+        t_step, num_y = a_per.timestep, self._num_y
+        st_hr = a_per.st_hour if a_per.st_hour <= a_per.end_hour else 0
+        dpm = AnalysisPeriod.NUMOFDAYSEACHMONTHLEAP if a_per.is_leap_year \
+            else AnalysisPeriod.NUMOFDAYSEACHMONTH
+        month_doys = [0]
+        for days in dpm:
+            month_doys.append(month_doys[-1] + days)
+        st_doy = month_doys[a_per.st_month - 1] + a_per.st_day
+        return [
+            ((month_doys[dt.month - 1] + dt.day - st_doy) % month_doys[-1]) * num_y +
+            (dt.hour - st_hr) * t_step + (dt.minute * t_step) // 60
+            for dt in self._data_collection.datetimes
+        ]
+
     def _compute_static_hour_line_pts(self):
         """Compute the points for the hour lines and labels."""
         self._hour_points, self._hour_text, self._hour_text_24 = \
@@ -182,7 +182,15 @@ class Legend(object):
     def value_colors(self):
         """A List of colors associated with the assigned values."""
         _color_range = self.color_range
-        return tuple(_color_range.color(val) for val in self.values)
+        _val_colors = {}  # data sets often repeat values so only compute each once
+        _colors = []
+        for val in self.values:
+            try:
+                _colors.append(_val_colors[val])
+            except KeyError:
+                _val_colors[val] = _col = _color_range.color(val)
+                _colors.append(_col)
+        return tuple(_colors)
 
     @property
     def title(self):
@@ -1,6 +1,7 @@
 # coding=utf-8
 """Module for visualization of data collections in monthly intervals."""
 from __future__ import division
+from collections import OrderedDict
 
 from .datatype import UNITS, TYPESDICT
 from .datatype.generic import GenericType
@@ -84,32 +85,18 @@ class MonthlyChart(object):
                  '_stack', '_percentile', '_time_interval', '_grouped_data',
                  '_units', '_data_types', '_color_map', '_minimums', '_maximums',
                  '_seg_count', '_container', '_analysis_period', '_months_int',
-                 '_y_axis_points', '_month_points', '_month_label_points',
-                 '_month_text', '_time_points')
+                 '_fixed_minimum', '_fixed_maximum', '_aggregates')
 
     # editing HOUR_LABELS will change the labels produced for the entire chart
     HOUR_LABELS = (0, 6, 12, 18)
+    # maximum number of chart frames that are kept in the cache below
+    FRAME_CACHE_SIZE = 64
+    # static frame geometry keyed by the dimensions and months of the chart
+    _FRAMES = OrderedDict()
 
     def __init__(self, data_collections, legend_parameters=None, base_point=Point2D(),
                  x_dim=10, y_dim=40, stack=False, percentile=34):
         """Initialize monthly chart."""
-        # check the input data collections
-        if not isinstance(data_collections, list):
-            try:
-                data_collections = list(data_collections)
-            except TypeError:
-                raise TypeError('MonthlyChart data_collections must be an iterable. '
-                                'Got {}.'.format(type(data_collections)))
-        assert len(data_collections) >= 1, \
-            'MonthlyChart must have at least one data collection.'
-        for i, data in enumerate(data_collections):
-            assert isinstance(data, BaseCollection), 'MonthlyChart data_collections' \
-                ' must contain data collections. Got {}.'.format(type(data))
-            if not data.validated_a_period:
-                data = data.validate_analysis_period()
-            data_collections[i] = data.to_immutable()
-        self._time_interval = self._check_time_interval(data_collections)
-
         # check the input percentile and base point
         try:
             percentile = float(percentile)
@@ -122,66 +109,30 @@ class MonthlyChart(object):
             'MonthlyChart base point. Got {}.'.format(type(base_point))
 
         # assign the inputs as properties of this data collection
-        self._data_collections = data_collections
         self._base_point = base_point
         self._x_dim = self._check_dim(x_dim, 'x_dim')
         self._y_dim = self._check_dim(y_dim, 'y_dim')
         self._stack = bool(stack)
         self._percentile = percentile
+        self._aggregates = {}
 
-        # set properties to None that will be computed later
-        self._y_axis_points = None
-        self._month_points = None
-        self._month_label_points = None
-        self._month_text = None
-        self._time_points = None
-
-        # group the input data by data type and figure out the max + min of the Y-axes
-        self._grouped_data, self._data_types, self._units, self._color_map = \
-            self._group_data_by_units()
-        self._compute_maximums_minimums()
+        # extract any Y-axis properties that are set by the legend parameters
         self._seg_count = 11
+        self._fixed_minimum, self._fixed_maximum = None, None
         if legend_parameters is not None:
             legend_parameters = legend_parameters.duplicate()  # avoid editing original
             if legend_parameters.min is not None:
-                self._minimums[0] = legend_parameters.min
+                self._fixed_minimum = legend_parameters.min
                 legend_parameters.min = None
             if legend_parameters.max is not None:
-                self._maximums[0] = legend_parameters.max
+                self._fixed_maximum = legend_parameters.max
                 legend_parameters.max = None
             if not legend_parameters.is_segment_count_default:
                 self._seg_count = legend_parameters.segment_count
                 legend_parameters.segment_count = None
 
-        # check the analysis periods of the data collections
-        self._analysis_period = self._data_collections[0].header.analysis_period
-        self._months_int = self._analysis_period.months_int
-        # TODO: consider supporting different periods by analyzing their overlap
-        apers = [data.header.analysis_period for data in self._data_collections[1:]]
-        assert all([aper == self._analysis_period for aper in apers]), \
-            'All MonthlyChart data collections must have the same analysis period.'
-
-        # create the graphic container
-        min_pt = Point3D(base_point.x, base_point.y)
-        max_pt = Point3D(base_point.x + (x_dim * len(self._months_int)),
-                         base_point.y + y_dim)
-        mock_values = list(range(len(self._data_collections)))
-        mock_descr = {}
-        for i, data_c in enumerate(self._data_collections):
-            data_t_str = data_c.header.metadata['type'] if 'type' in \
-                data_c.header.metadata else str(data_c.header.data_type)
-            mock_descr[i] = data_t_str
-        mock_type = GenericType('Monthly Chart Data Streams', '', unit_descr=mock_descr)
-        self._container = GraphicContainer(
-            mock_values, min_pt, max_pt, legend_parameters, mock_type, '')
-
-        # re-make the container if there is a second axis
-        if len(self._data_types) > 1:  # there's a second axis; move max point
-            offset = self.legend_parameters.text_height * \
-                (len(self.y_axis_labels2[-1]) + 4)
-            max_pt = Point3D(max_pt.x + offset, max_pt.y)
-            self._container = GraphicContainer(
-                mock_values, min_pt, max_pt, legend_parameters, mock_type, '')
+        # assign the data collections and create the graphic container
+        self._set_data_collections(data_collections, legend_parameters)
 
     @property
     def data_collections(self):
@@ -273,18 +224,15 @@ class MonthlyChart(object):
     @property
     def y_axis_lines(self):
         """Get a list of LineSegment2D for the Y-axis values of the chart."""
-        if not self._y_axis_points:
-            self._compute_y_axis_points()
         vec = Vector2D(len(self._months_int) * self._x_dim)
-        return [LineSegment2D(pt, vec) for pt in self._y_axis_points]
+        return [LineSegment2D(pt, vec) for pt in self._frame()['y_axis_points']]
 
     @property
     def y_axis_label_points1(self):
         """Get a list of Point2Ds for the left-side labels of the Y-axis."""
-        if not self._y_axis_points:
-            self._compute_y_axis_points()
         txt_hght = self.legend_parameters.text_height
-        return [Point2D(pt.x - txt_hght, pt.y) for pt in self._y_axis_points]
+        y_axis_points = self._frame()['y_axis_points']
+        return [Point2D(pt.x - txt_hght, pt.y) for pt in y_axis_points]
 
     @property
     def y_axis_label_points2(self):
@@ -295,11 +243,10 @@ class MonthlyChart(object):
         """
         if len(self._data_types) == 1:
             return None
-        if not self._y_axis_points:
-            self._compute_y_axis_points()
         txt_hght = self.legend_parameters.text_height
         x_dist = len(self._months_int) * self._x_dim + txt_hght
-        return [Point2D(pt.x + x_dist, pt.y) for pt in self._y_axis_points]
+        y_axis_points = self._frame()['y_axis_points']
+        return [Point2D(pt.x + x_dist, pt.y) for pt in y_axis_points]
 
     @property
     def y_axis_labels1(self):
@@ -320,42 +267,33 @@ class MonthlyChart(object):
     @property
     def month_lines(self):
         """Get a list of LineSegment2D for the month intervals of the chart."""
-        if not self._month_points:
-            self._compute_month_line_pts()
         vec = Vector2D(0, self._y_dim)
-        return [LineSegment2D(pt, vec) for pt in self._month_points]
+        return [LineSegment2D(pt, vec) for pt in self._frame()['month_points']]
 
     @property
     def month_label_points(self):
         """Get a list of Point2Ds for the month text labels for the chart."""
-        if not self._month_label_points:
-            self._compute_month_line_pts()
         txt_hght = self.legend_parameters.text_height
-        return [Point2D(pt.x, pt.y - txt_hght) for pt in self._month_label_points]
+        label_points = self._frame()['month_label_points']
+        return [Point2D(pt.x, pt.y - txt_hght) for pt in label_points]
 
     @property
     def month_labels(self):
         """Get a list of text strings for the month labels for the chart."""
-        if not self._month_text:
-            self._compute_month_line_pts()
-        return self._month_text
+        return list(self._frame()['month_text'])
 
     @property
     def time_ticks(self):
         """Get a list of LineSegment2D for the time-of-day labels of the chart."""
-        if not self._time_points:
-            self._compute_time_pts()
         txt_hght = self.legend_parameters.text_height
         vec = Vector2D(0, -txt_hght / 2)
-        return [LineSegment2D(pt, vec) for pt in self._time_points]
+        return [LineSegment2D(pt, vec) for pt in self._frame()['time_points']]
 
     @property
     def time_label_points(self):
         """Get a list of Point2Ds for the time-of-day text labels for the chart."""
-        if not self._time_points:
-            self._compute_time_pts()
         txt_hght = self.legend_parameters.text_height * 1.5
-        return [Point2D(pt.x, pt.y - txt_hght) for pt in self._time_points]
+        return [Point2D(pt.x, pt.y - txt_hght) for pt in self._frame()['time_points']]
 
     @property
     def time_labels(self):
@@ -489,6 +427,90 @@ class MonthlyChart(object):
         except IndexError:
             pass  # does not refer to an index for the current data types
 
+    def update_data(self, data_collections):
+        """Replace the data collections of this chart with new data collections.
+
+        The dimensions, legend parameters and static frame geometry of the chart
+        are preserved such that only the data-dependent properties (eg. the
+        data_meshes and Y-axis labels) change. Monthly-per-hour aggregates of
+        hourly data collections that were plotted before are reused, making this
+        much faster than creating a new chart when the same layout is redrawn
+        with new data.
+
+        Args:
+            data_collections: An array of data collections, which will be plotted
+                on the monthly chart.
+        """
+        # remove the legend properties that were derived from the previous data
+        # any user-specified values are stored on the chart and not in the legend
+        legend_par = self.legend_parameters.duplicate()
+        legend_par.min = None
+        legend_par.max = None
+        legend_par.segment_count = None
+        if legend_par.ordinal_dictionary == self._container.data_type.unit_descr:
+            legend_par.ordinal_dictionary = None  # derived from the data collections
+        self._set_data_collections(data_collections, legend_par)
+
+    def _set_data_collections(self, data_collections, legend_parameters):
+        """Assign data collections to the chart and compute all data properties."""
+        # check the input data collections
+        if not isinstance(data_collections, list):
+            try:
+                data_collections = list(data_collections)
+            except TypeError:
+                raise TypeError('MonthlyChart data_collections must be an iterable. '
+                                'Got {}.'.format(type(data_collections)))
+        assert len(data_collections) >= 1, \
+            'MonthlyChart must have at least one data collection.'
+        for i, data in enumerate(data_collections):
+            assert isinstance(data, BaseCollection), 'MonthlyChart data_collections' \
+                ' must contain data collections. Got {}.'.format(type(data))
+            if not data.validated_a_period:
+                data = data.validate_analysis_period()
+            data_collections[i] = data.to_immutable()
+        self._time_interval = self._check_time_interval(data_collections)
+        self._data_collections = data_collections
+
+        # group the input data by data type and figure out the max + min of the Y-axes
+        self._grouped_data, self._data_types, self._units, self._color_map = \
+            self._group_data_by_units()
+        self._compute_maximums_minimums()
+        if self._fixed_minimum is not None:
+            self._minimums[0] = self._fixed_minimum
+        if self._fixed_maximum is not None:
+            self._maximums[0] = self._fixed_maximum
+
+        # check the analysis periods of the data collections
+        self._analysis_period = self._data_collections[0].header.analysis_period
+        self._months_int = self._analysis_period.months_int
+        # TODO: consider supporting different periods by analyzing their overlap
+        apers = [data.header.analysis_period for data in self._data_collections[1:]]
+        assert all([aper == self._analysis_period for aper in apers]), \
+            'All MonthlyChart data collections must have the same analysis period.'
+
+        # create the graphic container
+        base_point, x_dim, y_dim = self._base_point, self._x_dim, self._y_dim
+        min_pt = Point3D(base_point.x, base_point.y)
+        max_pt = Point3D(base_point.x + (x_dim * len(self._months_int)),
+                         base_point.y + y_dim)
+        mock_values = list(range(len(self._data_collections)))
+        mock_descr = {}
+        for i, data_c in enumerate(self._data_collections):
+            data_t_str = data_c.header.metadata['type'] if 'type' in \
+                data_c.header.metadata else str(data_c.header.data_type)
+            mock_descr[i] = data_t_str
+        mock_type = GenericType('Monthly Chart Data Streams', '', unit_descr=mock_descr)
+        self._container = GraphicContainer(
+            mock_values, min_pt, max_pt, legend_parameters, mock_type, '')
+
+        # re-make the container if there is a second axis
+        if len(self._data_types) > 1:  # there's a second axis; move max point
+            offset = self.legend_parameters.text_height * \
+                (len(self.y_axis_labels2[-1]) + 4)
+            max_pt = Point3D(max_pt.x + offset, max_pt.y)
+            self._container = GraphicContainer(
+                mock_values, min_pt, max_pt, legend_parameters, mock_type, '')
+
     def _compute_hourly_lines(self):
         """Compute a list of lines from this object's input data."""
         # get values used by all polylines
@@ -956,15 +978,6 @@ class MonthlyChart(object):
                     n_bars += len(data_list)
             return n_bars
 
-    def _compute_y_axis_points(self):
-        """Compute the points for the Y-axis lines and labels."""
-        self._y_axis_points = []
-        y_interval = self._y_dim / (self._seg_count - 1)
-        base_y = self._base_point.y
-        for i in range(self._seg_count):
-            line_pt = Point2D(self._base_point.x, base_y + (i * y_interval))
-            self._y_axis_points.append(line_pt)
-
     def _y_axis_label_text(self, index):
         """Get a list of Y-axis labels using the index of the data in _data_types."""
         format_str = '%.{}f'.format(self.legend_parameters.decimal_count)
@@ -977,31 +990,54 @@ class MonthlyChart(object):
             y_axis_text.append(format_str % val)
         return y_axis_text
 
-    def _compute_month_line_pts(self):
-        """Compute the points for the month lines and labels."""
-        self._month_text = [AnalysisPeriod.MONTHNAMES[mon] for mon in self._months_int]
-        self._month_points = []
-        for i in range(1, len(self._months_int)):
-            pt = Point2D(self._base_point.x + (i * self._x_dim), self._base_point.y)
-            self._month_points.append(pt)
-        self._month_label_points = []
-        start_x = self._base_point.x + (self._x_dim / 2)
-        for i in range(len(self._months_int)):
-            pt = Point2D(start_x + (i * self._x_dim), self._base_point.y)
-            self._month_label_points.append(pt)
-
-    def _compute_time_pts(self):
-        """Compute the points for the time lines and labels."""
-        self._time_points = []
-        for i in range(len(self._months_int)):
+    def _frame(self):
+        """Get a dictionary with the static geometry of the chart frame.
+
+        The frame only depends on the dimensions and months of the chart and so
+        it is shared between all charts with the same layout.
+        """
+        key = (self._base_point.x, self._base_point.y, self._x_dim, self._y_dim,
+               tuple(self._months_int), self._seg_count, tuple(self.HOUR_LABELS))
+        try:  # move the recently-used frame to the end of the cache
+            frame = self._FRAMES.pop(key)
+        except KeyError:
+            frame = self._compute_frame()
+            if len(self._FRAMES) >= self.FRAME_CACHE_SIZE:
+                self._FRAMES.popitem(last=False)
+        self._FRAMES[key] = frame
+        return frame
+
+    def _compute_frame(self):
+        """Compute the points for the Y-axis, month and time lines and labels."""
+        b_pt, x_dim, months_int = self._base_point, self._x_dim, self._months_int
+        # compute the points for the Y-axis lines and labels
+        y_interval = self._y_dim / (self._seg_count - 1)
+        y_axis_points = tuple(Point2D(b_pt.x, b_pt.y + (i * y_interval))
+                              for i in range(self._seg_count))
+
+        # compute the points for the month lines and labels
+        month_text = tuple(AnalysisPeriod.MONTHNAMES[mon] for mon in months_int)
+        month_points = tuple(Point2D(b_pt.x + (i * x_dim), b_pt.y)
+                             for i in range(1, len(months_int)))
+        start_x = b_pt.x + (x_dim / 2)
+        month_label_points = tuple(Point2D(start_x + (i * x_dim), b_pt.y)
+                                   for i in range(len(months_int)))
+
+        # compute the points for the time lines and labels
+        time_points = []
+        for i in range(len(months_int)):
             for t in self.HOUR_LABELS:
-                x_val = self._base_point.x + (i * self._x_dim) + (t * self._x_dim / 24)
-                pt = Point2D(x_val, self._base_point.y)
-                self._time_points.append(pt)
-        self._time_points.append(
-            Point2D(self._base_point.x + (len(self._months_int) * self._x_dim),
-                    self._base_point.y)
-        )
+                x_val = b_pt.x + (i * x_dim) + (t * x_dim / 24)
+                time_points.append(Point2D(x_val, b_pt.y))
+        time_points.append(Point2D(b_pt.x + (len(months_int) * x_dim), b_pt.y))
+
+        return {
+            'y_axis_points': y_axis_points,
+            'month_text': month_text,
+            'month_points': month_points,
+            'month_label_points': month_label_points,
+            'time_points': tuple(time_points)
+        }
 
     def _compute_maximums_minimums(self):
         """Set the maximum and minimum values of the chart using self._grouped_data."""
@@ -1074,12 +1110,20 @@ class MonthlyChart(object):
         if self._time_interval == 'Hourly':
             lower, upper = 50 - self._percentile, 50 + self._percentile
             new_data = [[] for data_list in grouped_data]
+            aggregates = {}  # only keep the aggregates of the current data
             for i, data_list in enumerate(grouped_data):
                 cumul = self._is_cumulative(data_types[i])
                 for data in data_list:
-                    new_d = self._hourly_to_monthly_per_hour(data, lower, upper, cumul)
+                    key = (data.header, data.values, lower, upper, cumul)
+                    try:
+                        new_d = self._aggregates[key]
+                    except KeyError:
+                        new_d = self._hourly_to_monthly_per_hour(
+                            data, lower, upper, cumul)
+                    aggregates[key] = new_d
                     new_data[i].append(new_d)
             grouped_data = new_data
+            self._aggregates = aggregates
         return grouped_data, data_types, units, color_map
 
     def _is_cumulative(self, data_type):
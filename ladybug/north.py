@@ -4,11 +4,20 @@ from __future__ import division
 
 import math
 import os
+from collections import OrderedDict
+
+
+# cache of the coefficients parsed from .COF files, which is shared by all models
+_COEFFICIENTS = {}
 
 
 class WorldMagneticModel(object):
     """World Magnetic Model (WMM) that can convert from magnetic to true North.
 
+    The coefficients parsed from a .COF file are cached such that the file is only
+    read once per process. The model does not keep any state that changes with
+    the evaluated locations and so a single model can be shared across threads.
+
      Args:
         cof_file: The full path to a .COF file containing the coefficients that
             form the inputs for the World Magnetic Model (WMM). A new set of coefficients
@@ -18,6 +27,8 @@ class WorldMagneticModel(object):
             If not, the most recent coefficients are available at
             https://www.ncei.noaa.gov/products/world-magnetic-model/wmm-coefficients
     """
+    # maximum number of years with time-adjusted coefficients kept by each model
+    TIME_COEFFICIENT_CACHE_SIZE = 64
 
     def __init__(self, cof_file=None):
         """Initialize WorldMagneticModel."""
@@ -25,44 +36,21 @@ class WorldMagneticModel(object):
         if cof_file is None:
             cof_file = os.path.join(os.path.dirname(__file__), 'WMM.COF')
 
-        # parse the coefficients from the file contents
-        wmm = []
-        with open(cof_file) as wmm_file:
-            for line in wmm_file:
-                vals = line.strip().split()
-                if len(vals) == 3:
-                    self.epoch = float(vals[0])
-                    self.model = vals[1]
-                    self.modeldate = vals[2]
-                elif len(vals) == 6:
-                    line_dict = {
-                        'n': int(float(vals[0])),
-                        'm': int(float(vals[1])),
-                        'gnm': float(vals[2]),
-                        'hnm': float(vals[3]),
-                        'dgnm': float(vals[4]),
-                        'dhnm': float(vals[5])
-                    }
-                    wmm.append(line_dict)
+        # get the coefficients from the cache or parse them from the file
+        cof_key = (os.path.abspath(cof_file), os.path.getmtime(cof_file))
+        try:
+            coefficients = _COEFFICIENTS[cof_key]
+        except KeyError:
+            coefficients = self._parse_cof_file(cof_file)
+            _COEFFICIENTS[cof_key] = coefficients
+        self.epoch, self.model, self.modeldate, c, cd, snorm, k = coefficients
+        self.c = [row[:] for row in c]
+        self.cd = [row[:] for row in cd]
+        self.snorm = [row[:] for row in snorm]
+        self.k = [row[:] for row in k]
 
         # set the global constants used by the WMM
-        z = [0.0] * 15
         self.maxord = 12
-        self.tc = []
-        for _ in range(14):
-            self.tc.append(z[0:13])
-        self.sp = z[0:14]
-        self.cp = z[0:14]
-        self.cp[0] = 1.0
-        self.pp = z[0:13]
-        self.pp[0] = 1.0
-        self.p = []
-        for _ in range(14):
-            self.p.append(z[0:14])
-        self.p[0][0] = 1.0
-        self.dp = []
-        for _ in range(14):
-            self.dp.append(z[0:13])
         self.a = 6378.137
         self.b = 6356.7523142
         self.re = 6371.2
@@ -72,64 +60,9 @@ class WorldMagneticModel(object):
         self.a4 = self.a2*self.a2
         self.b4 = self.b2*self.b2
         self.c4 = self.a4 - self.b4
-
-        self.c = []
-        self.cd = []
-        for _ in range(14):
-            self.c.append(z[0:14])
-            self.cd.append(z[0:14])
-
-        # adjust C and CD from the file contents
-        for wmmnm in wmm:
-            m = wmmnm['m']
-            n = wmmnm['n']
-            gnm = wmmnm['gnm']
-            hnm = wmmnm['hnm']
-            dgnm = wmmnm['dgnm']
-            dhnm = wmmnm['dhnm']
-            if (m <= n):
-                self.c[m][n] = gnm
-                self.cd[m][n] = dgnm
-                if (m != 0):
-                    self.c[n][m - 1] = hnm
-                    self.cd[n][m - 1] = dhnm
-
-        # convert schmidt normalized gauss coefficients to un-normalized
-        self.snorm = []
-        for _ in range(13):
-            self.snorm.append(z[0:13])
-        self.snorm[0][0] = 1.0
-        self.k = []
-        for _ in range(13):
-            self.k.append(z[0:13])
-        self.k[1][1] = 0.0
         self.fn = [float(i) for i in range(14)]
         self.fm = [float(i) for i in range(13)]
-        for n in range(1, self.maxord + 1):
-            self.snorm[0][n] = self.snorm[0][n - 1] * (2.0 * n - 1) / n
-            j = 2.0
-            m = 0
-            d_1 = 1
-            d_2 = (n - m + d_1) / d_1
-            while (d_2 > 0):
-                self.k[m][n] = (((n - 1) * (n - 1)) - (m * m)) / \
-                    ((2.0 * n - 1) * (2.0 * n - 3.0))
-                if (m > 0):
-                    flnmj = ((n - m + 1.0) * j) / (n + m)
-                    self.snorm[m][n] = self.snorm[m - 1][n] * math.sqrt(flnmj)
-                    j = 1.0
-                    self.c[n][m - 1] = self.snorm[m][n] * self.c[n][m - 1]
-                    self.cd[n][m - 1] = self.snorm[m][n] * self.cd[n][m - 1]
-                self.c[m][n] = self.snorm[m][n] * self.c[m][n]
-                self.cd[m][n] = self.snorm[m][n] * self.cd[m][n]
-                d_2 = d_2 - 1
-                m = m + d_1
-
-        # set default lat, lon and altitude, which will be overwritten as used
-        self.otime = -1000.0
-        self.oalt = -1000.0
-        self.olat = -1000.0
-        self.olon = -1000.0
+        self._time_coefficients = OrderedDict()  # time-adjusted coefficients by year
 
     def magnetic_declination(self, latitude=0, longitude=0, elevation=0, year=2025):
         """Compute the magnetic declination using the World Magnetic Model (WMM).
@@ -151,98 +84,218 @@ class WorldMagneticModel(object):
         Returns:
             A number for the magnetic declination in degrees.
         """
-        # set up the properties given the location and year information
-        alt = elevation / 1000   # to kilometers
-        dt = year - self.epoch
-        glat = latitude
-        glon = longitude
+        return self._declination(
+            self._time_adjusted_coefficients(year),
+            self._spherical_terms(elevation / 1000, latitude),
+            self._longitude_terms(longitude))
+
+    def magnetic_declinations(self, latitudes, longitudes, elevations=0, years=2025):
+        """Compute the magnetic declination for several locations and years at once.
+
+        This is much faster than calling magnetic_declination for each location
+        since the terms of the model that only depend on the year, the latitude
+        and elevation or the longitude are computed once for each unique value.
+
+        Args:
+            latitudes: A list of numbers between -90 and 90 for the latitudes of
+                the locations in degrees. This can also be a single number to
+                be used for all locations.
+            longitudes: A list of numbers between -180 and 180 for the longitudes
+                of the locations in degrees. This can also be a single number to
+                be used for all locations.
+            elevations: A list of numbers for elevations of the locations in meters.
+                This can also be a single number to be used for all locations.
+                (Default: 0).
+            years: A list of numbers for the years in which the magnetic declination
+                is being evaluated. This can also be a single number to be used
+                for all locations. (Default: 2025).
+
+        Returns:
+            A list of numbers for the magnetic declination in degrees.
+        """
+        # check the inputs and make sure that they are all lists of the same length
+        inputs = [latitudes, longitudes, elevations, years]
+        count = None
+        for val in inputs:
+            if isinstance(val, (list, tuple)):
+                assert count is None or len(val) == count, 'Inputs for ' \
+                    'magnetic_declinations must all be the same length.'
+                count = len(val)
+        if count is None:
+            count = 1
+        inputs = [val if isinstance(val, (list, tuple)) else [val] * count
+                  for val in inputs]
+
+        # compute the declination while reusing the terms of the model
+        spherical, longitude_terms, declinations = {}, {}, []
+        for lat, lon, elev, year in zip(*inputs):
+            alt = elev / 1000
+            try:
+                sph_terms = spherical[(alt, lat)]
+            except KeyError:
+                sph_terms = spherical[(alt, lat)] = self._spherical_terms(alt, lat)
+            try:
+                lon_terms = longitude_terms[lon]
+            except KeyError:
+                lon_terms = longitude_terms[lon] = self._longitude_terms(lon)
+            declinations.append(self._declination(
+                self._time_adjusted_coefficients(year), sph_terms, lon_terms))
+        return declinations
+
+    def magnetic_to_true_north(self, location, magnetic_north=0, year=2025):
+        """Compute true North from a magnetic North vector.
+
+        Args:
+            location: A Ladybug Location object that will be used to determine the
+                magnetic declination.
+            magnetic_north: A number between -360 and 360 for the counterclockwise
+                difference between the North and the positive Y-axis in degrees.
+                90 is West and 270 is East (Default: 0).
+            year: A number for the year in which the magnetic declination is
+                being evaluated. Decimal values are accepted. (Default: 2025).
+
+        Returns:
+            A number between -360 and 360 for the true North angle in degrees.
+        """
+        declination = self.magnetic_declination(
+            location.latitude, location.longitude, location.elevation, year)
+        true_north = magnetic_north + declination
+        if true_north > 360:
+            true_north = true_north - 360
+        elif true_north < -360:
+            true_north = 360 + true_north
+        return true_north
+
+    def _time_adjusted_coefficients(self, year):
+        """Get the gauss coefficients adjusted to a given year."""
+        try:  # move the recently-used year to the end of the cache
+            tc = self._time_coefficients.pop(year)
+        except KeyError:
+            dt = year - self.epoch
+            c, cd = self.c, self.cd
+            tc = [[0.0] * 13 for _ in range(14)]
+            for n in range(1, self.maxord + 1):
+                for m in range(n + 1):
+                    tc[m][n] = c[m][n] + dt * cd[m][n]
+                    if (m != 0):
+                        tc[n][m - 1] = c[n][m - 1] + dt * cd[n][m - 1]
+            if len(self._time_coefficients) >= self.TIME_COEFFICIENT_CACHE_SIZE:
+                try:
+                    self._time_coefficients.popitem(last=False)
+                except KeyError:  # the cache was emptied by another thread
+                    pass
+        self._time_coefficients[year] = tc
+        return tc
+
+    def _spherical_terms(self, alt, glat):
+        """Get the terms of the model that depend on the altitude and latitude.
+
+        Args:
+            alt: A number for the altitude in kilometers.
+            glat: A number for the geodetic latitude in degrees.
+
+        Returns:
+            A tuple with the following elements.
+
+            -   st: Sine of the spherical colatitude.
+
+            -   ct: Cosine of the spherical colatitude.
+
+            -   ca: Cosine of the angle between geodetic and spherical coordinates.
+
+            -   sa: Sine of the angle between geodetic and spherical coordinates.
+
+            -   aor: The ratio between the reference radius and the radius.
+
+            -   p: Un-normalized associated Legendre polynomials.
+
+            -   dp: Derivatives of the associated Legendre polynomials.
+
+            -   pp: Polynomials used at the north and south geographic poles.
+        """
+        # convert from geodetic to spherical coordinates
         rlat = math.radians(glat)
-        rlon = math.radians(glon)
-        srlon = math.sin(rlon)
         srlat = math.sin(rlat)
-        crlon = math.cos(rlon)
         crlat = math.cos(rlat)
         srlat2 = srlat * srlat
         crlat2 = crlat * crlat
-        self.sp[1] = srlon
-        self.cp[1] = crlon
-
-        # convert from geodetic to spherical coordinates
-        if (alt != self.oalt or glat != self.olat):
-            q = math.sqrt(self.a2 - self.c2 * srlat2)
-            q1 = alt * q
-            q2 = ((q1 + self.a2) / (q1 + self.b2)) * ((q1 + self.a2) / (q1 + self.b2))
-            ct = srlat / math.sqrt(q2 * crlat2 + srlat2)
-            st = math.sqrt(1.0 - (ct * ct))
-            r2 = (alt * alt) + 2.0 * q1 + (self.a4 - self.c4 * srlat2) / (q * q)
-            r = math.sqrt(r2)
-            d = math.sqrt(self.a2 * crlat2 + self.b2 * srlat2)
-            ca = (alt + d) / r
-            sa = self.c2 * crlat * srlat / (r * d)
-
-        if (glon != self.olon):
-            for m in range(2, self.maxord + 1):
-                self.sp[m] = self.sp[1] * self.cp[m - 1] + self.cp[1] * self.sp[m - 1]
-                self.cp[m] = self.cp[1] * self.cp[m - 1] - self.sp[1] * self.sp[m - 1]
-
-        aor = self.re / r
+        q = math.sqrt(self.a2 - self.c2 * srlat2)
+        q1 = alt * q
+        q2 = ((q1 + self.a2) / (q1 + self.b2)) * ((q1 + self.a2) / (q1 + self.b2))
+        ct = srlat / math.sqrt(q2 * crlat2 + srlat2)
+        st = math.sqrt(1.0 - (ct * ct))
+        r2 = (alt * alt) + 2.0 * q1 + (self.a4 - self.c4 * srlat2) / (q * q)
+        r = math.sqrt(r2)
+        d = math.sqrt(self.a2 * crlat2 + self.b2 * srlat2)
+        ca = (alt + d) / r
+        sa = self.c2 * crlat * srlat / (r * d)
+
+        # compute un-normalized associated polynomials and derivatives
+        k = self.k
+        p = [[0.0] * 14 for _ in range(14)]
+        p[0][0] = 1.0
+        dp = [[0.0] * 13 for _ in range(14)]
+        pp = [0.0] * 13
+        pp[0] = 1.0
+        for n in range(1, self.maxord + 1):
+            for m in range(n + 1):
+                if (n == m):
+                    p[m][n] = st * p[m - 1][n - 1]
+                    dp[m][n] = st * dp[m - 1][n - 1] + ct * p[m - 1][n - 1]
+                elif (n == 1 and m == 0):
+                    p[m][n] = ct * p[m][n - 1]
+                    dp[m][n] = ct * dp[m][n - 1] - st * p[m][n - 1]
+                elif (n > 1 and n != m):
+                    p[m][n] = ct * p[m][n - 1] - k[m][n] * p[m][n - 2]
+                    dp[m][n] = ct * dp[m][n - 1] - \
+                        st * p[m][n - 1] - k[m][n] * dp[m][n - 2]
+            # special case: north/south geographic poles
+            if (n == 1):
+                pp[n] = pp[n - 1]
+            else:
+                pp[n] = ct * pp[n - 1] - k[1][n] * pp[n - 2]
+        return st, ct, ca, sa, self.re / r, p, dp, pp
+
+    def _longitude_terms(self, glon):
+        """Get lists of the sines and cosines of multiples of the longitude."""
+        rlon = math.radians(glon)
+        sp = [0.0] * 14
+        cp = [0.0] * 14
+        cp[0] = 1.0
+        sp[1] = math.sin(rlon)
+        cp[1] = math.cos(rlon)
+        for m in range(2, self.maxord + 1):
+            sp[m] = sp[1] * cp[m - 1] + cp[1] * sp[m - 1]
+            cp[m] = cp[1] * cp[m - 1] - sp[1] * sp[m - 1]
+        return sp, cp
+
+    def _declination(self, tc, spherical_terms, longitude_terms):
+        """Get the magnetic declination from the terms of the model."""
+        st, ct, ca, sa, aor, p, dp, pp = spherical_terms
+        sp, cp = longitude_terms
+        fn, fm = self.fn, self.fm
         ar = aor * aor
         br = bt = bp = bpp = 0.0
         for n in range(1, self.maxord + 1):
             ar = ar * aor
-            m = 0
-            D4 = (n + m + 1)
-            while D4 > 0:
-                # compute un-normalized associated polynomials and derivatives
-                if (alt != self.oalt or glat != self.olat):
-                    if (n == m):
-                        self.p[m][n] = st * self.p[m - 1][n - 1]
-                        self.dp[m][n] = \
-                            st * self.dp[m - 1][n - 1] + ct * self.p[m - 1][n - 1]
-
-                    elif (n == 1 and m == 0):
-                        self.p[m][n] = ct * self.p[m][n-1]
-                        self.dp[m][n] = ct * self.dp[m][n - 1] - st * self.p[m][n - 1]
-
-                    elif (n > 1 and n != m):
-                        if (m > n - 2):
-                            self.p[m][n - 2] = 0
-                        if (m > n - 2):
-                            self.dp[m][n - 2] = 0.0
-                        self.p[m][n] = \
-                            ct * self.p[m][n - 1] - self.k[m][n] * self.p[m][n - 2]
-                        self.dp[m][n] = ct * self.dp[m][n - 1] - \
-                            st * self.p[m][n - 1]-self.k[m][n] * self.dp[m][n - 2]
-
-                # time adjust the gauss coefficients
-                if (year != self.otime):
-                    self.tc[m][n] = self.c[m][n] + dt * self.cd[m][n]
-                    if (m != 0):
-                        self.tc[n][m - 1] = self.c[n][m - 1] + dt * self.cd[n][m - 1]
-
+            for m in range(n + 1):
                 # accumulate terms of the spherical harmonic expansions
-                par = ar * self.p[m][n]
+                par = ar * p[m][n]
                 if (m == 0):
-                    temp1 = self.tc[m][n] * self.cp[m]
-                    temp2 = self.tc[m][n] * self.sp[m]
+                    temp1 = tc[m][n] * cp[m]
+                    temp2 = tc[m][n] * sp[m]
                 else:
-                    temp1 = self.tc[m][n] * self.cp[m] + self.tc[n][m - 1] * self.sp[m]
-                    temp2 = self.tc[m][n] * self.sp[m] - self.tc[n][m - 1] * self.cp[m]
+                    temp1 = tc[m][n] * cp[m] + tc[n][m - 1] * sp[m]
+                    temp2 = tc[m][n] * sp[m] - tc[n][m - 1] * cp[m]
 
-                bt = bt - ar * temp1 * self.dp[m][n]
-                bp = bp + (self.fm[m] * temp2 * par)
-                br = br + (self.fn[n] * temp1 * par)
+                bt = bt - ar * temp1 * dp[m][n]
+                bp = bp + (fm[m] * temp2 * par)
+                br = br + (fn[n] * temp1 * par)
 
                 # special case: north/south geographic poles
                 if (st == 0.0 and m == 1):
-                    if (n == 1):
-                        self.pp[n] = self.pp[n - 1]
-                    else:
-                        self.pp[n] = ct * self.pp[n - 1] - self.k[m][n] * self.pp[n - 2]
-                    parp = ar * self.pp[n]
-                    bpp = bpp + (self.fm[m] * temp2 * parp)
-                D4 = D4 - 1
-                m = m + 1
+                    parp = ar * pp[n]
+                    bpp = bpp + (fm[m] * temp2 * parp)
 
         if (st == 0.0):
             bp = bpp
@@ -252,39 +305,60 @@ class WorldMagneticModel(object):
         # rotate magnetic vector components from spherical to geodetic coordinates
         bx = -bt * ca - br * sa
         by = bp
-        declination = math.degrees(math.atan2(by, bx))
-
-        # set the location attributes that the model has been aligned to
-        self.otime = year
-        self.oalt = alt
-        self.olat = glat
-        self.olon = glon
-
-        return declination
-
-    def magnetic_to_true_north(self, location, magnetic_north=0, year=2025):
-        """Compute true North from a magnetic North vector.
+        return math.degrees(math.atan2(by, bx))
 
-        Args:
-            location: A Ladybug Location object that will be used to determine the
-                magnetic declination.
-            magnetic_north: A number between -360 and 360 for the counterclockwise
-                difference between the North and the positive Y-axis in degrees.
-                90 is West and 270 is East (Default: 0).
-            year: A number for the year in which the magnetic declination is
-                being evaluated. Decimal values are accepted. (Default: 2025).
+    @staticmethod
+    def _parse_cof_file(cof_file):
+        """Parse the coefficients of a .COF file into Schmidt un-normalized lists.
 
         Returns:
-            A number between -360 and 360 for the true North angle in degrees.
+            A tuple with the epoch, model, modeldate, c, cd, snorm and k.
         """
-        declination = self.magnetic_declination(
-            location.latitude, location.longitude, location.elevation, year)
-        true_north = magnetic_north + declination
-        if true_north > 360:
-            true_north = true_north - 360
-        elif true_north < -360:
-            true_north = 360 + true_north
-        return true_north
+        # parse the coefficients from the file contents
+        epoch, model, modeldate = None, None, None
+        wmm = []
+        with open(cof_file) as wmm_file:
+            for line in wmm_file:
+                vals = line.strip().split()
+                if len(vals) == 3:
+                    epoch = float(vals[0])
+                    model = vals[1]
+                    modeldate = vals[2]
+                elif len(vals) == 6:
+                    wmm.append((int(float(vals[0])), int(float(vals[1])),
+                                float(vals[2]), float(vals[3]),
+                                float(vals[4]), float(vals[5])))
+
+        # adjust C and CD from the file contents
+        c = [[0.0] * 14 for _ in range(14)]
+        cd = [[0.0] * 14 for _ in range(14)]
+        for n, m, gnm, hnm, dgnm, dhnm in wmm:
+            if (m <= n):
+                c[m][n] = gnm
+                cd[m][n] = dgnm
+                if (m != 0):
+                    c[n][m - 1] = hnm
+                    cd[n][m - 1] = dhnm
+
+        # convert schmidt normalized gauss coefficients to un-normalized
+        snorm = [[0.0] * 13 for _ in range(13)]
+        snorm[0][0] = 1.0
+        k = [[0.0] * 13 for _ in range(13)]
+        for n in range(1, 13):
+            snorm[0][n] = snorm[0][n - 1] * (2.0 * n - 1) / n
+            j = 2.0
+            for m in range(n + 1):
+                k[m][n] = (((n - 1) * (n - 1)) - (m * m)) / \
+                    ((2.0 * n - 1) * (2.0 * n - 3.0))
+                if (m > 0):
+                    flnmj = ((n - m + 1.0) * j) / (n + m)
+                    snorm[m][n] = snorm[m - 1][n] * math.sqrt(flnmj)
+                    j = 1.0
+                    c[n][m - 1] = snorm[m][n] * c[n][m - 1]
+                    cd[n][m - 1] = snorm[m][n] * cd[n][m - 1]
+                c[m][n] = snorm[m][n] * c[m][n]
+                cd[m][n] = snorm[m][n] * cd[m][n]
+        return epoch, model, modeldate, c, cd, snorm, k
 
     def ToString(self):
         """Overwrite .NET ToString."""
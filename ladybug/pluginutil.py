@@ -0,0 +1,274 @@
+# coding=utf-8
+"""Utilities to discover and load ladybug extensions (aka. plugins).
+
+Extensions are top-level packages named ``ladybug_[name]`` (e.g. ``ladybug_comfort``)
+or packages that register themselves under the ``ladybug.extensions`` entry point
+group. Scanning all of ``sys.path`` for these packages is expensive and so the
+result of the scan is cached in a small JSON manifest, which is only rebuilt when
+the folders on ``sys.path`` change.
+
+How the extensions are loaded is controlled by the ``LADYBUG_EXTENSIONS``
+environment variable, which can have one of the following values.
+
+* eager - Extensions are imported upon import of ladybug (Default).
+* lazy - Extensions are imported upon first use of the ladybug command line
+    interface or upon calling ``ladybug.load_extensions()``.
+* disabled - Extensions are never imported automatically.
+
+The manifest is written to the config folder of the user's ladybug_tools folder
+and its location can be changed with the ``LADYBUG_EXTENSIONS_CACHE`` environment
+variable. Setting this variable to an empty string disables the cache. Importing
+ladybug only writes the manifest when this variable is set and, otherwise, the
+manifest is written upon use of the command line interface. Extensions in
+the current working directory are never cached and they are always found by
+scanning the directory.
+"""
+import os
+import sys
+import json
+import time
+import zlib
+import importlib
+import pkgutil
+
+from ladybug.logutil import get_logger
+
+MODE_VARIABLE = 'LADYBUG_EXTENSIONS'
+CACHE_VARIABLE = 'LADYBUG_EXTENSIONS_CACHE'
+ENTRY_POINT_GROUP = 'ladybug.extensions'
+LOAD_MODES = ('eager', 'lazy', 'disabled')
+
+_logger = get_logger(__name__)
+# record of the time spent discovering and importing extensions in this session
+_load_report = {'discovery': None, 'from_cache': None, 'imports': {}}
+# manifest path, fingerprint and names of extensions discovered without writing them
+_unsaved_manifest = []
+
+
+def load_mode():
+    """Get the mode for loading extensions from the LADYBUG_EXTENSIONS variable.
+
+    Returns:
+        Text for the load mode. Will be one of eager, lazy, disabled.
+    """
+    mode = os.environ.get(MODE_VARIABLE, '').strip().lower()
+    if not mode:
+        return 'eager'
+    if mode not in LOAD_MODES:
+        _logger.warning(
+            '{} environment variable must be one of {}. Got "{}". Extensions will '
+            'be loaded eagerly.'.format(MODE_VARIABLE, LOAD_MODES, mode))
+        return 'eager'
+    return mode
+
+
+def manifest_path():
+    """Get the path to the JSON manifest that caches the discovered extensions.
+
+    Returns:
+        Path to the manifest file. None if caching has been disabled or the
+        user's home folder is not writable.
+    """
+    cache_path = os.environ.get(CACHE_VARIABLE)
+    if cache_path is not None:
+        return cache_path or None
+    home_folder = os.getenv('HOME') or os.path.expanduser('~')
+    if not os.access(home_folder, os.W_OK):
+        return None
+    exe_id = '{:08x}'.format(zlib.crc32(sys.executable.encode('utf-8')) & 0xffffffff)
+    return os.path.join(home_folder, 'ladybug_tools', 'config',
+                        'extensions_{}.json'.format(exe_id))
+
+
+def discover_extensions(use_cache=True, write_cache=True):
+    """Get a sorted list with the names of all installed ladybug extensions.
+
+    Args:
+        use_cache: Boolean to note whether the manifest of previously discovered
+            extensions can be used if sys.path has not changed since the manifest
+            was written. When False, sys.path is always scanned. (Default: True).
+        write_cache: Boolean to note whether the manifest should be written if
+            sys.path was scanned. When False, the manifest is kept such that it
+            can be written later with the save_manifest method. (Default: True).
+
+    Returns:
+        A list with the module names of the installed extensions.
+    """
+    st_time = time.time()
+    cache_path = manifest_path() if use_cache else None
+    cached_paths, local_paths = _split_sys_path()
+    fingerprint = _path_fingerprint(cached_paths)
+    names = _read_manifest(cache_path, fingerprint) if cache_path else None
+    from_cache = names is not None
+    if not from_cache:
+        names = sorted(set(_scan_modules(cached_paths)) | set(_entry_point_modules()))
+        if cache_path and write_cache:
+            _write_manifest(cache_path, fingerprint, names)
+        elif cache_path:
+            _unsaved_manifest[:] = [cache_path, fingerprint, names]
+    names = sorted(set(names) | set(_scan_modules(local_paths)))
+    _load_report['discovery'] = time.time() - st_time
+    _load_report['from_cache'] = from_cache
+    return names
+
+
+def load_extensions(extensions=None, names=None):
+    """Import ladybug extensions and add them to a dictionary of extensions.
+
+    Extensions that are already in the input dictionary are not imported again.
+
+    Args:
+        extensions: An optional dictionary to which the imported extension modules
+            will be added with the module names as keys. If None, the
+            ``ladybug.extensions`` dictionary will be used.
+        names: An optional list of extension module names to be imported. If None,
+            the extensions will be discovered with discover_extensions.
+
+    Returns:
+        The dictionary of imported extensions.
+    """
+    if extensions is None:
+        import ladybug
+        extensions = ladybug.extensions
+    names = discover_extensions() if names is None else names
+    for name in names:
+        if name in extensions:
+            continue
+        st_time = time.time()
+        try:
+            extensions[name] = importlib.import_module(name)
+        except Exception:
+            if (sys.version_info >= (3, 0)) and name != 'ladybug_vtk':
+                _logger.exception('Failed to import {0}!'.format(name))
+        else:
+            _logger.info('Successfully imported Ladybug plugin: {}'.format(name))
+        _load_report['imports'][name] = time.time() - st_time
+    return extensions
+
+
+def save_manifest():
+    """Write the manifest of extensions that were discovered without writing it.
+
+    Returns:
+        The path to the written manifest. None if there was no manifest to write.
+    """
+    if not _unsaved_manifest:
+        return None
+    cache_path, fingerprint, names = _unsaved_manifest
+    del _unsaved_manifest[:]
+    _write_manifest(cache_path, fingerprint, names)
+    return cache_path
+
+
+def load_report():
+    """Get a dictionary with the time spent discovering and importing extensions.
+
+    Returns:
+        A dictionary with the following keys.
+
+        * mode - The extension load mode (eager, lazy, disabled).
+        * manifest - The path to the manifest of discovered extensions.
+        * discovery - Seconds spent discovering extensions. None if the
+            discovery has not run in this session.
+        * from_cache - Boolean noting whether the discovered extensions came
+            from the manifest. None if the discovery has not run in this session.
+        * imports - A dictionary with the seconds spent importing each extension.
+    """
+    return {
+        'mode': load_mode(),
+        'manifest': manifest_path(),
+        'discovery': _load_report['discovery'],
+        'from_cache': _load_report['from_cache'],
+        'imports': dict(_load_report['imports'])
+    }
+
+
+def _is_extension_name(name):
+    """Check whether a module name follows the ladybug_[name] extension pattern."""
+    return name.startswith('ladybug_') and name.count('_') == 1
+
+
+def _scan_modules(paths):
+    """Get the names of ladybug extensions by scanning a list of folders."""
+    if not paths:
+        return []
+    return [name for _, name, _ in pkgutil.iter_modules(paths)
+            if _is_extension_name(name)]
+
+
+def _entry_point_modules():
+    """Get the names of modules registered under the ladybug.extensions entry points."""
+    try:
+        from importlib import metadata
+    except ImportError:  # python < 3.8
+        return []
+    try:
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, 'select'):
+            entry_points = entry_points.select(group=ENTRY_POINT_GROUP)
+        else:
+            entry_points = entry_points.get(ENTRY_POINT_GROUP, [])
+        return [ep.value.split(':')[0].strip() for ep in entry_points]
+    except Exception:
+        _logger.exception('Failed to read the {} entry points.'.format(ENTRY_POINT_GROUP))
+        return []
+
+
+def _split_sys_path():
+    """Split sys.path into folders that can be cached and the current directory.
+
+    The current working directory changes between sessions and so its extensions
+    are always found by scanning it instead of storing them in the manifest.
+
+    Returns:
+        A tuple with a list of folders that can be cached and a list of entries
+        for the current working directory.
+    """
+    cached_paths, local_paths = [], []
+    cwd = os.getcwd()
+    for path in sys.path:
+        if not path or os.path.abspath(path) == cwd:
+            local_paths.append(path or cwd)
+        else:
+            cached_paths.append(path)
+    return cached_paths, local_paths
+
+
+def _path_fingerprint(paths):
+    """Get a list of folders and their modified times.
+
+    Installing or removing a package changes the modified time of the folder it is
+    installed in, which invalidates any manifest written for another fingerprint.
+    """
+    fingerprint = []
+    for path in paths:
+        try:
+            mod_time = os.path.getmtime(path)
+        except (OSError, TypeError):
+            mod_time = None
+        fingerprint.append([path, mod_time])
+    return fingerprint
+
+
+def _read_manifest(cache_path, fingerprint):
+    """Get the extension names from a manifest if it matches the fingerprint."""
+    try:
+        with open(cache_path) as inf:
+            manifest = json.load(inf)
+    except (IOError, OSError, ValueError):
+        return None
+    if manifest.get('fingerprint') != fingerprint:
+        return None
+    return manifest.get('extensions')
+
+
+def _write_manifest(cache_path, fingerprint, names):
+    """Write the manifest of discovered extensions. Failures are only logged."""
+    try:
+        cache_folder = os.path.dirname(cache_path)
+        if cache_folder and not os.path.isdir(cache_folder):
+            os.makedirs(cache_folder)
+        with open(cache_path, 'w') as outf:
+            json.dump({'fingerprint': fingerprint, 'extensions': names}, outf)
+    except (IOError, OSError):
+        _logger.debug('Failed to write extension manifest to {}'.format(cache_path))
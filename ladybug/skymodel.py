@@ -5,6 +5,7 @@ from __future__ import division
 from .psychrometrics import dew_point_from_db_rh
 
 import math
+from bisect import bisect_left, bisect_right
 try:  # python 2
     from itertools import izip as zip
 except ImportError:  # python 3
@@ -288,6 +289,98 @@ def estimate_illuminance_from_irradiance(
 
     if rel_airmass is None:
         rel_airmass = get_relative_airmass(altitude)
+    return _perez_illuminance(altitude, ghi, dni, dhi, dew_point, rel_airmass)
+
+
+def estimate_illuminance_from_irradiance_batch(
+        altitudes, ghi, dni, dhi, dew_point):
+    """Estimate sky illuminance components for several sites from irradiance.
+
+    The results are the same as calling estimate_illuminance_from_irradiance
+    for each site and timestep. However, each input is a stack of lists with
+    one list per site (eg. one list per Wea), which allows the sun altitudes
+    to be computed beforehand and avoids a function call for each timestep.
+
+    Args:
+        altitudes: A list of lists for the solar altitude angles in degrees. There
+            should be one sub-list for each site, which has one altitude per timestep.
+        ghi: A list of lists for Global Horizontal Irradiance in W/m2 that aligns
+            with the altitudes.
+        dni: A list of lists for Direct Normal Irradiance in W/m2 that aligns
+            with the altitudes.
+        dhi: A list of lists for Diffuse Horizontal Irradiance in W/m2 that aligns
+            with the altitudes.
+        dew_point: A list of lists for the surface dewpoint in degrees C that
+            aligns with the altitudes.
+
+    Returns:
+        A tuple with four elements. Each of them is a list of lists with one
+        sub-list per site and one value per timestep.
+
+        -   gh_ill: Values for Global Horizontal Illuminance in lux.
+
+        -   dn_ill: Values for Direct Normal Illuminance in lux.
+
+        -   dh_ill: Values for Diffuse Horizontal Illuminance in lux.
+
+        -   z_lum: Values for Zenith Luminance in lux.
+    """
+    gh_ill, dn_ill, dh_ill, z_lum = [], [], [], []
+    for site_data in zip(altitudes, ghi, dni, dhi, dew_point):
+        gh, dn, dh, z = _illuminance_from_irradiance_series(*site_data)
+        gh_ill.append(gh)
+        dn_ill.append(dn)
+        dh_ill.append(dh)
+        z_lum.append(z)
+    return gh_ill, dn_ill, dh_ill, z_lum
+
+
+def _illuminance_from_irradiance_series(altitudes, ghi, dni, dhi, dew_point):
+    """Estimate sky illuminance components from aligned lists of irradiance values.
+
+    Args:
+        altitudes: A list of solar altitude angles in degrees.
+        ghi: A list of Global Horizontal Irradiance in W/m2.
+        dni: A list of Direct Normal Irradiance in W/m2.
+        dhi: A list of Diffuse Horizontal Irradiance in W/m2.
+        dew_point: A list of surface dewpoint in degrees C.
+
+    Returns:
+        A tuple with four lists for global horizontal illuminance, direct normal
+        illuminance, diffuse horizontal illuminance and zenith luminance.
+    """
+    gh_ill, dn_ill, dh_ill, z_lum = [], [], [], []
+    for alt, gh, dn, dh, dp in zip(altitudes, ghi, dni, dhi, dew_point):
+        if alt <= 0:  # sun is below the horizon, return 0 for all results
+            gh_ill.append(0)
+            dn_ill.append(0)
+            dh_ill.append(0)
+            z_lum.append(0)
+            continue
+        gh_i, dn_i, dh_i, z_i = _perez_illuminance(
+            alt, gh, dn, dh, dp, get_relative_airmass(alt))
+        gh_ill.append(gh_i)
+        dn_ill.append(dn_i)
+        dh_ill.append(dh_i)
+        z_lum.append(z_i)
+    return gh_ill, dn_ill, dh_ill, z_lum
+
+
+def _perez_illuminance(altitude, ghi, dni, dhi, dew_point, rel_airmass):
+    """Estimate sky illuminance components for a sun that is above the horizon.
+
+    Args:
+        altitude: Solar altitude angle in degrees, which is greater than zero.
+        ghi: Number for Global Horizontal Irradiance in W/m2.
+        dni: Number for Direct Normal Irradiance in W/m2.
+        dhi: Number for Diffuse Horizontal Irradiance in W/m2.
+        dew_point: Surface dewpoint in degrees C.
+        rel_airmass: Number for the relative airmass.
+
+    Returns:
+        A tuple with the global horizontal illuminance, direct normal illuminance,
+        diffuse horizontal illuminance and zenith luminance.
+    """
     zenith = math.radians(90 - altitude)
     dhi = 0.1 if dhi == 0 else dhi
     kai = 1.041
@@ -296,82 +389,80 @@ def estimate_illuminance_from_irradiance(
     w = math.exp(0.08 * dew_point - 0.075)
 
     # Perez Table 1: Discrete Sky Clearness Categories
-    if eps >= 1 and eps < 1.065:
-        e_category = 0
-    elif eps >= 1.065 and eps < 1.23:
-        e_category = 1
-    elif eps >= 1.23 and eps < 1.5:
-        e_category = 2
-    elif eps >= 1.5 and eps < 1.95:
-        e_category = 3
-    elif eps >= 1.95 and eps < 2.8:
-        e_category = 4
-    elif eps >= 2.8 and eps < 4.5:
-        e_category = 5
-    elif eps >= 4.5 and eps < 6.2:
-        e_category = 6
-    elif eps >= 6.2:
-        e_category = 7
-    else:
+    if not eps >= 1:  # also catches NaN values
         raise ValueError('Error in sky luminous efficacy calculation\n'
                          'eps: %f  altitude: %f' % (eps, altitude))
-
-    # Perez Table 4: Luminous Efficacy
-    glob_lum_eff_coeff = ((96.63, -0.47, 11.50, -9.16),
-                          (107.54, 0.79, 1.79, -1.19),
-                          (98.73, 0.70, 4.40, -6.95),
-                          (92.72, 0.56, 8.36, -8.31),
-                          (86.73, 0.98, 7.10, -10.94),
-                          (88.34, 1.39, 6.06, -7.60),
-                          (78.63, 1.47, 4.93, -11.37),
-                          (99.65, 1.86, -4.46, -3.15))
-
-    dir_lum_eff_coeff = ((57.20, -4.55, -2.98, 117.12),
-                         (98.99, -3.46, -1.21, 12.38),
-                         (109.83, -4.90, -1.71, -8.81),
-                         (110.34, -5.84, -1.99, -4.56),
-                         (106.36, -3.97, -1.75, -6.16),
-                         (107.19, -1.25, -1.51, -26.73),
-                         (105.75, 0.77, -1.26, -34.44),
-                         (101.18, 1.58, -1.10, -8.29))
-
-    diff_lum_eff_coeff = ((97.24, -0.46, 12.00, -8.91),
-                          (107.22, 1.15, 0.59, -3.95),
-                          (104.97, 2.96, -5.52, -8.77),
-                          (102.39, 5.59, -13.95, -13.90),
-                          (100.71, 5.94, -22.75, -23.74),
-                          (106.42, 3.83, -36.15, -28.83),
-                          (141.88, 1.90, -53.24, -14.03),
-                          (152.23, 0.35, -45.27, -7.98))
-
-    zen_lum_eff_coeff = ((40.86, 26.77, -29.59, -45.75),
-                         (26.58, 14.73, 58.46, -21.25),
-                         (19.34, 2.28, 100.00, 0.25),
-                         (13.25, -1.39, 124.79, 15.66),
-                         (14.47, -5.09, 160.09, 9.13),
-                         (19.76, -3.88, 154.61, -19.21),
-                         (28.39, -9.67, 151.58, -69.39),
-                         (42.91, -19.62, 130.80, -164.08))
+    e_category = bisect_right(_PEREZ_EPSILON_EDGES, eps)
+    cos_zen, log_delta = math.cos(zenith), math.log(delta)
 
     # Eq 6
-    a, b, c, d = glob_lum_eff_coeff[e_category]
-    gh_ill = ghi * (a + b * w + c * math.cos(zenith) + d * math.log(delta))
+    a, b, c, d = _PEREZ_GLOB_LUM_EFF_COEFF[e_category]
+    gh_ill = ghi * (a + b * w + c * cos_zen + d * log_delta)
 
     # Eq 8
-    a, b, c, d = dir_lum_eff_coeff[e_category]
+    a, b, c, d = _PEREZ_DIR_LUM_EFF_COEFF[e_category]
     dn_ill = max(0, dni * (a + b * w + c * math.exp(5.73 * zenith - 5) + d * delta))
 
     # Eq 7
-    a, b, c, d = diff_lum_eff_coeff[e_category]
-    dh_ill = dhi * (a + b * w + c * math.cos(zenith) + d * math.log(delta))
+    a, b, c, d = _PEREZ_DIFF_LUM_EFF_COEFF[e_category]
+    dh_ill = dhi * (a + b * w + c * cos_zen + d * log_delta)
 
     # Eq 9
-    a, b, c, d = zen_lum_eff_coeff[e_category]
-    z_lum = dhi * (a + b * math.cos(zenith) + c * math.exp(-3 * zenith) + d * delta)
+    a, b, c, d = _PEREZ_ZEN_LUM_EFF_COEFF[e_category]
+    z_lum = dhi * (a + b * cos_zen + c * math.exp(-3 * zenith) + d * delta)
 
     return gh_ill, dn_ill, dh_ill, z_lum
 
 
+# Perez Table 1: Lower limits of the Discrete Sky Clearness Categories after the first
+_PEREZ_EPSILON_EDGES = (1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2)
+
+# Perez Table 4: Luminous Efficacy
+_PEREZ_GLOB_LUM_EFF_COEFF = (
+    (96.63, -0.47, 11.50, -9.16),
+    (107.54, 0.79, 1.79, -1.19),
+    (98.73, 0.70, 4.40, -6.95),
+    (92.72, 0.56, 8.36, -8.31),
+    (86.73, 0.98, 7.10, -10.94),
+    (88.34, 1.39, 6.06, -7.60),
+    (78.63, 1.47, 4.93, -11.37),
+    (99.65, 1.86, -4.46, -3.15)
+)
+
+_PEREZ_DIR_LUM_EFF_COEFF = (
+    (57.20, -4.55, -2.98, 117.12),
+    (98.99, -3.46, -1.21, 12.38),
+    (109.83, -4.90, -1.71, -8.81),
+    (110.34, -5.84, -1.99, -4.56),
+    (106.36, -3.97, -1.75, -6.16),
+    (107.19, -1.25, -1.51, -26.73),
+    (105.75, 0.77, -1.26, -34.44),
+    (101.18, 1.58, -1.10, -8.29)
+)
+
+_PEREZ_DIFF_LUM_EFF_COEFF = (
+    (97.24, -0.46, 12.00, -8.91),
+    (107.22, 1.15, 0.59, -3.95),
+    (104.97, 2.96, -5.52, -8.77),
+    (102.39, 5.59, -13.95, -13.90),
+    (100.71, 5.94, -22.75, -23.74),
+    (106.42, 3.83, -36.15, -28.83),
+    (141.88, 1.90, -53.24, -14.03),
+    (152.23, 0.35, -45.27, -7.98)
+)
+
+_PEREZ_ZEN_LUM_EFF_COEFF = (
+    (40.86, 26.77, -29.59, -45.75),
+    (26.58, 14.73, 58.46, -21.25),
+    (19.34, 2.28, 100.00, 0.25),
+    (13.25, -1.39, 124.79, 15.66),
+    (14.47, -5.09, 160.09, 9.13),
+    (19.76, -3.88, 154.61, -19.21),
+    (28.39, -9.67, 151.58, -69.39),
+    (42.91, -19.62, 130.80, -164.08)
+)
+
+
 """HORIZONTAL INFRARED INTENSITY + SKY TEMPERATURE MODELS"""
 
 
@@ -509,17 +600,9 @@ def dirint(ghi, altitudes, doys, pressures, use_delta_kt_prime=True,
         The modeled direct normal irradiance in W/m^2 provided by the
         DIRINT model.
     """
-    # calculate kt_prime values
-    kt_primes = []
-    disc_dni = []
-    for i in xrange(len(ghi)):
-        dni, kt, airmass = disc(ghi[i], altitudes[i], doys[i], pressure=pressures[i],
-                                min_sin_altitude=min_sin_altitude,
-                                min_altitude=min_altitude)
-        kt_prime = clearness_index_zenith_independent(
-            kt, airmass, max_clearness_index=1)
-        kt_primes.append(kt_prime)
-        disc_dni.append(dni)
+    # calculate disc dni and kt_prime values
+    disc_dni, kt_primes = _disc_series(
+        ghi, altitudes, doys, pressures, min_sin_altitude, min_altitude)
 
     # calculate delta_kt_prime values
     if use_delta_kt_prime:
@@ -547,15 +630,74 @@ def dirint(ghi, altitudes, doys, pressures, use_delta_kt_prime=True,
 
     # get the dirint coefficient by looking up values in the matrix
     coeffs = _get_dirint_coeffs()
-    dirint_coeffs = [coeffs[ktp_bin[i]][alt_bin[i]][delta_ktp_bin[i]][w_bin[i]]
-                     for i in xrange(len(ghi))]
 
     # Perez eqn 5
-    dni = [disc_d * coef for disc_d, coef in zip(disc_dni, dirint_coeffs)]
+    dni = [disc_d * coeffs[k_b][a_b][d_b][w_b] for disc_d, k_b, a_b, d_b, w_b in
+           zip(disc_dni, ktp_bin, alt_bin, delta_ktp_bin, w_bin)]
 
     return dni
 
 
+def _disc_series(ghi, altitudes, doys, pressures, min_sin_altitude=0.065,
+                 min_altitude=3, max_airmass=12):
+    """Get DISC DNI and zenith independent clearness index for a series of values.
+
+    The results are the same as calling disc followed by
+    clearness_index_zenith_independent (with a max_clearness_index of 1) for
+    each value. However, the extraterrestrial radiation is only computed once
+    for each day of the year and the clearness index and airmass are computed
+    inline, which avoids several function calls for each value.
+
+    Args:
+        ghi: A list of global horizontal irradiance in W/m^2.
+        altitudes: A list of true solar altitude angles in decimal degrees.
+        doys: A list of integers representing the day of the year.
+        pressures: A list of site pressures in Pascal. Individual values can
+            be None to use the relative airmass instead of the absolute airmass.
+        min_sin_altitude: Minimum value of sin(altitude) to allow when
+            calculating global clearness index `kt`.
+        min_altitude: Minimum value of altitude to allow in DNI calculation.
+        max_airmass: Maximum value of the air mass to allow in Kn calculation.
+
+    Returns:
+        A tuple with two elements
+
+        -   disc_dni: A list of the modeled direct normal irradiance in W/m^2.
+
+        -   kt_primes: A list of zenith independent clearness indices.
+    """
+    sin, radians, exp = math.sin, math.radians, math.exp
+    extra_rad = {}
+    disc_dni, kt_primes = [], []
+    for gh, alt, doy, pressure in zip(ghi, altitudes, doys, pressures):
+        if not (alt > min_altitude and gh > 0):
+            disc_dni.append(0)
+            kt_primes.append(0)
+            continue
+        try:
+            I0 = extra_rad[doy]
+        except KeyError:
+            I0 = extra_rad[doy] = get_extra_radiation(doy, 1370.)
+
+        # clearness index limited to 1
+        sin_altitude = sin(radians(alt))
+        kt = gh / (I0 * max(sin_altitude, min_sin_altitude))
+        kt = min(max(kt, 0), 1)
+
+        # kasten1966 relative airmass, which is corrected for pressure if it exists
+        am = 1.0 / (sin_altitude + 0.15 * ((3.885 + alt) ** - 1.253))
+        if pressure is not None:
+            am = am * pressure / 101325.
+
+        Kn, am = _disc_kn(kt, am, max_airmass=max_airmass)
+        disc_dni.append(max(Kn * I0, 0))
+
+        # Perez eqn 1
+        kt_prime = kt / (1.031 * exp(-1.4 / (0.9 + 9.4 / am)) + 0.1)
+        kt_primes.append(min(max(kt_prime, 0), 1))
+    return disc_dni, kt_primes
+
+
 def _dirint_bins(ktp, alt, w, dktp):
     """
     Determine the bins for the DIRINT coefficients.
@@ -569,43 +711,22 @@ def _dirint_bins(ktp, alt, w, dktp):
     Returns:
         tuple of ktp_bin, alt_bin, w_bin, dktp_bin
     """
-    it = xrange(len(ktp))
-
-    # Create kt_prime bins
-    ktp_bin = [-1] * len(ktp)
-    ktp_bin = [0 if ktp[i] >= 0 and ktp[i] < 0.24 else ktp_bin[i] for i in it]
-    ktp_bin = [1 if ktp[i] >= 0.24 and ktp[i] < 0.4 else ktp_bin[i] for i in it]
-    ktp_bin = [2 if ktp[i] >= 0.4 and ktp[i] < 0.56 else ktp_bin[i] for i in it]
-    ktp_bin = [3 if ktp[i] >= 0.56 and ktp[i] < 0.7 else ktp_bin[i] for i in it]
-    ktp_bin = [4 if ktp[i] >= 0.7 and ktp[i] < 0.8 else ktp_bin[i] for i in it]
-    ktp_bin = [5 if ktp[i] >= 0.8 and ktp[i] <= 1 else ktp_bin[i] for i in it]
-
-    # Create altitude angle bins
-    alt_bin = [-1] * len(alt)
-    alt_bin = [0 if alt[i] <= 90 and alt[i] > 65 else alt_bin[i] for i in it]
-    alt_bin = [1 if alt[i] <= 65 and alt[i] > 50 else alt_bin[i] for i in it]
-    alt_bin = [2 if alt[i] <= 50 and alt[i] > 35 else alt_bin[i] for i in it]
-    alt_bin = [3 if alt[i] <= 35 and alt[i] > 20 else alt_bin[i] for i in it]
-    alt_bin = [4 if alt[i] <= 20 and alt[i] > 10 else alt_bin[i] for i in it]
-    alt_bin = [5 if alt[i] <= 10 else alt_bin[i] for i in it]
+    # Create kt_prime bins, which include their lower bound
+    ktp_edges = (0.24, 0.4, 0.56, 0.7, 0.8)
+    ktp_bin = [bisect_right(ktp_edges, k) if 0 <= k <= 1 else -1 for k in ktp]
+
+    # Create altitude angle bins, which include their upper bound
+    alt_edges = (10, 20, 35, 50, 65)
+    alt_bin = [5 - bisect_left(alt_edges, a) if a <= 90 else -1 for a in alt]
 
     # Create the bins for w based on dew point temperature
-    w_bin = [-1] * len(w)
-    w_bin = [0 if w[i] >= 0 and w[i] < 1 else w_bin[i] for i in it]
-    w_bin = [1 if w[i] >= 1 and w[i] < 2 else w_bin[i] for i in it]
-    w_bin = [2 if w[i] >= 2 and w[i] < 3 else w_bin[i] for i in it]
-    w_bin = [3 if w[i] >= 3 else w_bin[i] for i in it]
-    w_bin = [4 if w[i] == -1 else w_bin[i] for i in it]
-
-    # Create delta_kt_prime binning.
-    dktp_bin = [-1] * len(dktp)
-    dktp_bin = [0 if dktp[i] >= 0 and dktp[i] < 0.015 else dktp_bin[i] for i in it]
-    dktp_bin = [1 if dktp[i] >= 0.015 and dktp[i] < 0.035 else dktp_bin[i] for i in it]
-    dktp_bin = [2 if dktp[i] >= 0.035 and dktp[i] < 0.07 else dktp_bin[i] for i in it]
-    dktp_bin = [3 if dktp[i] >= 0.07 and dktp[i] < 0.15 else dktp_bin[i] for i in it]
-    dktp_bin = [4 if dktp[i] >= 0.15 and dktp[i] < 0.3 else dktp_bin[i] for i in it]
-    dktp_bin = [5 if dktp[i] >= 0.3 and dktp[i] <= 1 else dktp_bin[i] for i in it]
-    dktp_bin = [6 if dktp[i] == -1 else dktp_bin[i] for i in it]
+    w_bin = [4 if wi == -1 else -1 if wi < 0 else 3 if wi >= 3 else int(wi)
+             for wi in w]
+
+    # Create delta_kt_prime binning, which include their lower bound
+    dktp_edges = (0.015, 0.035, 0.07, 0.15, 0.3)
+    dktp_bin = [6 if d == -1 else bisect_right(dktp_edges, d) if 0 <= d <= 1 else -1
+                for d in dktp]
 
     return ktp_bin, alt_bin, w_bin, dktp_bin
 
@@ -976,6 +1097,9 @@ def get_relative_airmass(altitude, model='kastenyoung1989'):
     return am
 
 
+_DIRINT_COEFFS = None  # the dirint coefficient matrix once it has been built
+
+
 def _get_dirint_coeffs():
     """
     Here be a large multi-dimensional matrix of dirint coefficients.
@@ -984,6 +1108,9 @@ def _get_dirint_coeffs():
         Array with shape ``(6, 6, 7, 5)``.
         Ordering is ``[kt_prime_bin, zenith_bin, delta_kt_prime_bin, w_bin]``
     """
+    global _DIRINT_COEFFS
+    if _DIRINT_COEFFS is not None:  # the matrix has already been built
+        return _DIRINT_COEFFS
     coeffs = [[0 for i in xrange(6)] for j in xrange(6)]
 
     coeffs[0][0] = [
@@ -1310,4 +1437,5 @@ def _get_dirint_coeffs():
         [0.475230, 0.500000, 0.518640, 0.339970, 0.520230],
         [0.743440, 0.592190, 0.603060, 0.316930, 0.794390]]
 
+    _DIRINT_COEFFS = coeffs
     return coeffs
@@ -14,6 +14,10 @@ from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
 from ladybug_geometry.geometry3d.face import Face3D
 from ladybug_geometry.geometry3d.mesh import Mesh3D
 
+import sys
+if (sys.version_info >= (3, 0)):
+    xrange = range
+
 
 class SolarEnvelope(object):
     """Calculate a Solar Envelope boundary for a given site.
@@ -160,8 +164,15 @@ class SolarEnvelope(object):
         """Get a list of Vector2Ds for the reversed sun vectors in 2D space."""
         return [Vector2D(-vec.x, -vec.y) for vec in self._sun_vectors]
 
-    def envelope_mesh(self):
-        """Compute a Mesh3D representing the solar envelope boundary."""
+    def envelope_mesh(self, processes=1):
+        """Compute a Mesh3D representing the solar envelope boundary.
+
+        Args:
+            processes: An integer for the number of processes across which the
+                mesh vertices will be distributed. Values above 1 use a
+                multiprocessing Pool, which is not available in IronPython.
+                (Default: 1).
+        """
         # extract the relevant proprties from the input geometry
         pt2ds, poly2ds = self.geometry_point2ds, self.obstacle_polygon2ds
         vec2ds = self.sun_vector2ds if self.solar_rights else self.sun_vector2ds_reversed
@@ -171,20 +182,141 @@ class SolarEnvelope(object):
 
         # loop through the points to get the height of each one
         pt_heights = self._compute_point_heights(
-            pt2ds, poly2ds, obs_heights, vec2ds, altitudes, base_height)
+            pt2ds, poly2ds, obs_heights, vec2ds, altitudes, base_height, processes)
 
         # turn the mesh point heights into a full Mesh3D
         new_vertices = [Point3D(pt.x, pt.y, h) for pt, h in zip(pt2ds, pt_heights)]
         return Mesh3D(new_vertices, self._geometry_mesh.faces)
 
+    def progressive_envelope_meshes(self, tolerance, cell_count=8):
+        """Get a generator of Mesh3Ds that progressively refine the solar envelope.
+
+        The first envelope only computes the heights of a coarse subset of the
+        geometry_mesh vertices, which are taken from a grid with cell_count cells
+        along its longest side. The heights of all other vertices are interpolated
+        from the computed heights around them. Each subsequent envelope halves the
+        size of the grid cells and computes new heights only around the cells where
+        the computed heights differ by more than the tolerance. The generator stops
+        once there are no more of such cells with vertices that are not computed.
+
+        This makes the first usable envelope available in a fraction of the time
+        of the envelope_mesh method, which is useful when iterating on obstacle
+        heights. However, note that the last envelope is only exact in regions
+        where heights vary and so the envelope_mesh method should be used for
+        the final envelope.
+
+        Args:
+            tolerance: A number for the difference between neighboring envelope
+                heights above which the envelope is refined. Negative values
+                refine everywhere such that the last envelope is exact.
+            cell_count: A positive integer for the number of cells along the longest
+                side of the grid used for the first envelope. (Default: 8).
+
+        Returns:
+            A generator of Mesh3Ds for the solar envelope boundary, with each one
+            being more refined than the previous one.
+        """
+        assert isinstance(cell_count, int) and cell_count > 0, 'Expected positive ' \
+            'integer for cell_count. Got {}.'.format(cell_count)
+        # extract the relevant proprties from the input geometry
+        pt2ds, poly2ds = self.geometry_point2ds, self.obstacle_polygon2ds
+        vec2ds = self.sun_vector2ds if self.solar_rights else self.sun_vector2ds_reversed
+        obs_heights = [face[0].z for face in self._obstacle_faces]
+        points, obstacles, directions = self._engine_inputs(
+            pt2ds, poly2ds, obs_heights, vec2ds, self._sun_altitudes())
+        dir_indices = _direction_indices(points, obstacles, directions)
+        base_height, faces = self.base_height, self._geometry_mesh.faces
+
+        # set up the grid that will be used to select the vertices
+        min_x = min(pt[0] for pt in points)
+        min_y = min(pt[1] for pt in points)
+        extent = max(max(pt[0] for pt in points) - min_x,
+                     max(pt[1] for pt in points) - min_y)
+        cell = extent / cell_count if extent > 0 else 1
+        coincident = {}  # vertices at the same location are always computed together
+        for i, pt in enumerate(points):
+            try:
+                coincident[pt].append(i)
+            except KeyError:
+                coincident[pt] = [i]
+        heights = [None] * len(points)  # heights that have been computed
+        estimates = [base_height] * len(points)
+        rough_cells = None  # the entire grid is sampled for the first envelope
+
+        while True:
+            # group the vertices by grid cell and pick one vertex per sampled cell
+            grid = {}
+            for i, (x, y) in enumerate(points):
+                key = (int((x - min_x) / cell), int((y - min_y) / cell))
+                try:
+                    grid[key].append(i)
+                except KeyError:
+                    grid[key] = [i]
+            sample = []
+            for (c_x, c_y), verts in grid.items():
+                if rough_cells is not None and (c_x // 2, c_y // 2) not in rough_cells:
+                    continue
+                if any(heights[i] is not None for i in verts):
+                    continue
+                cent_x, cent_y = min_x + (c_x + 0.5) * cell, min_y + (c_y + 0.5) * cell
+                sample_i = min(verts, key=lambda i: (points[i][0] - cent_x) ** 2 +
+                               (points[i][1] - cent_y) ** 2)
+                sample.extend(coincident[points[sample_i]])
+            sample.sort()
+
+            # compute the heights of the sampled vertices
+            sample_hgts = _indexed_point_heights(
+                [points[i] for i in sample], directions, dir_indices,
+                base_height, self.solar_rights)
+            for i, hgt in zip(sample, sample_hgts):
+                heights[i] = estimates[i] = hgt
+            computed = {}
+            for key, verts in grid.items():
+                cell_hgts = [(points[i], heights[i])
+                             for i in verts if heights[i] is not None]
+                if cell_hgts:
+                    computed[key] = cell_hgts
+
+            # interpolate the other heights from the computed heights around them
+            if sample:  # skip levels that do not split any vertices into new cells
+                for key, verts in grid.items():
+                    near_hgts = [pt_h for n_key in self._neighbor_cells(key)
+                                 for pt_h in computed.get(n_key, ())]
+                    if not near_hgts:
+                        continue
+                    for i in verts:
+                        if heights[i] is None:
+                            estimates[i] = self._interpolate_height(points[i], near_hgts)
+                yield Mesh3D([Point3D(x, y, h) for (x, y), h in zip(points, estimates)],
+                             faces)
+
+            # find the cells where neighboring heights differ beyond the tolerance
+            rough_cells = set()
+            for key, cell_hgts in computed.items():
+                if len(cell_hgts) == len(grid[key]):
+                    continue  # all vertices of the cell have been computed
+                near_hgts = [hgt for n_key in self._neighbor_cells(key)
+                             for _, hgt in computed.get(n_key, ())]
+                if max(near_hgts) - min(near_hgts) > tolerance:
+                    rough_cells.add(key)
+            if not rough_cells:
+                break
+            cell = cell / 2
+
     def _sun_altitudes(self):
         """Get the altitudes of the sun_vectors in radians."""
         return [vec.angle(Vector3D(vec.x, vec.y, 0)) for vec in self._sun_vectors]
 
     def _compute_point_heights(
-            self, pt2ds, obs_poly2ds, obs_heights, vec2ds, vec_altitudes, base_height):
+            self, pt2ds, obs_poly2ds, obs_heights, vec2ds, vec_altitudes, base_height,
+            processes=1):
         """Get Z heights for each of the points in the envelope mesh.
 
+        The geometry is converted to tuples of coordinates and obstacles that
+        cannot be hit by a given sun ray are pruned using an index of the obstacle
+        extents perpendicular to each sun vector. The results are identical to
+        intersecting every sun ray with every obstacle polygon.
+
         Args:
             pt2ds: List of Point2D objects for each of the vertices of the mesh
             obs_poly2ds: List of Polygon2D objects for each of the obstacles.
@@ -196,18 +328,62 @@ class SolarEnvelope(object):
             base_height: The starting height of the envelope points. This should
                 be below the geometry_mesh for a collection boundary and above it
                 for a rights boundary.
+            processes: An integer for the number of processes across which the
+                points will be distributed. (Default: 1).
+        """
+        points, obstacles, directions = self._engine_inputs(
+            pt2ds, obs_poly2ds, obs_heights, vec2ds, vec_altitudes)
+        if processes <= 1 or len(points) < 2:
+            return _envelope_point_heights(
+                (points, obstacles, directions, base_height, self.solar_rights))
+
+        # distribute one contiguous chunk of points to each of the processes
+        import multiprocessing
+        chunk = int(math.ceil(len(points) / processes))
+        args = [(points[i:i + chunk], obstacles, directions, base_height,
+                 self.solar_rights) for i in xrange(0, len(points), chunk)]
+        pool = multiprocessing.Pool(processes)
+        try:
+            results = pool.map(_envelope_point_heights, args)
+        finally:
+            pool.close()
+            pool.join()
+        return [h for chunk_heights in results for h in chunk_heights]
+
+    @staticmethod
+    def _neighbor_cells(key):
+        """Get the keys of a grid cell and the 8 cells around it."""
+        c_x, c_y = key
+        return [(c_x + d_x, c_y + d_y) for d_x in (-1, 0, 1) for d_y in (-1, 0, 1)]
+
+    @staticmethod
+    def _interpolate_height(point, point_heights):
+        """Get the height of a point using inverse distance weighting.
+
+        Args:
+            point: An (x, y) tuple for the point to be interpolated.
+            point_heights: A list of ((x, y), height) tuples for known heights.
         """
-        height_method = self._point_height_rights if self.solar_rights \
-            else self._point_height_collection
-        heights = []
-        for point in pt2ds:
-            pt_height = base_height
-            for obs_poly, obs_h in zip(obs_poly2ds, obs_heights):
-                for vec, alt in zip(vec2ds, vec_altitudes):
-                    pt_height = height_method(
-                        point, vec, alt, obs_poly, obs_h, pt_height)
-            heights.append(pt_height)
-        return heights
+        total_weight, total_height = 0, 0
+        for (x, y), hgt in point_heights:
+            dist_sq = (x - point[0]) ** 2 + (y - point[1]) ** 2
+            if dist_sq == 0:
+                return hgt
+            total_weight += 1 / dist_sq
+            total_height += hgt / dist_sq
+        return total_height / total_weight
+
+    @staticmethod
+    def _engine_inputs(pt2ds, obs_poly2ds, obs_heights, vec2ds, vec_altitudes):
+        """Get the points, obstacles and sun directions as tuples of coordinates."""
+        points = [(pt.x, pt.y) for pt in pt2ds]
+        obstacles = [
+            (obs_h, tuple((seg.p.x, seg.p.y, seg.v.x, seg.v.y)
+                          for seg in obs_poly.segments))
+            for obs_poly, obs_h in zip(obs_poly2ds, obs_heights)]
+        directions = [(vec.x, vec.y, math.tan(alt))
+                      for vec, alt in zip(vec2ds, vec_altitudes)]
+        return points, obstacles, directions
 
     @staticmethod
     def _point_height_collection(
@@ -242,3 +418,154 @@ class SolarEnvelope(object):
     def __repr__(self):
         """SolarEnvelope representation."""
         return "SolarEnvelope [{}]".format(self.geometry_mesh)
+
+
+def _envelope_point_heights(args):
+    """Get the solar envelope heights for a list of points.
+
+    This function is at the module level so that it can be used by a process Pool.
+
+    Args:
+        args: A tuple with five elements.
+
+        -   points: A list of (x, y) tuples for the vertices of the envelope mesh.
+
+        -   obstacles: A list with a tuple for each obstacle. Each tuple contains
+            the height of the obstacle followed by a tuple with an (x, y, vx, vy)
+            tuple for each segment of the obstacle polygon.
+
+        -   directions: A list of (vx, vy, tan_altitude) tuples for the sun vectors.
+            These should be reversed sun vectors when computing a solar collection.
+
+        -   base_height: The starting height of the envelope points.
+
+        -   solar_rights: Boolean for whether a solar rights boundary is computed.
+
+    Returns:
+        A list of heights that align with the input points.
+    """
+    points, obstacles, directions, base_height, solar_rights = args
+    dir_indices = _direction_indices(points, obstacles, directions)
+    return _indexed_point_heights(
+        points, directions, dir_indices, base_height, solar_rights)
+
+
+def _direction_indices(points, obstacles, directions):
+    """Get a list with an index of the obstacles for each of the sun vectors.
+
+    Args:
+        points: A list of (x, y) tuples for the vertices of the envelope mesh.
+        obstacles: A list with a tuple of the height and segments of each obstacle.
+        directions: A list of (vx, vy, tan_altitude) tuples for the sun vectors.
+    """
+    # set a tolerance that covers floating point error in the obstacle index
+    coords = [abs(c) for _, segs in obstacles for seg in segs for c in seg[:2]]
+    coords.extend(abs(c) for pt in points for c in pt)
+    tol = 1e-9 * (max(coords) + 1)
+    return [_direction_index(vec_x, vec_y, obstacles, tol)
+            for vec_x, vec_y, _ in directions]
+
+
+def _indexed_point_heights(points, directions, dir_indices, base_height, solar_rights):
+    """Get the solar envelope heights for a list of points using direction indices.
+
+    Args:
+        points: A list of (x, y) tuples for the vertices of the envelope mesh.
+        directions: A list of (vx, vy, tan_altitude) tuples for the sun vectors.
+        dir_indices: A list of obstacle indices from _direction_indices.
+        base_height: The starting height of the envelope points.
+        solar_rights: Boolean for whether a solar rights boundary is computed.
+
+    Returns:
+        A list of heights that align with the input points.
+    """
+    heights = [base_height] * len(points)
+    for (vx, vy, tan_alt), dir_index in zip(directions, dir_indices):
+        if dir_index is None:  # vertical sun vector that hits nothing
+            continue
+        ux, uy, s_min, bin_width, bins = dir_index
+        last_bin = len(bins) - 1
+        for i, (px, py) in enumerate(points):
+            # find the obstacles that overlap the ray perpendicular to the sun
+            bin_i = int((ux * py - uy * px - s_min) / bin_width)
+            if bin_i < 0 or bin_i > last_bin + 1:
+                continue
+            s = ux * py - uy * px
+            t = ux * px + uy * py
+            pt_height = heights[i]
+            for ob_s_min, ob_s_max, ob_t_min, ob_t_max, obs_h, segs in \
+                    bins[min(bin_i, last_bin)]:
+                if s < ob_s_min or s > ob_s_max or t > ob_t_max:
+                    continue
+                # skip the obstacle if its closest possible point has no effect
+                min_dist = ob_t_min - t if ob_t_min > t else 0
+                if solar_rights:
+                    if min_dist * tan_alt + obs_h >= pt_height:
+                        continue
+                elif obs_h - min_dist * tan_alt <= pt_height:
+                    continue
+                # intersect the ray with each of the obstacle segments
+                pt_dist = None
+                for ax, ay, avx, avy in segs:
+                    d = vy * avx - vx * avy
+                    if d == 0:
+                        continue
+                    dy = ay - py
+                    dx = ax - px
+                    ua = (vx * dy - vy * dx) / d
+                    if not (ua >= 0.0 and ua <= 1.0):
+                        continue
+                    ub = (avx * dy - avy * dx) / d
+                    if not ub >= 0.0:
+                        continue
+                    dist = math.sqrt((px - (ax + ua * avx)) ** 2 +
+                                     (py - (ay + ua * avy)) ** 2)
+                    if pt_dist is None or dist < pt_dist:
+                        pt_dist = dist
+                if pt_dist is not None:
+                    if solar_rights:
+                        new_height = pt_dist * tan_alt + obs_h
+                        if new_height < pt_height:
+                            pt_height = new_height
+                    else:
+                        new_height = obs_h - pt_dist * tan_alt
+                        if new_height > pt_height:
+                            pt_height = new_height
+            heights[i] = pt_height
+    return heights
+
+
+def _direction_index(vec_x, vec_y, obstacles, tol):
+    """Get an index of the obstacles that can be hit by rays along a sun vector.
+
+    Obstacles are described by their extents in a coordinate system where t is
+    the distance along the sun vector and s is the distance perpendicular to it.
+    The s axis is divided into bins so that the obstacles that a ray could hit
+    are found by looking up the bin of the ray's s coordinate.
+
+    Returns:
+        A tuple with (ux, uy, s_min, bin_width, bins) where each bin is a list of
+        (s_min, s_max, t_min, t_max, height, segments) tuples. None if the
+        sun vector has no horizontal component.
+    """
+    length = math.sqrt(vec_x ** 2 + vec_y ** 2)
+    if length == 0:
+        return None
+    ux, uy = vec_x / length, vec_y / length
+    extents = []
+    for obs_h, segs in obstacles:
+        s_vals = [ux * y - uy * x for x, y, _, _ in segs]
+        t_vals = [ux * x + uy * y for x, y, _, _ in segs]
+        extents.append((min(s_vals) - tol, max(s_vals) + tol,
+                        min(t_vals) - tol, max(t_vals) + tol, obs_h, segs))
+    s_min = min(ext[0] for ext in extents)
+    s_max = max(ext[1] for ext in extents)
+    bin_count = len(extents)
+    bin_width = (s_max - s_min) / bin_count
+    bins = [[] for _ in xrange(bin_count)]
+    for ext in extents:
+        st_bin = int((ext[0] - s_min) / bin_width)
+        end_bin = min(int((ext[1] - s_min) / bin_width), bin_count - 1)
+        for bin_i in xrange(st_bin, end_bin + 1):
+            bins[bin_i].append(ext)
+    return ux, uy, s_min, bin_width, bins
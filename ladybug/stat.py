@@ -81,7 +81,7 @@ class STAT(object):
                                   r"\s*(\w{3})\s*(\d{1,2}):\s*(\w{3})\s*(\d{1,2}),")
     _coldweek_pattern = re.compile(r"Extreme Cold Week Period selected:"
                                    r"\s*(\w{3})\s*(\d{1,2}):\s*(\w{3})\s*(\d{1,2}),")
-    _typweek_pattern = re.compile(r"(\S*)\s*Typical Week Period selected:"
+    _typweek_pattern = re.compile(r"Typical Week Period selected:"
                                   r"\s*(\w{3})\s*(\d{1,2}):\s*(\w{3})\s*(\d{1,2}),")
     _heat_pattern = re.compile(r"Heating\s(\d.*)")
     _cool_pattern = re.compile(r"Cooling\s(\d.*)")
@@ -97,9 +97,36 @@ class STAT(object):
     _wb_04_pattern = re.compile(r"Coincident Wetbulb 0.4%(.*)")
     _db_range_50_pattern = re.compile(r"Drybulb range - DB 5%(.*)")
     _wb_range_50_pattern = re.compile(r"Wetbulb range - DB 5%(.*)")
-    _winds_pattern = re.compile(r"Monthly Statistics for Wind Speed[\s\S]*Daily Avg(.*)")
-    _windd_patterns = tuple(re.compile(
-        r"Monthly Wind Direction %[\s\S]*" + dir + r"\s(.*)") for dir in _wind_dir_names)
+    _winds_section = 'Monthly Statistics for Wind Speed'
+    _windd_section = 'Monthly Wind Direction %'
+    # patterns where the first match in the body is used along with the literal
+    # text at the start of each pattern, which is used to skip to the first match
+    _first_patterns = (
+        ('ashrae_cz', 'Climate type', _ashraecz_pattern),
+        ('koppen_cz', 'Climate type', _koppencz_pattern),
+        ('hot_week', 'Extreme Hot Week', _hotweek_pattern),
+        ('cold_week', 'Extreme Cold Week', _coldweek_pattern),
+        ('heating', 'Heating', _heat_pattern),
+        ('cooling', 'Cooling', _cool_pattern),
+        ('_monthly_tau_beam', 'taub (beam)', _tau_beam_pattern),
+        ('_monthly_tau_diffuse', 'taud (diffuse)', _tau_diffuse_pattern),
+        ('_monthly_db_50', 'Drybulb 5', _db_50_pattern),
+        ('_monthly_wb_50', 'Coincident Wetbulb 5', _wb_50_pattern),
+        ('_monthly_db_100', 'Drybulb 10', _db_100_pattern),
+        ('_monthly_wb_100', 'Coincident Wetbulb 10', _wb_100_pattern),
+        ('_monthly_db_20', 'Drybulb 2', _db_20_pattern),
+        ('_monthly_wb_20', 'Coincident Wetbulb 2', _wb_20_pattern),
+        ('_monthly_db_04', 'Drybulb 0', _db_04_pattern),
+        ('_monthly_wb_04', 'Coincident Wetbulb 0', _wb_04_pattern),
+        ('_monthly_db_range_50', 'Drybulb range - DB 5%', _db_range_50_pattern),
+        ('_monthly_wb_range_50', 'Wetbulb range - DB 5%', _wb_range_50_pattern)
+    )
+    # monthly tables that are only converted to numbers once they are requested
+    _monthly_tables = (
+        '_monthly_tau_beam', '_monthly_tau_diffuse', '_monthly_db_50', '_monthly_wb_50',
+        '_monthly_db_100', '_monthly_wb_100', '_monthly_db_20', '_monthly_wb_20',
+        '_monthly_db_04', '_monthly_wb_04', '_monthly_db_range_50',
+        '_monthly_wb_range_50', '_monthly_wind', '_monthly_wind_dirs')
 
     __slots__ = (
         '_file_path', '_winter_des_day_dict', '_summer_des_day_dict',
@@ -110,7 +137,7 @@ class STAT(object):
         '_monthly_db_100', '_monthly_wb_100', '_monthly_db_20', '_monthly_wb_20',
         '_monthly_db_04', '_monthly_wb_04', '_monthly_wind',
         '_stand_press_at_elev', '_monthly_tau_beam', '_monthly_tau_diffuse',
-        '_header', '_body'
+        '_header', '_monthly_text'
     )
 
     def __init__(self, file_path):
@@ -127,11 +154,13 @@ class STAT(object):
         # defaults empty state for certain parameters
         self._winter_des_day_dict = {}
         self._summer_des_day_dict = {}
-        self._monthly_wind_dirs = []
+        self._monthly_text = None
 
         # import the data from the file
         if file_path is not None:
             self._import_data()
+        else:
+            self._monthly_wind_dirs = []
 
     @classmethod
     def from_dict(cls, data):
@@ -256,7 +285,7 @@ class STAT(object):
             line = statwin.readline()
             # import header with location
             self._header = [line] + [statwin.readline() for i in xrange(9)]
-            self._body = statwin.read()
+            body_text = self._parse_body(statwin.read())
         except Exception as e:
             import traceback
             raise Exception('{}\n{}'.format(e, traceback.format_exc()))
@@ -298,48 +327,139 @@ class STAT(object):
             # pull out individual properties
             self._stand_press_at_elev = self._regex_check(
                 self._press_pattern, self._header[5])
-            self._ashrae_climate_zone = self._regex_check(
-                self._ashraecz_pattern, self._body, enforce_string=True)
-            self._koppen_climate_zone = self._regex_check(
-                self._koppencz_pattern, self._body, enforce_string=True)
+            self._ashrae_climate_zone = body_text.pop('ashrae_cz', None)
+            self._koppen_climate_zone = body_text.pop('koppen_cz', None)
 
             # pull out extreme and seasonal weeks.
-            self._extreme_hot_week = self._regex_week_parse(self._hotweek_pattern)
-            self._extreme_cold_week = self._regex_week_parse(self._coldweek_pattern)
-            self._typical_weeks = self._regex_typical_week_parse()
+            hot_week = body_text.pop('hot_week', None)
+            self._extreme_hot_week = self._regex_week(hot_week) \
+                if hot_week is not None else None
+            cold_week = body_text.pop('cold_week', None)
+            self._extreme_cold_week = self._regex_week(cold_week) \
+                if cold_week is not None else None
+            self._typical_weeks = {'other': []}
+            for season, match in body_text.pop('typical_weeks'):
+                a_per = self._regex_week(match)
+                if 'winter' in season:
+                    self._typical_weeks['winter'] = a_per
+                elif 'spring' in season:
+                    self._typical_weeks['spring'] = a_per
+                elif 'summer' in season:
+                    self._typical_weeks['summer'] = a_per
+                elif 'autumn' in season:
+                    self._typical_weeks['autumn'] = a_per
+                else:
+                    self._typical_weeks['other'].append(a_per)
 
             # pull out annual design days
-            winter_vals = self._regex_parse(self._heat_pattern)
+            winter_vals = self._parse_row(body_text.pop('heating', None))
             for key, val in zip(DesignDay.HEATING_KEYS, winter_vals):
                 self._winter_des_day_dict[key] = val
-            summer_vals = self._regex_parse(self._cool_pattern)
+            summer_vals = self._parse_row(body_text.pop('cooling', None))
             for key, val in zip(DesignDay.COOLING_KEYS, summer_vals):
                 self._summer_des_day_dict[key] = val
 
-            # Pull out relevant monthly information
-            self._monthly_tau_beam = self._regex_parse(self._tau_beam_pattern)
-            self._monthly_tau_diffuse = self._regex_parse(self._tau_diffuse_pattern)
-            self._monthly_db_50 = self._regex_parse(self._db_50_pattern)
-            self._monthly_wb_50 = self._regex_parse(self._wb_50_pattern)
-            self._monthly_db_100 = self._regex_parse(self._db_100_pattern)
-            self._monthly_wb_100 = self._regex_parse(self._wb_100_pattern)
-            self._monthly_db_20 = self._regex_parse(self._db_20_pattern)
-            self._monthly_wb_20 = self._regex_parse(self._wb_20_pattern)
-            self._monthly_db_04 = self._regex_parse(self._db_04_pattern)
-            self._monthly_wb_04 = self._regex_parse(self._wb_04_pattern)
-            self._monthly_db_range_50 = self._regex_parse(self._db_range_50_pattern)
-            self._monthly_wb_range_50 = self._regex_parse(self._wb_range_50_pattern)
-            self._monthly_wind = self._regex_parse(self._winds_pattern)
-            for direction in self._windd_patterns:
-                dirs = self._regex_parse(direction)
-                if dirs != []:
-                    self._monthly_wind_dirs.append(dirs)
-            if self._monthly_wind_dirs == []:
-                self._monthly_wind_dirs = [[0] * 12 for i in xrange(8)]
+            # keep the text of the monthly tables to be parsed when requested
+            self._monthly_text = body_text
 
         finally:
             statwin.close()
 
+    def _parse_body(self, text):
+        """Get the text of all properties in the body of the file.
+
+        The results are the same as running each regular expression over the
+        whole body but the search for each property starts at the first
+        occurrence of its text and the wind tables are searched from the end.
+
+        Args:
+            text: The text of the file after the header.
+
+        Returns:
+            A dictionary with the text matched to each of the _first_patterns,
+            the text of the monthly wind tables and the typical_weeks as a list
+            of (season, match) tuples.
+        """
+        found = {}
+        for key, key_text, pattern in self._first_patterns:
+            start = text.find(key_text)
+            match = pattern.search(text, start) if start != -1 else None
+            if match is not None:
+                groups = match.groups()
+                found[key] = groups if len(groups) > 1 else groups[0]
+
+        # typical weeks use the last word before them to identify the season
+        typical_weeks, start = [], text.find('Typical Week Period selected:')
+        while start != -1:
+            match = self._typweek_pattern.match(text, start)
+            if match is not None:
+                season_end = start
+                while season_end > 0 and text[season_end - 1].isspace():
+                    season_end -= 1
+                season_st = season_end
+                while season_st > 0 and not text[season_st - 1].isspace():
+                    season_st -= 1
+                typical_weeks.append((text[season_st:season_end], match.groups()))
+            start = text.find('Typical Week Period selected:', start + 1)
+        found['typical_weeks'] = typical_weeks
+
+        # wind tables, where the last match after the start of the section is used
+        section = text.find(self._winds_section)
+        if section != -1:
+            found['_monthly_wind'] = self._last_line_text(
+                text, section + len(self._winds_section), 'Daily Avg')
+        section = text.find(self._windd_section)
+        if section != -1:
+            for dir_name in self._wind_dir_names:
+                found[dir_name] = self._last_line_text(
+                    text, section + len(self._windd_section), dir_name, True)
+        return found
+
+    @staticmethod
+    def _last_line_text(text, start, key_text, space=False):
+        """Get the rest of the line after the last occurrence of key text.
+
+        Args:
+            text: The text to be searched.
+            start: An integer for the index in the text where the search starts.
+            key_text: The text to be found.
+            space: Boolean to note whether the key text must be followed by
+                a whitespace character, which is skipped and can be a line break.
+
+        Returns:
+            The text after the key text up to the end of its line. None if the
+            key text was not found.
+        """
+        end = len(text)
+        while True:
+            pos = text.rfind(key_text, start, end)
+            if pos == -1:
+                return None
+            value_st = pos + len(key_text)
+            if not space:
+                break
+            if value_st < len(text) and text[value_st].isspace():
+                value_st += 1
+                break
+            end = value_st - 1
+        value_end = text.find('\n', value_st)
+        return text[value_st:value_end] if value_end != -1 else text[value_st:]
+
+    def _parse_monthly_tables(self):
+        """Convert the text of the monthly tables found in the file into numbers."""
+        monthly_text = self._monthly_text
+        for attr in self._monthly_tables[:-1]:
+            setattr(self, attr, self._parse_row(monthly_text.get(attr)))
+        monthly_wind_dirs = []
+        for dir_name in self._wind_dir_names:
+            dirs = self._parse_row(monthly_text.get(dir_name))
+            if dirs != []:
+                monthly_wind_dirs.append(dirs)
+        if monthly_wind_dirs == []:
+            monthly_wind_dirs = [[0] * 12 for i in xrange(8)]
+        self._monthly_wind_dirs = monthly_wind_dirs
+        self._monthly_text = None
+
     def _regex_check(self, regex_pattern, search_space, enforce_string=False):
         matches = regex_pattern.findall(search_space)
         if len(matches) > 0:
@@ -365,40 +485,25 @@ class STAT(object):
         else:
             return None
 
-    def _regex_week_parse(self, regex_pattern):
-        matches = regex_pattern.findall(self._body)
-        if len(matches) > 0:
-            return self._regex_week(matches[0])
-        else:
-            return None
-
-    def _regex_typical_week_parse(self):
-        typ_weeks = {'other': []}
-        matches = self._typweek_pattern.findall(self._body)
-        for match in matches:
-            a_per = self._regex_week(match[1:])
-            if 'winter' in match[0]:
-                typ_weeks['winter'] = a_per
-            elif 'spring' in match[0]:
-                typ_weeks['spring'] = a_per
-            elif 'summer' in match[0]:
-                typ_weeks['summer'] = a_per
-            elif 'autumn' in match[0]:
-                typ_weeks['autumn'] = a_per
-            else:
-                typ_weeks['other'].append(a_per)
-        return typ_weeks
-
-    def _regex_parse(self, regex_pattern):
-        matches = regex_pattern.findall(self._body)
-        if len(matches) > 0:
-            raw_txt = matches[0].strip().split('\t')
-            try:
-                return [float(i) if i not in ('N', '  N_A') else None for i in raw_txt]
-            except ValueError:
-                return [str(i) for i in raw_txt]
-        else:
+    @staticmethod
+    def _parse_row(row_text):
+        """Convert the tab-separated text of a row in the file into a list of values.
+        """
+        if row_text is None:
             return []
+        raw_txt = row_text.strip().split('\t')
+        try:
+            return [float(i) if i not in ('N', '  N_A') else None for i in raw_txt]
+        except ValueError:
+            return [str(i) for i in raw_txt]
+
+    def __getattr__(self, name):
+        # the monthly tables are converted from the file text upon first request
+        if name in self._monthly_tables and self._monthly_text is not None:
+            self._parse_monthly_tables()
+            return getattr(self, name)
+        raise AttributeError("'{}' object has no attribute '{}'".format(
+            self.__class__.__name__, name))
 
     @property
     def monthly_found(self):
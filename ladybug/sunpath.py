@@ -267,26 +267,7 @@ class Sunpath(object):
         hour_angle = sol_time / 4 + 180 if sol_time < 0 else sol_time / 4 - 180
 
         # radians for the zenith and degrees for altitude
-        zenith = math.acos(math.sin(self._latitude) * math.sin(sol_dec) +
-                           math.cos(self._latitude) * math.cos(sol_dec) *
-                           math.cos(math.radians(hour_angle)))
-        altitude = 90 - math.degrees(zenith)
-
-        # approx atmospheric refraction used to correct the altitude
-        if altitude > 85:
-            atmos_refraction = 0
-        elif altitude > 5:
-            atmos_refraction = 58.1 / math.tan(math.radians(altitude)) - \
-                0.07 / (math.tan(math.radians(altitude))) ** 3 + \
-                0.000086 / (math.tan(math.radians(altitude))) ** 5
-        elif altitude > -0.575:
-            atmos_refraction = 1735 + altitude * \
-                (-518.2 + altitude * (103.4 + altitude * (-12.79 + altitude * 0.711)))
-        else:
-            atmos_refraction = -20.772 / math.tan(math.radians(altitude))
-
-        atmos_refraction /= 3600
-        altitude += atmos_refraction
+        altitude, zenith = self._calculate_altitude(sol_dec, hour_angle)
 
         # azimuth in degrees
         az_init = ((math.sin(self._latitude) * math.cos(zenith)) - math.sin(sol_dec)) / \
@@ -303,6 +284,59 @@ class Sunpath(object):
         return Sun(datetime, altitude, azimuth, is_solar_time, is_daylight_saving,
                    self.north_angle)
 
+    @staticmethod
+    def calculate_sun_altitudes_batch(locations, datetimes, is_leap_year=False,
+                                      is_solar_time=False):
+        """Get solar altitudes for several locations at the same datetimes.
+
+        The results are the same as creating a Sunpath from each location and
+        getting the altitude of calculate_sun_from_date_time for each datetime.
+        However, the solar declination and equation of time only depend on the
+        datetime and the time zone. So they are computed only once for each
+        time zone shared by the locations and no Sun objects are created.
+
+        Note that daylight saving time is not used for any of the locations.
+
+        Args:
+            locations: A list of Ladybug Location objects.
+            datetimes: A list of Ladybug DateTimes for which solar altitudes
+                will be computed at each location.
+            is_leap_year: A boolean to indicate if datetimes are for a leap
+                year. (Default: False).
+            is_solar_time: A boolean to indicate if the input datetimes are in
+                solar time. (Default: False)
+
+        Returns:
+            A list of lists with one sub-list for each location. Each sub-list
+            contains the solar altitudes in degrees for each of the datetimes.
+        """
+        if is_leap_year:
+            datetimes = [DateTime(dt.month, dt.day, dt.hour, dt.minute, True)
+                         if dt.year != 2016 else dt for dt in datetimes]
+        hours = []
+        for dt in datetimes:
+            try:
+                hours.append(dt.float_hour)
+            except AttributeError:  # native Python datetime; compute manually
+                hours.append(dt.hour + dt.minute / 60.0)
+
+        geometry_by_tz, altitudes = {}, []
+        for location in locations:
+            sp = Sunpath.from_location(location)
+            sp.is_leap_year = is_leap_year
+            try:  # see if the solar geometry has been computed for the time zone
+                geometry = geometry_by_tz[sp.time_zone]
+            except KeyError:
+                geometry = geometry_by_tz[sp.time_zone] = \
+                    [sp._calculate_solar_geometry(dt) for dt in datetimes]
+            loc_alts = []
+            for (sol_dec, eq_of_time), hour in zip(geometry, hours):
+                sol_time = sp._calculate_solar_time(hour, eq_of_time, is_solar_time) * 60
+                hour_angle = sol_time / 4 + 180 if sol_time < 0 else sol_time / 4 - 180
+                loc_alts.append(sp._calculate_altitude(sol_dec, hour_angle)[0])
+            altitudes.append(loc_alts)
+        return altitudes
+
     def calculate_sunrise_sunset(self, month, day, depression=0.5334,
                                  is_solar_time=False):
         """Calculate sunrise, noon and sunset.
@@ -900,6 +934,40 @@ class Sunpath(object):
 
         return sol_dec, eq_of_time
 
+    def _calculate_altitude(self, sol_dec, hour_angle):
+        """Calculate the solar altitude corrected for atmospheric refraction.
+
+        Args:
+            sol_dec: Solar declination in radians.
+            hour_angle: Degrees for the angle between solar noon and the time.
+
+        Returns:
+            A tuple with the altitude in degrees and the zenith in radians.
+            Note that the zenith is not corrected for atmospheric refraction.
+        """
+        # radians for the zenith and degrees for altitude
+        zenith = math.acos(math.sin(self._latitude) * math.sin(sol_dec) +
+                           math.cos(self._latitude) * math.cos(sol_dec) *
+                           math.cos(math.radians(hour_angle)))
+        altitude = 90 - math.degrees(zenith)
+
+        # approx atmospheric refraction used to correct the altitude
+        if altitude > 85:
+            atmos_refraction = 0
+        elif altitude > 5:
+            atmos_refraction = 58.1 / math.tan(math.radians(altitude)) - \
+                0.07 / (math.tan(math.radians(altitude))) ** 3 + \
+                0.000086 / (math.tan(math.radians(altitude))) ** 5
+        elif altitude > -0.575:
+            atmos_refraction = 1735 + altitude * \
+                (-518.2 + altitude * (103.4 + altitude * (-12.79 + altitude * 0.711)))
+        else:
+            atmos_refraction = -20.772 / math.tan(math.radians(altitude))
+
+        atmos_refraction /= 3600
+        altitude += atmos_refraction
+        return altitude, zenith
+
     def _calculate_sunrise_hour_angle(self, solar_dec, depression):
         """Calculate hour angle for sunrise time in degrees.
 
@@ -1004,19 +1072,10 @@ class Sunpath(object):
             origin_3d: Point3D for the origin around which projection will occur.
         """
         plines_2d = []
-        if projection.title() == 'Orthographic':
-            for pl in plines_3d:
-                pts = [Compass.point3d_to_orthographic(pt) for pt in pl.vertices]
-                plines_2d.append(Polyline2D(pts, True))
-        else:
-            func_name = 'point3d_to_{}'.format(projection.lower())
-            try:
-                project_func = getattr(Compass, func_name)
-            except Exception:
-                raise ValueError('Projection "{}" is not supported.'.format(projection))
-            for pline in plines_3d:
-                pts = [project_func(pt, radius, origin_3d) for pt in pline.vertices]
-                plines_2d.append(Polyline2D(pts, True))
+        for pline in plines_3d:
+            pts = Compass.points3d_to_projection(
+                pline.vertices, projection, radius, origin_3d)
+            plines_2d.append(Polyline2D(pts, True))
         return plines_2d
 
     def __repr__(self):
@@ -1213,15 +1272,8 @@ class Sun(object):
             A Point2D for the position of this sun on a sunpath.
         """
         o_3d = Point3D(origin.x, origin.y, 0)
-        if projection.title() == 'Orthographic':
-            return Compass.point3d_to_orthographic(self.position_3d(o_3d, radius))
-        else:
-            func_name = 'point3d_to_{}'.format(projection.lower())
-            try:
-                project_func = getattr(Compass, func_name)
-            except Exception:
-                raise ValueError('Projection "{}" is not supported.'.format(projection))
-            return project_func(self.position_3d(o_3d, radius), radius, o_3d)
+        return Compass.point3d_to_projection(
+            self.position_3d(o_3d, radius), projection, radius, o_3d)
 
     def _calculate_sun_vector(self):
         """Calculate sun vector for this sun."""
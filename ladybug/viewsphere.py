@@ -3,6 +3,9 @@
 from __future__ import division
 
 import math
+import json
+import threading
+from collections import OrderedDict
 
 from ladybug_geometry.geometry2d.pointvector import Vector2D
 from ladybug_geometry.geometry3d.pointvector import Point3D, Vector3D
@@ -29,6 +32,15 @@ class ViewSphere(object):
         * reinhart_dome_mesh
         * reinhart_sphere_mesh
         * reinhart_solid_angles
+
+    Note that the meshes, vectors and weights generated by the dome_patches,
+    sphere_patches and dome_radial_patches methods (along with their weights)
+    are stored in a bounded cache that is shared across all ViewSphere
+    instances. So requesting the same subdivision twice only generates the
+    geometry once. The PATCH_CACHE_SIZE class attribute sets the maximum number
+    of entries in this cache and the save_patch_cache and load_patch_cache
+    methods can be used to share generated patches across processes. The cache
+    is guarded by a lock such that it can be used from several threads.
     """
     # number of patches in each row of the most-used sky domes
     TREGENZA_PATCHES_PER_ROW = (30, 30, 24, 24, 18, 12, 6)
@@ -41,6 +53,10 @@ class ViewSphere(object):
         (0.0113221971, 0.0111894547, 0.0109255262, 0.0105335058, 0.0125224872,
          0.0117312774, 0.0108025291, 0.00974713106, 0.011436609, 0.00974295956,
          0.0119026242, 0.00905126163, 0.0121875626, 0.00612971396, 0.00921483254)
+    # maximum number of entries in the cache of generated patches
+    PATCH_CACHE_SIZE = 32
+    _patch_cache = OrderedDict()
+    _patch_cache_lock = threading.Lock()
 
     __slots__ = ('_tregenza_dome_vectors', '_tregenza_sphere_vectors',
                  '_tregenza_dome_mesh', '_tregenza_dome_mesh_high_res',
@@ -285,6 +301,12 @@ class ViewSphere(object):
                 until the last circular patch, which will have a single vector
                 for the several triangular faces. All vectors are unit vectors.
         """
+        # check whether the patches have already been generated
+        key = ('dome', division_count, subdivide_in_place)
+        cached = self._cached_patches(key)
+        if cached is not None:
+            return self._copy_patches(cached)
+
         # compute constants to be used in the generation of patch points
         patch_row_count = self._patch_row_count_array(division_count)
         base_vec = Vector3D(0, 1, 0)
@@ -325,7 +347,8 @@ class ViewSphere(object):
         patch_mesh = Mesh3D(vertices, faces)
         patch_vectors = patch_mesh.face_normals[:-patch_row_count[-1]] + \
             (Vector3D(0, 0, 1),)
-        return patch_mesh, patch_vectors
+        return self._copy_patches(
+            self._cache_patches(key, (patch_mesh, patch_vectors)))
 
     def dome_patch_weights(self, division_count=1):
         """Get a list of numbers corresponding to the area weight of each dome patch.
@@ -338,11 +361,7 @@ class ViewSphere(object):
             A list of numbers with a value for each patch that corresponds to the
             area of that patch. The average value of all the patches is equal to 1.
         """
-        # get the areas of the patches
-        patch_areas, _ = self._dome_patch_areas(division_count)
-        # normalize the patch areas so that they average to 1
-        avg_patch_area = 2 * math.pi / len(patch_areas)
-        return [p_area / avg_patch_area for p_area in patch_areas]
+        return list(self._dome_patch_weights(division_count))
 
     def sphere_patches(self, division_count=1, subdivide_in_place=False):
         """Get Vector3Ds and a corresponding Mesh3D for a sphere.
@@ -372,10 +391,16 @@ class ViewSphere(object):
                 for the two circular patches, which will have a single vector
                 for the several triangular faces. All vectors are unit vectors.
         """
+        # check whether the patches have already been generated
+        key = ('sphere', division_count, subdivide_in_place)
+        cached = self._cached_patches(key)
+        if cached is not None:
+            return self._copy_patches(cached)
         # generate patches for the hemisphere
         m_top, v_top = self.dome_patches(division_count, subdivide_in_place)
         # reverse the vectors and negate all the z values of the sky patch mesh
-        return self._generate_bottom_from_top(m_top, v_top)
+        return self._copy_patches(
+            self._cache_patches(key, self._generate_bottom_from_top(m_top, v_top)))
 
     def sphere_patch_weights(self, division_count=1):
         """Get a list of numbers corresponding to the area weight of each sphere patch.
@@ -388,11 +413,7 @@ class ViewSphere(object):
             A list of numbers with a value for each patch that corresponds to the
             area of that patch. The average value of all the patches is equal to 1.
         """
-        # get the areas of the patches
-        patch_areas, _ = self._dome_patch_areas(division_count)
-        # normalize the patch areas so that they average to 1
-        avg_patch_area = 2 * math.pi / len(patch_areas)
-        return [p_area / avg_patch_area for p_area in patch_areas] * 2
+        return list(self._dome_patch_weights(division_count)) * 2
 
     def dome_radial_patches(self, azimuth_count=72, altitude_count=18):
         """Get Vector3Ds and a corresponding Mesh3D for a a radial dome.
@@ -415,6 +436,12 @@ class ViewSphere(object):
                 per mesh face. These will align with the faces of the patch_mesh.
                 All vectors are unit vectors.
         """
+        # check whether the patches have already been generated
+        key = ('dome_radial', azimuth_count, altitude_count)
+        cached = self._cached_patches(key)
+        if cached is not None:
+            return self._copy_patches(cached)
+
         # set up starting vectors and points
         base_vec, rotate_axis = Vector3D(0, 1, 0), Vector3D(1, 0, 0)
         horiz_angle = -2 * math.pi / azimuth_count
@@ -446,7 +473,8 @@ class ViewSphere(object):
         # create the Mesh3D object and derive the patch vectors from the mesh
         patch_mesh = Mesh3D(vertices, faces)
         patch_vectors = patch_mesh.face_normals
-        return patch_mesh, patch_vectors
+        return self._copy_patches(
+            self._cache_patches(key, (patch_mesh, patch_vectors)))
 
     def dome_radial_patch_weights(self, azimuth_count=72, altitude_count=18):
         """Get a list of numbers corresponding to the area weight of each dome patch.
@@ -463,11 +491,17 @@ class ViewSphere(object):
             A list of numbers with a value for each patch that corresponds to the
             area of that patch. The average value of all the patches is equal to 1.
         """
-        # get the areas of the patches
-        patch_areas = self._dome_radial_patch_areas(azimuth_count, altitude_count)
-        # normalize the patch areas so that they average to 1
-        total_patch_area = 2 * math.pi
-        return [p_area / total_patch_area for p_area in patch_areas]
+        # check whether the weights have already been computed
+        key = ('dome_radial_weights', azimuth_count, altitude_count)
+        weights = self._cached_patches(key)
+        if weights is None:
+            # get the areas of the patches
+            patch_areas = self._dome_radial_patch_areas(azimuth_count, altitude_count)
+            # normalize the patch areas so that they average to 1
+            total_patch_area = 2 * math.pi
+            weights = self._cache_patches(
+                key, tuple(p_area / total_patch_area for p_area in patch_areas))
+        return list(weights)
 
     def horizontal_circle_view_mesh(
             self, center_point=Point3D(0, 0, 0), radius=1, azimuth_count=72):
@@ -727,6 +761,67 @@ class ViewSphere(object):
         radial_mesh = Mesh3D(vertices, faces)
         return radial_mesh, view_vecs
 
+    @classmethod
+    def save_patch_cache(cls, file_path):
+        """Write all of the patches in the cache to a JSON file.
+
+        The meshes and vectors are written as flat coordinate arrays such that
+        they can be loaded by other processes with the load_patch_cache method
+        without having to regenerate them.
+
+        Args:
+            file_path: Path to a .json file to which the cache will be written.
+
+        Returns:
+            The path to the written file.
+        """
+        patches = []
+        with cls._patch_cache_lock:
+            cache_items = list(cls._patch_cache.items())
+        for key, value in cache_items:
+            patch = {'key': list(key)}
+            if key[0].endswith('weights'):
+                patch['weights'] = list(value)
+            else:
+                mesh, vectors = value
+                patch['vertices'] = [c for pt in mesh.vertices for c in pt]
+                patch['faces'] = [list(f) for f in mesh.faces]
+                patch['vectors'] = [c for vec in vectors for c in vec]
+            patches.append(patch)
+        with open(file_path, 'w') as fp:
+            json.dump({'type': 'ViewSpherePatches', 'patches': patches}, fp)
+        return file_path
+
+    @classmethod
+    def load_patch_cache(cls, file_path):
+        """Load patches from a JSON file written with save_patch_cache into the cache.
+
+        Args:
+            file_path: Path to a .json file written with the save_patch_cache method.
+        """
+        with open(file_path) as fp:
+            data = json.load(fp)
+        assert data['type'] == 'ViewSpherePatches', \
+            'Expected ViewSpherePatches JSON. Got {}.'.format(data['type'])
+        for patch in data['patches']:
+            if 'weights' in patch:
+                value = tuple(patch['weights'])
+            else:
+                verts, vecs = patch['vertices'], patch['vectors']
+                mesh = Mesh3D(
+                    tuple(Point3D(*verts[i:i + 3]) for i in range(0, len(verts), 3)),
+                    tuple(tuple(f) for f in patch['faces']))
+                vectors = tuple(Vector3D(*vecs[i:i + 3])
+                                for i in range(0, len(vecs), 3))
+                value = (mesh, vectors)
+            cls._cache_patches(tuple(patch['key']), value)
+
+    @classmethod
+    def clear_patch_cache(cls):
+        """Remove all patches from the cache shared across ViewSpheres."""
+        with cls._patch_cache_lock:
+            cls._patch_cache.clear()
+
     @staticmethod
     def orientation_pattern(plane_normal, view_vectors):
         """Get booleans for whether view vectors are blocked by a plane.
@@ -812,6 +907,203 @@ class ViewSphere(object):
             mask_pattern.append(not is_visible)
         return mask_pattern
 
+    @staticmethod
+    def orientation_pattern_batch(plane_normals, view_vectors):
+        """Get booleans for whether view vectors are blocked by each of several planes.
+
+        This is equivalent to calling orientation_pattern for each plane normal but
+        the magnitudes of the view vectors are computed only once and no intermediate
+        geometry objects are created. So it is much faster when evaluating many
+        planes (eg. all sensors of a facade) against the same set of view vectors.
+
+        Args:
+            plane_normals: A list of Vector3D (or lists of 3 numbers) for the
+                normals of the planes.
+            view_vectors: A list of Vector3D (or lists of 3 numbers) for the view
+                vectors which will be evaluated to determine if they are blocked
+                by each of the planes or not.
+
+        Returns:
+            A tuple with two values.
+
+            -   mask_patterns -- A list of lists with one sub-list for each plane
+                normal. Each sub-list contains booleans for whether each of the
+                view vectors are blocked by the plane (True) or not (False).
+
+            -   angles -- A list of lists with one sub-list for each plane normal.
+                Each sub-list contains angles in radians for the angle between
+                the plane normal and each view vector.
+        """
+        view_comps = ViewSphere._vector_components(view_vectors)
+        max_angle, acos = math.pi / 2, math.acos
+        mask_patterns, angles = [], []
+        for n_x, n_y, n_z, n_mag in ViewSphere._vector_components(plane_normals):
+            n_angles = []
+            for v_x, v_y, v_z, v_mag in view_comps:
+                cos_a = (v_x * n_x + v_y * n_y + v_z * n_z) / (v_mag * n_mag)
+                n_angles.append(acos(-1 if cos_a < -1 else 1 if cos_a > 1 else cos_a))
+            angles.append(n_angles)
+            mask_patterns.append([ang > max_angle for ang in n_angles])
+        return mask_patterns, angles
+
+    @staticmethod
+    def overhang_pattern_batch(plane_normals, overhang_angle, view_vectors):
+        """Get booleans for whether view vectors are blocked by the overhangs of planes.
+
+        This is equivalent to calling overhang_pattern for each plane normal but
+        the view vectors are only pre-processed once.
+
+        Args:
+            plane_normals: A list of Vector3D (or lists of 3 numbers) for the
+                normals of the planes.
+            overhang_angle: A number between 0 and 90 for the projection angle
+                of an overhang in degrees. This can also be a list of numbers
+                that align with the plane_normals.
+            view_vectors: A list of Vector3D (or lists of 3 numbers) for the view
+                vectors which will be evaluated to determine if they are blocked
+                by the overhang of each plane or not.
+
+        Returns:
+            A list of lists with one sub-list for each plane normal. Each sub-list
+            contains booleans for whether each of the view vectors are blocked by
+            the overhang (True) or not (False).
+        """
+        if isinstance(overhang_angle, (float, int)):
+            overhang_angle = [overhang_angle] * len(plane_normals)
+        view_comps = ViewSphere._vector_components(view_vectors)
+        mask_patterns = []
+        for norm, o_angle in zip(plane_normals, overhang_angle):
+            # the view vectors are blocked if they point into the overhang
+            overhang_norm = Vector3D(-norm[0], -norm[1], -norm[2])
+            rotation_axis = overhang_norm.rotate_xy(-math.pi / 2)
+            rotation_axis = Vector3D(rotation_axis.x, rotation_axis.y, 0)
+            o_x, o_y, o_z = overhang_norm.rotate(rotation_axis, math.radians(o_angle))
+            mask_patterns.append(
+                [v_x * o_x + v_y * o_y + v_z * o_z > 0
+                 for v_x, v_y, v_z, _ in view_comps])
+        return mask_patterns
+
+    @staticmethod
+    def fin_pattern_batch(plane_normals, left_fin_angle, right_fin_angle,
+                          view_vectors):
+        """Get booleans for whether view vectors are blocked by the fins of planes.
+
+        This is equivalent to calling fin_pattern for each plane normal but the
+        clockwise angle of each view vector from the Y-axis is computed only once
+        and each plane only requires a comparison against these angles.
+
+        Args:
+            plane_normals: A list of Vector3D (or lists of 3 numbers) for the
+                normals of the planes.
+            left_fin_angle: A number between 0 and 90 for the projection angle of a
+                fin on the left side in degrees. This can also be a list of numbers
+                that align with the plane_normals.
+            right_fin_angle: A number between 0 and 90 for the projection angle of a
+                fin on the right side in degrees. This can also be a list of numbers
+                that align with the plane_normals.
+            view_vectors: A list of Vector3D (or lists of 3 numbers) for the view
+                vectors which will be evaluated to determine if they are blocked
+                by the fins of each plane or not. Vectors that are perfectly
+                vertical are evaluated as if they point along the Y-axis.
+
+        Returns:
+            A list of lists with one sub-list for each plane normal. Each sub-list
+            contains booleans for whether each of the view vectors are blocked by
+            the fins (True) or not (False).
+        """
+        if isinstance(left_fin_angle, (float, int)):
+            left_fin_angle = [left_fin_angle] * len(plane_normals)
+        if isinstance(right_fin_angle, (float, int)):
+            right_fin_angle = [right_fin_angle] * len(plane_normals)
+
+        # compute the clockwise angle of each view vector from the Y-axis once
+        view_angles = [ViewSphere._clockwise_angle_2d(v[0], v[1])
+                       for v in view_vectors]
+
+        # evaluate the view angles in relation to the min and max angle of each plane
+        mask_patterns = []
+        for norm, l_ang, r_ang in zip(plane_normals, left_fin_angle, right_fin_angle):
+            srf_angle = ViewSphere._clockwise_angle_2d(norm[0], norm[1])
+            angle_min = srf_angle - 90 + r_ang if r_ang else srf_angle - 90
+            angle_max = srf_angle + 90 - l_ang if l_ang else srf_angle + 90
+            if angle_max > 360:
+                angle_max, angle_min = angle_max - 360, angle_min - 360
+            if angle_max < 0:
+                angle_max, angle_min = angle_max + 360, angle_min + 360
+            if angle_min > 0:
+                mask_patterns.append(
+                    [not angle_min < ang < angle_max for ang in view_angles])
+            else:
+                angle_min += 360
+                mask_patterns.append(
+                    [not (ang < angle_max or ang > angle_min) for ang in view_angles])
+        return mask_patterns
+
+    @staticmethod
+    def _vector_components(vectors):
+        """Get a list of (x, y, z, magnitude) tuples from a list of vectors."""
+        sqrt = math.sqrt
+        return [(v[0], v[1], v[2], sqrt(v[0] ** 2 + v[1] ** 2 + v[2] ** 2))
+                for v in vectors]
+
+    @staticmethod
+    def _clockwise_angle_2d(x, y):
+        """Get the clockwise angle in degrees between a 2D vector and the Y-axis.
+
+        This matches Vector2D.angle_clockwise(Vector2D(0, 1)) but it returns zero
+        for zero-length vectors instead of raising an exception.
+        """
+        mag = math.sqrt(x ** 2 + y ** 2)
+        if mag == 0:
+            return 0
+        cos_a = y / mag
+        inner = math.acos(-1 if cos_a < -1 else 1 if cos_a > 1 else cos_a)
+        return math.degrees(inner) if x <= 0 else math.degrees(2 * math.pi - inner)
+
+    @classmethod
+    def _cached_patches(cls, key):
+        """Get a value from the patch cache, returning None if it does not exist."""
+        with cls._patch_cache_lock:
+            try:
+                value = cls._patch_cache.pop(key)
+            except KeyError:
+                return None
+            cls._patch_cache[key] = value  # move the key to the most recently used end
+        return value
+
+    @classmethod
+    def _cache_patches(cls, key, value):
+        """Add a value to the patch cache, removing the least recently used ones."""
+        with cls._patch_cache_lock:
+            cls._patch_cache[key] = value
+            while len(cls._patch_cache) > cls.PATCH_CACHE_SIZE:
+                cls._patch_cache.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _copy_patches(patches):
+        """Get a copy of cached (patch_mesh, patch_vectors) that can be safely edited.
+
+        The vertices, faces and vectors are immutable and so they are shared with
+        the cache but a new Mesh3D is created so that edits to its properties
+        (eg. colors) do not affect the cached mesh. Properties that have been
+        computed for the cached mesh (eg. face_normals) are shared with the copy.
+        """
+        patch_mesh, patch_vectors = patches
+        return patch_mesh.duplicate(), patch_vectors
+
+    @classmethod
+    def _dome_patch_weights(cls, division_count):
+        """Get a tuple of area weights for each dome patch that average to 1."""
+        key = ('dome_weights', division_count)
+        weights = cls._cached_patches(key)
+        if weights is None:
+            patch_areas, _ = cls._dome_patch_areas(division_count)
+            avg_patch_area = 2 * math.pi / len(patch_areas)
+            weights = cls._cache_patches(
+                key, tuple(p_area / avg_patch_area for p_area in patch_areas))
+        return weights
+
     @staticmethod
     def _dome_radial_patch_areas(azimuth_count=72, altitude_count=18):
         """Get the area of each patch in a radial dome."""
@@ -3,6 +3,7 @@ from __future__ import division
 
 import math
 import os
+from array import array
 from copy import deepcopy
 
 from ladybug_geometry.geometry3d.pointvector import Vector3D
@@ -20,7 +21,7 @@ from .futil import write_to_file
 from .header import Header
 from .location import Location
 from .skymodel import ashrae_revised_clear_sky, ashrae_clear_sky, \
-    zhang_huang_solar_split, estimate_illuminance_from_irradiance
+    zhang_huang_solar_split, _illuminance_from_irradiance_series
 from .stat import STAT
 from .sunpath import Sunpath
 
@@ -201,23 +202,17 @@ class Wea(object):
         assert os.path.isfile(wea_file), 'Failed to find {}'.format(wea_file)
         with open(wea_file, readmode) as weaf:
             location = cls._parse_wea_header(weaf, wea_file)
-            # parse irradiance values
-            dir_norm_irr = []
-            dif_horiz_irr = []
-            dt_arr = []
-            for line in weaf:
-                vals = line.split()
-                dir_norm_irr.append(float(vals[-2]))
-                dif_horiz_irr.append(float(vals[-1]))
-                dt_arr.append([int(vals[0]), int(vals[1]), float(vals[2])])
+            months, days, hours, dir_norm_irr, dif_horiz_irr = \
+                cls._parse_wea_columns(weaf)
+        dir_norm_irr = list(map(float, dir_norm_irr))
+        dif_horiz_irr = list(map(float, dif_horiz_irr))
 
         # interpret datetimes to create data collections with correct analysis periods
         continuous = True
-        st_dt = DateTime.from_array([dt_arr[0][0], dt_arr[0][1], int(dt_arr[0][2])])
-        end_dt = DateTime.from_array([dt_arr[-1][0], dt_arr[-1][1], int(dt_arr[-1][2])])
-        if st_dt.leap_year is not is_leap_year:
-            st_dt = DateTime(st_dt.month, st_dt.day, st_dt.hour, is_leap_year)
-            end_dt = DateTime(end_dt.month, end_dt.day, end_dt.hour, is_leap_year)
+        st_dt = DateTime(int(months[0]), int(days[0]), int(float(hours[0])),
+                         leap_year=is_leap_year)
+        end_dt = DateTime(int(months[-1]), int(days[-1]), int(float(hours[-1])),
+                          leap_year=is_leap_year)
         a_per = AnalysisPeriod.from_start_end_datetime(st_dt, end_dt, timestep)
         if a_per.st_hour != 0 or a_per.end_hour != 23:  # potential continuous time slice
             continuous = False
@@ -233,13 +228,16 @@ class Wea(object):
             dni = HourlyContinuousCollection(dni_head, dir_norm_irr)
             dhi = HourlyContinuousCollection(dhi_head, dif_horiz_irr)
         else:
-            if timestep == 1:
-                datetimes = [DateTime(d[0], d[1], int(d[2])) for d in dt_arr]
-            else:
-                datetimes = []
-                for d in dt_arr:
-                    tim = Time.from_mod(int(d[2] * 60))
-                    datetimes.append(DateTime(d[0], d[1], tim.hour, tim.minute))
+            # the hour and minute of each unique time of day are only computed once
+            times = {}
+            for hr in set(hours):
+                if timestep == 1:
+                    times[hr] = (int(float(hr)), 0)
+                else:
+                    tim = Time.from_mod(int(float(hr) * 60))
+                    times[hr] = (tim.hour, tim.minute)
+            datetimes = [DateTime(int(m), int(d), *times[hr])
+                         for m, d, hr in zip(months, days, hours)]
             dni = HourlyDiscontinuousCollection(dni_head, dir_norm_irr, datetimes)
             dhi = HourlyDiscontinuousCollection(dhi_head, dif_horiz_irr, datetimes)
             dni = dni.validate_analysis_period()
@@ -267,13 +265,9 @@ class Wea(object):
         assert os.path.isfile(wea_file), 'Failed to find {}'.format(wea_file)
         with open(wea_file, readmode) as weaf:
             location = cls._parse_wea_header(weaf, wea_file)
-            # parse irradiance values
-            dir_norm_irr = []
-            dif_horiz_irr = []
-            for line in weaf:
-                dirn, difh = [int(v) for v in line.split()[-2:]]
-                dir_norm_irr.append(dirn)
-                dif_horiz_irr.append(difh)
+            dir_norm_irr, dif_horiz_irr = cls._parse_wea_columns(weaf)[-2:]
+        dir_norm_irr = list(map(int, dir_norm_irr))
+        dif_horiz_irr = list(map(int, dif_horiz_irr))
 
         # move the last half hour of data to the start of the file
         if timestep != 1:
@@ -550,6 +544,161 @@ class Wea(object):
         dhi = HourlyContinuousCollection(dhi_head, diff_ir)
         return cls(location, dni, dhi)
 
+    @classmethod
+    def from_ashrae_revised_clear_sky_batch(
+            cls, locations, monthly_tau_beam, monthly_tau_diffuse, timestep=1,
+            is_leap_year=False, use_2017=False, processes=1):
+        """Create a list of ASHRAE Revised Clear Sky Weas for several locations.
+
+        The results are the same as calling from_ashrae_revised_clear_sky for each
+        location. However, the solar altitudes are computed for all locations in
+        one batch and the computation can be distributed across several processes
+        for very large lists of locations.
+
+        Args:
+            locations: A list of Ladybug Location objects.
+            monthly_tau_beam: A list of 12 float values indicating the beam
+                optical depth of the sky at each month of the year, which will
+                be used for all locations. This can also be a list of lists
+                with one list of 12 values for each location.
+            monthly_tau_diffuse: A list of 12 float values indicating the
+                diffuse optical depth of the sky at each month of the year, which
+                will be used for all locations. This can also be a list of lists
+                with one list of 12 values for each location.
+            timestep: An optional integer to set the number of time steps per
+                hour. Default is 1 for one value per hour.
+            is_leap_year: A boolean to indicate if values are for a leap
+                year. (Default: False).
+            use_2017: A boolean to indicate whether the version of the ASHRAE Tau
+                model that should be the revised version published in 2017 (True)
+                or the original one published in 2009 (False). (Default: False).
+            processes: An integer for the number of processes across which the
+                locations will be distributed. Values above 1 use a multiprocessing
+                Pool, which is not available in IronPython. (Default: 1).
+
+        Returns:
+            A list of Wea objects that align with the input locations.
+        """
+        loc_count = len(locations)
+        tau_b = cls._batch_parameter(monthly_tau_beam, loc_count, True)
+        tau_d = cls._batch_parameter(monthly_tau_diffuse, loc_count, True)
+        params = [(t_b, t_d, use_2017) for t_b, t_d in zip(tau_b, tau_d)]
+        sky_values = cls._sky_model_batch(
+            'ashrae_revised_clear_sky', locations, params,
+            timestep, is_leap_year, None, processes)
+        return cls._annual_weas_from_batch(
+            locations, sky_values, timestep, is_leap_year)
+
+    @classmethod
+    def from_ashrae_clear_sky_batch(cls, locations, sky_clearness=1, timestep=1,
+                                    is_leap_year=False, processes=1):
+        """Create a list of original ASHRAE Clear Sky Weas for several locations.
+
+        The results are the same as calling from_ashrae_clear_sky for each
+        location. However, the solar altitudes are computed for all locations in
+        one batch and the computation can be distributed across several processes
+        for very large lists of locations.
+
+        Args:
+            locations: A list of Ladybug Location objects.
+            sky_clearness: A factor that will be multiplied by the output of
+                the model. This can also be a list of factors that align with
+                the locations. See the from_ashrae_clear_sky method for
+                more information. (Default: 1).
+            timestep: An optional integer to set the number of time steps per
+                hour. Default is 1 for one value per hour.
+            is_leap_year: A boolean to indicate if values are for a leap
+                year. (Default: False).
+            processes: An integer for the number of processes across which the
+                locations will be distributed. Values above 1 use a multiprocessing
+                Pool, which is not available in IronPython. (Default: 1).
+
+        Returns:
+            A list of Wea objects that align with the input locations.
+        """
+        params = [(clr,) for clr in cls._batch_parameter(sky_clearness, len(locations))]
+        sky_values = cls._sky_model_batch(
+            'ashrae_clear_sky', locations, params, timestep, is_leap_year,
+            None, processes)
+        return cls._annual_weas_from_batch(
+            locations, sky_values, timestep, is_leap_year)
+
+    @classmethod
+    def from_zhang_huang_solar_batch(
+            cls, locations, cloud_cover, relative_humidity, dry_bulb_temperature,
+            wind_speed, atmospheric_pressure=None, use_disc=False, processes=1):
+        """Create a list of Weas for several locations using the Zhang-Huang model.
+
+        The results are the same as calling from_zhang_huang_solar for each
+        location. However, the solar altitudes are computed for all locations in
+        one batch and the computation can be distributed across several processes
+        for very large lists of locations.
+
+        Args:
+            locations: A list of Ladybug Location objects.
+            cloud_cover: A list of hourly continuous data collections with values
+                for the fraction of the sky dome covered in clouds. There should
+                be one collection for each location.
+            relative_humidity: A list of hourly continuous data collections with
+                values for the relative humidity in percent that align with
+                the locations.
+            dry_bulb_temperature: A list of hourly continuous data collections with
+                values for the dry bulb temperature in degrees Celsius that align
+                with the locations.
+            wind_speed: A list of hourly continuous data collections with values
+                for the wind speed in meters per second that align with the locations.
+            atmospheric_pressure: An optional list of hourly continuous data
+                collections with values for the atmospheric pressure in Pa that
+                align with the locations. If None, pressure at sea level will be
+                used (101325 Pa). (Default: None)
+            use_disc: Boolean to note whether the original DISC model as opposed to the
+                newer and more accurate DIRINT model. (Default: False).
+            processes: An integer for the number of processes across which the
+                locations will be distributed. Values above 1 use a multiprocessing
+                Pool, which is not available in IronPython. (Default: 1).
+
+        Returns:
+            A list of Wea objects that align with the input locations.
+        """
+        # check that all of the input collections are aligned with one another
+        loc_count = len(locations)
+        if atmospheric_pressure is None:
+            atmospheric_pressure = [None] * loc_count
+        all_colls = (cloud_cover, relative_humidity, dry_bulb_temperature,
+                     wind_speed, atmospheric_pressure)
+        for colls in all_colls:
+            assert len(colls) == loc_count, 'Number of input data collections ' \
+                '({}) does not match the number of locations ({}).'.format(
+                    len(colls), loc_count)
+        base_coll, params = cloud_cover[0], []
+        for cc, rh, db, ws, ap in zip(*all_colls):
+            colls = (cc, rh, db, ws) if ap is None else (cc, rh, db, ws, ap)
+            for coll in colls:
+                assert isinstance(coll, HourlyContinuousCollection), 'Input data ' \
+                    'for Zhang-Huang Wea must be an hourly continuous. ' \
+                    'Got {}.'.format(type(coll))
+            assert base_coll.are_collections_aligned(colls), 'Zhang-Huang Wea ' \
+                'input data collections must be aligned with one another.'
+            ap_values = None if ap is None else ap.values
+            params.append((cc.values, rh.values, db.values, ws.values,
+                           ap_values, use_disc))
+
+        # compute the irradiance and assemble the results into Weas
+        a_per = base_coll.header.analysis_period
+        sky_values = cls._sky_model_batch(
+            'zhang_huang', locations, params, a_per.timestep, a_per.is_leap_year,
+            a_per.to_dict(), processes)
+        weas = []
+        for location, (dir_ir, diff_ir) in zip(locations, sky_values):
+            metadata = {'source': location.source, 'country': location.country,
+                        'city': location.city}
+            dni_head = Header(DirectNormalIrradiance(), 'W/m2', a_per, metadata)
+            dhi_head = Header(DiffuseHorizontalIrradiance(), 'W/m2', a_per, metadata)
+            dni = HourlyContinuousCollection(dni_head, list(dir_ir))
+            dhi = HourlyContinuousCollection(dhi_head, list(diff_ir))
+            weas.append(cls(location, dni, dhi))
+        return weas
+
     @property
     def enforce_on_hour(self):
         """Get or set a boolean for whether datetimes occur on the hour.
@@ -668,13 +817,7 @@ class Wea(object):
                             unit='W/m2',
                             analysis_period=self.analysis_period,
                             metadata=self.metadata)
-        glob_horiz = []
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
-        for dt, dnr, dhr in zip(self.datetimes, self.direct_normal_irradiance,
-                                self.diffuse_horizontal_irradiance):
-            sun = sp.calculate_sun_from_date_time(dt)
-            glob_horiz.append(dhr + dnr * math.sin(math.radians(sun.altitude)))
+        glob_horiz = self._global_horizontal_values(self._sun_altitudes())
         return self._aligned_collection(header_ghr, glob_horiz)
 
     @property
@@ -915,7 +1058,7 @@ class Wea(object):
         return total_irradiance, direct_irradiance, \
             diffuse_irradiance, reflected_irradiance
 
-    def estimate_illuminance_components(self, dew_point):
+    def estimate_illuminance_components(self, dew_point, altitudes=None):
         """Get estimated direct, diffuse, and global illuminance from this Wea.
 
         Note that this method should only be used when there are no measured
@@ -931,6 +1074,12 @@ class Wea(object):
         Args:
             dew_point: A data collection of dewpoint temperature in degrees C. This
                 data collection must align with the irradiance data on this object.
+            altitudes: An optional list of solar altitudes in degrees that align
+                with the irradiance data on this object. This can be used to avoid
+                recomputing the positions of the sun when they are already known,
+                such as when several Weas share the same location and datetimes.
+                If None, the altitudes will be computed from the Wea location
+                and datetimes. (Default: None).
 
         Returns:
             A tuple with four elements
@@ -949,19 +1098,19 @@ class Wea(object):
         assert dew_point.is_collection_aligned(self.direct_normal_irradiance), \
             'Input dew_point data must be aligned with the irradiance on the Wea.'
 
+        if altitudes is None:
+            altitudes = self._sun_altitudes()
+        else:
+            assert len(altitudes) == len(self), 'Length of input altitudes ({}) does ' \
+                'not match the length of the Wea data ({}).'.format(
+                    len(altitudes), len(self))
+
         # calculate illuminance values
-        sp = Sunpath.from_location(self.location)
-        sp.is_leap_year = self.is_leap_year
-        gh_ill_values, dn_ill_values, dh_ill_values, zen_lum_values = [], [], [], []
-        for dt, dp, ghi, dni, dhi in zip(
-                self.datetimes, dew_point, self.global_horizontal_irradiance,
-                self.direct_normal_irradiance, self.diffuse_horizontal_irradiance):
-            alt = sp.calculate_sun_from_date_time(dt).altitude
-            gh, dn, dh, z = estimate_illuminance_from_irradiance(alt, ghi, dni, dhi, dp)
-            gh_ill_values.append(gh)
-            dn_ill_values.append(dn)
-            dh_ill_values.append(dh)
-            zen_lum_values.append(z)
+        gh_ill_values, dn_ill_values, dh_ill_values, zen_lum_values = \
+            _illuminance_from_irradiance_series(
+                altitudes, self._global_horizontal_values(altitudes),
+                self.direct_normal_irradiance.values,
+                self.diffuse_horizontal_irradiance.values, dew_point.values)
 
         # create data collection headers for the results
         gh_ill_head = Header(GlobalHorizontalIlluminance(), 'lux',
@@ -998,13 +1147,15 @@ class Wea(object):
 
     def to_file_string(self):
         """Get a text string for the entirety of the Wea file contents."""
-        lines = [self.header]
-        for dir_rad, dif_rad, dt in zip(self.direct_normal_irradiance,
-                                        self.diffuse_horizontal_irradiance,
-                                        self.datetimes):
-            line = "%d %d %.3f %d %d\n" \
-                % (dt.month, dt.day, dt.float_hour, dir_rad, dif_rad)
-            lines.append(line)
+        # format each column of the file as text
+        shift = 0.5 if self.timestep == 1 and not self._enforce_on_hour else 0
+        dt_strs = self._datetime_strings(self.direct_normal_irradiance.datetimes, shift)
+        dir_strs = self._irradiance_strings(self._direct_normal_irradiance._values)
+        dif_strs = self._irradiance_strings(self._diffuse_horizontal_irradiance._values)
+        dif_strs = [val + '\n' for val in dif_strs]
+        # join the columns into the lines of the file
+        lines = [' '.join(line) for line in zip(dt_strs, dir_strs, dif_strs)]
+        lines.insert(0, self.header)
         return ''.join(lines)
 
     def write(self, file_path, write_hours=False):
@@ -1075,9 +1226,27 @@ class Wea(object):
             integer for the number of timesteps in the Wea.
         """
         assert os.path.isfile(wea_file), 'Failed to find {}'.format(wea_file)
+        # the file is read with the same line endings as readlines but in chunks
+        count, last_char = 0, '\n'
         with open(wea_file, readmode) as weaf:
-            count = len(weaf.readlines()) - 6
-        return count
+            for chunk in iter(lambda: weaf.read(1048576), ''):
+                count += chunk.count('\n')
+                last_char = chunk[-1:]
+        if last_char != '\n':  # last line without a line break
+            count += 1
+        return count - 6
+
+    def _sun_altitudes(self):
+        """Get a list of solar altitudes in degrees that align with the Wea datetimes."""
+        sp = Sunpath.from_location(self.location)
+        sp.is_leap_year = self.is_leap_year
+        return [sp.calculate_sun_from_date_time(dt).altitude for dt in self.datetimes]
+
+    def _global_horizontal_values(self, altitudes):
+        """Get a list of global horizontal irradiance values from solar altitudes."""
+        return [dhr + dnr * math.sin(math.radians(alt)) for alt, dnr, dhr in zip(
+            altitudes, self.direct_normal_irradiance.values,
+            self.diffuse_horizontal_irradiance.values)]
 
     def _aligned_collection(self, header, values):
         """Process a header and values into a collection aligned with Wea data."""
@@ -1087,6 +1256,66 @@ class Wea(object):
             dts = self.direct_normal_irradiance.datetimes
             return HourlyDiscontinuousCollection(header, values, dts)
 
+    @staticmethod
+    def _batch_parameter(value, loc_count, is_list=False):
+        """Get a list of parameters aligned with locations from a single or list input.
+
+        Args:
+            value: A single parameter or a list of parameters with one for
+                each location.
+            loc_count: An integer for the number of locations.
+            is_list: Boolean to note whether a single parameter is itself a list
+                of values (eg. monthly optical depths). (Default: False).
+        """
+        is_single = not isinstance(value[0], (list, tuple)) if is_list else \
+            not isinstance(value, (list, tuple))
+        if is_single:
+            return [value] * loc_count
+        assert len(value) == loc_count, 'Number of input parameters ({}) does ' \
+            'not match the number of locations ({}).'.format(len(value), loc_count)
+        return value
+
+    @staticmethod
+    def _sky_model_batch(model, locations, params, timestep, is_leap_year,
+                         a_per_dict, processes):
+        """Get irradiance values for several locations, optionally using a Pool.
+
+        The locations are split into contiguous chunks such that each process
+        can reuse the solar geometry for locations sharing the same time zone.
+        """
+        if processes <= 1 or len(locations) < 2:
+            return _sky_model_batch_values(
+                (model, locations, params, timestep, is_leap_year, a_per_dict))
+
+        # send locations as dictionaries and data as arrays to keep transfers small
+        import multiprocessing
+        loc_dicts = [loc.to_dict() for loc in locations]
+        if model == 'zhang_huang':
+            params = [tuple(p if p is None or isinstance(p, bool) else array('d', p)
+                            for p in param) for param in params]
+        chunk = int(math.ceil(len(locations) / (processes * 4)))
+        args = [(model, loc_dicts[i:i + chunk], params[i:i + chunk], timestep,
+                 is_leap_year, a_per_dict) for i in xrange(0, len(locations), chunk)]
+        pool = multiprocessing.Pool(processes)
+        try:
+            results = pool.map(_sky_model_batch_values, args)
+        finally:
+            pool.close()
+            pool.join()
+        return [values for chunk_values in results for values in chunk_values]
+
+    @classmethod
+    def _annual_weas_from_batch(cls, locations, sky_values, timestep, is_leap_year):
+        """Get a list of annual Weas from the results of _sky_model_batch."""
+        weas = []
+        for location, (dir_ir, diff_ir) in zip(locations, sky_values):
+            metadata = {'source': location.source, 'country': location.country,
+                        'city': location.city}
+            direct_norm_rad, diffuse_horiz_rad = cls._get_data_collections(
+                list(dir_ir), list(diff_ir), metadata, timestep, is_leap_year)
+            weas.append(cls(location, direct_norm_rad, diffuse_horiz_rad))
+        return weas
+
     @staticmethod
     def _get_datetimes(timestep, is_leap_year):
         """Get a list of annual datetimes based on timestep.
@@ -1140,6 +1369,62 @@ class Wea(object):
         weaf.readline()  # pass line for weather data units
         return location
 
+    @staticmethod
+    def _datetime_strings(datetimes, shift=0):
+        """Get a list of text for the month, day and hour of datetimes in a wea file.
+
+        The text of each day and time of day is only formatted once.
+
+        Args:
+            datetimes: A list of datetimes to be formatted.
+            shift: A number of hours to be added to the hour of each datetime,
+                which is used to write hourly data at the middle of each hour.
+        """
+        day_strs, time_strs, dt_strs = {}, {}, []
+        for dt in datetimes:
+            month_day, hour_min = (dt.month, dt.day), (dt.hour, dt.minute)
+            try:
+                day_str = day_strs[month_day]
+            except KeyError:
+                day_str = day_strs[month_day] = '%d %d ' % month_day
+            try:
+                time_str = time_strs[hour_min]
+            except KeyError:
+                time_str = time_strs[hour_min] = \
+                    '%.3f' % (hour_min[0] + hour_min[1] / 60.0 + shift)
+            dt_strs.append(day_str + time_str)
+        return dt_strs
+
+    @staticmethod
+    def _irradiance_strings(values):
+        """Get a list of text for irradiance values, formatting repeated values once."""
+        formatted, val_strs = {}, []
+        for val in values:
+            try:
+                val_strs.append(formatted[val])
+            except KeyError:
+                formatted[val] = val_str = '%d' % val
+                val_strs.append(val_str)
+        return val_strs
+
+    @staticmethod
+    def _parse_wea_columns(weaf):
+        """Parse the columns of text below the header of a wea given the file object.
+
+        Returns:
+            A tuple with five lists of text for the months, days, hours, direct
+            normal irradiance and diffuse horizontal irradiance of the wea.
+        """
+        text = weaf.read()
+        lines, values = text.split('\n'), text.split()
+        if len(values) == 5 * (len(lines) - lines.count('')):
+            # every line has the five standard columns and the values can be sliced
+            return tuple(values[i::5] for i in range(5))
+        # lines have different numbers of values and so each line is split
+        rows = [line.split() for line in lines]
+        rows = [row for row in rows if row]  # remove any blank lines
+        return tuple([row[i] for row in rows] for i in (0, 1, 2, -2, -1))
+
     def ToString(self):
         """Overwrite .NET ToString."""
         return self.__repr__()
@@ -1178,3 +1463,73 @@ class Wea(object):
     def __repr__(self):
         """Wea object representation."""
         return "WEA [%s]" % self.location.city
+
+
+def _sky_model_batch_values(args):
+    """Get direct normal and diffuse horizontal irradiance for several locations.
+
+    This function is at the module level so that it can be used by a process Pool.
+
+    Args:
+        args: A tuple with six elements.
+
+        -   model: Text for the sky model. Choose from ashrae_clear_sky,
+            ashrae_revised_clear_sky and zhang_huang.
+
+        -   locations: A list of Ladybug Locations or Location dictionaries.
+
+        -   params: A list of tuples with the sky model inputs for each location.
+
+        -   timestep: An integer for the number of timesteps per hour.
+
+        -   is_leap_year: A boolean to indicate if values are for a leap year.
+
+        -   a_per_dict: An AnalysisPeriod dictionary for the datetimes of the
+            zhang_huang input data. None for the other models.
+
+    Returns:
+        A list with a tuple for each location. Each tuple has two arrays of
+        direct normal irradiance and diffuse horizontal irradiance.
+    """
+    model, locations, params, timestep, is_leap_year, a_per_dict = args
+    locations = [Location.from_dict(loc) if isinstance(loc, dict) else loc
+                 for loc in locations]
+    if a_per_dict is None:
+        datetimes = Wea._get_datetimes(timestep, is_leap_year)
+    else:
+        datetimes = AnalysisPeriod.from_dict(a_per_dict).datetimes
+    altitudes = Sunpath.calculate_sun_altitudes_batch(
+        locations, datetimes, is_leap_year)
+
+    sky_values = []
+    if model == 'zhang_huang':
+        doys = [dt.doy for dt in datetimes]
+        shift = 3 * timestep
+        for alts, param in zip(altitudes, params):
+            cloud, rel_h, dry_bulb, wind, pressure, use_disc = param
+            dry_bulb_t3_hrs = [dry_bulb[i - shift] for i in xrange(len(dry_bulb))]
+            if pressure is None:
+                pressure = [101325] * len(cloud)
+            dir_ir, diff_ir = zhang_huang_solar_split(
+                alts, doys, cloud, rel_h, dry_bulb, dry_bulb_t3_hrs, wind,
+                pressure, use_disc)
+            sky_values.append((array('d', dir_ir), array('d', diff_ir)))
+        return sky_values
+
+    months = [dt.month - 1 for dt in datetimes]
+    for alts, param in zip(altitudes, params):
+        alts_by_month = [[] for i in range(12)]
+        for month, alt in zip(months, alts):
+            alts_by_month[month].append(alt)
+        direct_norm, diffuse_horiz = array('d'), array('d')
+        for i_mon, alt_list in enumerate(alts_by_month):
+            if model == 'ashrae_clear_sky':
+                dir_norm_rad, dif_horiz_rad = ashrae_clear_sky(
+                    alt_list, i_mon + 1, param[0])
+            else:
+                dir_norm_rad, dif_horiz_rad = ashrae_revised_clear_sky(
+                    alt_list, param[0][i_mon], param[1][i_mon], param[2])
+            direct_norm.extend(dir_norm_rad)
+            diffuse_horiz.extend(dif_horiz_rad)
+        sky_values.append((direct_norm, diffuse_horiz))
+    return sky_values
@@ -0,0 +1,679 @@
+# coding=utf-8
+"""Utilities for loading libraries of weather files across several processes."""
+from __future__ import division
+
+import os
+import math
+import json
+from array import array
+
+from .location import Location
+from .epw import EPW
+from .stat import STAT
+from .ddy import DDY
+from .wea import Wea
+
+try:
+    from itertools import izip as zip  # python 2
+except ImportError:
+    xrange = range  # python 3
+
+WEATHER_FILE_TYPES = ('epw', 'stat', 'ddy', 'wea')
+
+
+def weather_files(folder, file_types=WEATHER_FILE_TYPES, recursive=False):
+    """Get a sorted list of paths to all weather files within a folder.
+
+    Args:
+        folder: Text for the path to a folder of weather files.
+        file_types: A list of text for the extensions of the weather files to
+            be included. (Default: ('epw', 'stat', 'ddy', 'wea')).
+        recursive: Boolean to note whether the weather files in all sub-folders
+            of the folder should also be included. (Default: False).
+
+    Returns:
+        A list of paths to the weather files in the folder.
+    """
+    assert os.path.isdir(folder), 'No folder was found at {}'.format(folder)
+    extensions = tuple('.{}'.format(f_type.lower().lstrip('.'))
+                       for f_type in file_types)
+    if recursive:
+        file_paths = [os.path.join(root, f) for root, _, files in os.walk(folder)
+                      for f in files if f.lower().endswith(extensions)]
+    else:
+        file_paths = [os.path.join(folder, f) for f in os.listdir(folder)
+                      if f.lower().endswith(extensions)
+                      and os.path.isfile(os.path.join(folder, f))]
+    return sorted(file_paths)
+
+
+def load_weather_files(file_paths, header_only=False, processes=None,
+                       batch_size=None, progress=None, skip_errors=False):
+    """Load EPW, STAT, DDY and WEA files in parallel across a pool of processes.
+
+    The files are loaded in batches and each loaded object is yielded as soon as
+    it is available such that only one batch of files is held in memory at
+    a time when the objects are processed as they are yielded. The hourly data
+    of the files is sent back from the processes as compact arrays of numbers.
+
+    Args:
+        file_paths: A list of paths to .epw, .stat, .ddy and/or .wea files.
+        header_only: Boolean to note whether only the header of EPW files should
+            be loaded, which includes the location, design conditions and typical
+            weeks but not the hourly data. All other file types are always loaded
+            in full. (Default: False).
+        processes: An integer for the number of processes across which the
+            files will be loaded. If None, the number of CPUs of the machine will
+            be used. If 1, the files will be loaded in the current process
+            without starting a process pool. (Default: None).
+        batch_size: An integer for the number of files to be loaded in each batch.
+            Larger batches reduce the time that processes wait for one another
+            at the cost of holding more files in memory. If None, it will be
+            four times the number of processes. (Default: None).
+        progress: An optional function to report progress, which will be called
+            after each file is loaded with three arguments: the number of files
+            loaded so far, the total number of files and the path to the file
+            that was just loaded. (Default: None).
+        skip_errors: Boolean to note whether files that fail to load should be
+            skipped instead of raising a ValueError. The loaded object of these
+            files will be None. (Default: False).
+
+    Returns:
+        A generator of (file_path, weather_object) tuples in the order of the
+        input file_paths. The weather_object is an EPW, STAT, DDY or Wea.
+
+    Usage:
+
+    .. code-block:: python
+
+        from ladybug.weatherlibrary import weather_files, load_weather_files
+
+        epw_files = weather_files('C:/ladybug/weather', ('epw',))
+        for file_path, epw in load_weather_files(epw_files, header_only=True):
+            print(epw.location.city, epw.ashrae_climate_zone)
+    """
+    file_paths = list(file_paths)
+    total = len(file_paths)
+    if processes is None:
+        import multiprocessing
+        processes = multiprocessing.cpu_count()
+    processes = max(int(processes), 1)
+    batch_size = int(batch_size) if batch_size is not None else processes * 4
+    assert batch_size > 0, 'Weather file batch_size must be greater than 0.'
+
+    pool = None
+    if processes > 1 and total > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(min(processes, total))
+    try:
+        loaded_count = 0
+        for st_i in xrange(0, total, batch_size):
+            batch = file_paths[st_i:st_i + batch_size]
+            args = [(f_path, header_only, pool is not None) for f_path in batch]
+            if pool is None:
+                results = (_load_weather_file(arg) for arg in args)
+            else:
+                chunk = int(math.ceil(len(args) / (processes * 2)))
+                results = pool.imap(_load_weather_file, args, chunk)
+            for (f_path, _, _), (w_obj, packed, error) in zip(args, results):
+                loaded_count += 1
+                if error is not None:
+                    if not skip_errors:
+                        raise ValueError(
+                            'Failed to load weather file {}:\n{}'.format(f_path, error))
+                elif packed is not None:
+                    _unpack_collections(w_obj, packed)
+                if progress is not None:
+                    progress(loaded_count, total, f_path)
+                yield f_path, w_obj
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+def load_weather_library(folder, file_types=WEATHER_FILE_TYPES, recursive=False,
+                         header_only=False, processes=None, batch_size=None,
+                         progress=None, skip_errors=False):
+    """Load all weather files within a folder in parallel across a pool of processes.
+
+    Args:
+        folder: Text for the path to a folder of weather files.
+        file_types: A list of text for the extensions of the weather files to
+            be loaded. (Default: ('epw', 'stat', 'ddy', 'wea')).
+        recursive: Boolean to note whether the weather files in all sub-folders
+            of the folder should also be loaded. (Default: False).
+        header_only: Boolean to note whether only the header of EPW files should
+            be loaded. (Default: False).
+        processes: An integer for the number of processes across which the
+            files will be loaded. If None, the number of CPUs of the machine will
+            be used. (Default: None).
+        batch_size: An integer for the number of files to be loaded in each batch.
+            If None, it will be four times the number of processes. (Default: None).
+        progress: An optional function to report progress, which will be called
+            after each file is loaded with the number of files loaded so far, the
+            total number of files and the path to the loaded file. (Default: None).
+        skip_errors: Boolean to note whether files that fail to load should be
+            skipped instead of raising a ValueError. (Default: False).
+
+    Returns:
+        A generator of (file_path, weather_object) tuples for the files in the
+        folder, sorted by file path.
+    """
+    file_paths = weather_files(folder, file_types, recursive)
+    return load_weather_files(file_paths, header_only, processes, batch_size,
+                              progress, skip_errors)
+
+
+class StationIndex(object):
+    """A spatial index of the weather stations across a folder of EPW and STAT files.
+
+    The index stores the Location of each station, read from the header of its
+    .epw file (or the .stat file when there is no .epw), along with the ASHRAE
+    climate zone from its .stat file. Files of the same station are matched by
+    their name without the extension. Stations are binned into a grid of cubes
+    over their unit vectors on the sphere such that the nearest stations to a
+    point or the stations within a radius of a point can be found by only
+    checking the stations of the cells around the point. The index can be
+    written to a JSON file and updated as files are added to the folder.
+
+    Args:
+        folder: Text for the path to a folder containing .epw and/or .stat files.
+        recursive: Boolean to note whether files in all sub-folders of the
+            folder should also be indexed. (Default: False).
+        processes: An integer for the number of processes across which the files
+            will be loaded. Set to None to use all of the CPUs of the machine.
+            (Default: 1).
+
+    Properties:
+        * folder
+        * recursive
+        * stations
+    """
+    __slots__ = ('_folder', '_recursive', '_stations', '_points', '_grid')
+
+    EARTH_RADIUS = 6371.0  # mean radius of the earth in kilometers
+    GRID_SIZE = 0.02  # size of the grid cells in unit sphere distance (~127 km)
+
+    def __init__(self, folder, recursive=False, processes=1):
+        assert os.path.isdir(folder), 'No folder was found at {}'.format(folder)
+        self._folder = os.path.abspath(folder)
+        self._recursive = bool(recursive)
+        self._stations = {}
+        self._points = {}
+        self._grid = {}
+        self.update(processes)
+
+    @classmethod
+    def from_dict(cls, data, folder=None):
+        """Create a StationIndex from a dictionary.
+
+        Args:
+            data: A python dictionary in the following format
+            folder: Optional text for the path to the folder of weather files,
+                which can be used if the folder has moved since the index was
+                created. If None, the folder in the dictionary will be used.
+                (Default: None).
+
+        .. code-block:: python
+
+            {
+            "type": "StationIndex",
+            "folder": "C:/ladybug/weather",
+            "recursive": False,
+            "stations": {
+                "chicago": {  # file path relative to the folder without extension
+                    "extensions": [".epw", ".stat"],  # station files in the folder
+                    "modified": 1579620000.0,  # time that a file was last modified
+                    "location": {},  # ladybug Location schema
+                    "climate_zone": "5A"  # ASHRAE climate zone or None
+                    }
+                }
+            }
+        """
+        assert data['type'] == 'StationIndex', \
+            'Expected StationIndex dictionary. Got {}.'.format(data['type'])
+        index = cls.__new__(cls)
+        index._folder = os.path.abspath(folder) if folder else data['folder']
+        index._recursive = data['recursive']
+        index._stations = {}
+        index._points = {}
+        index._grid = {}
+        for name, entry in data['stations'].items():
+            index._add_station(name, entry)
+        return index
+
+    @classmethod
+    def from_file(cls, file_path, folder=None):
+        """Load a StationIndex from a JSON file written with the write method.
+
+        Args:
+            file_path: Text for the path to a JSON file of a StationIndex.
+            folder: Optional text for the path to the folder of weather files,
+                which can be used if the folder has moved since the index was
+                created. If None, the folder in the file will be used.
+                (Default: None).
+        """
+        with open(file_path, 'r') as fp:
+            data = json.load(fp)
+        return cls.from_dict(data, folder)
+
+    @property
+    def folder(self):
+        """Get the path to the folder of weather files."""
+        return self._folder
+
+    @property
+    def recursive(self):
+        """Get a boolean for whether sub-folders of the folder are indexed."""
+        return self._recursive
+
+    @property
+    def stations(self):
+        """Get a tuple of IndexedStation for all stations in the index."""
+        return tuple(self._indexed_station(name) for name in sorted(self._stations))
+
+    def update(self, processes=1):
+        """Update the index to match the current .epw and .stat files in the folder.
+
+        Only the stations with files that have been added or modified since they
+        were last indexed are loaded and stations without files are removed.
+
+        Args:
+            processes: An integer for the number of processes across which the
+                files will be loaded. Set to None to use all of the CPUs of
+                the machine. (Default: 1).
+
+        Returns:
+            The number of stations that were (re)indexed.
+        """
+        # group the weather files in the folder by station
+        station_files = {}
+        for file_path in weather_files(self._folder, ('epw', 'stat'), self._recursive):
+            name, ext = os.path.splitext(os.path.relpath(file_path, self._folder))
+            station_files.setdefault(name, []).append(ext.lower())
+
+        # determine which stations are new, modified or removed
+        to_load = []
+        for name, extensions in station_files.items():
+            extensions.sort()
+            modified = max(os.path.getmtime(self._file_path(name, ext))
+                           for ext in extensions)
+            entry = self._stations.get(name)
+            if entry is not None and entry['modified'] == modified and \
+                    entry['extensions'] == extensions:
+                continue
+            to_load.append((name, extensions, modified))
+        for name in set(self._stations) - set(station_files):
+            self._remove_station(name)
+
+        # load the header of each new station file, keeping only the indexed fields
+        file_paths = []
+        for name, extensions, _ in to_load:
+            file_paths.extend(self._file_path(name, ext) for ext in extensions)
+        locations, climate_zones = {}, {}
+        for f_path, w_obj in load_weather_files(
+                file_paths, True, processes, skip_errors=True):
+            if w_obj is None:  # not a valid weather file
+                continue
+            locations[f_path] = w_obj.location.to_dict()
+            if isinstance(w_obj, STAT):
+                climate_zones[f_path] = w_obj.ashrae_climate_zone
+        indexed_count = 0
+        for name, extensions, modified in to_load:
+            self._remove_station(name)
+            epw_path = self._file_path(name, '.epw')
+            stat_path = self._file_path(name, '.stat')
+            location = locations.get(epw_path, locations.get(stat_path))
+            if location is None:  # not a valid weather file
+                continue
+            self._add_station(name, {
+                'extensions': extensions,
+                'modified': modified,
+                'location': location,
+                'climate_zone': climate_zones.get(stat_path)
+            })
+            indexed_count += 1
+        return indexed_count
+
+    def nearest(self, latitude, longitude, count=1):
+        """Get the stations in the index that are nearest to a point on the earth.
+
+        Args:
+            latitude: A number for the latitude of the point in degrees.
+            longitude: A number for the longitude of the point in degrees.
+            count: An integer for the number of stations to be returned. (Default: 1).
+
+        Returns:
+            A list of IndexedStation sorted from the nearest to the farthest
+            station. The distance property of each IndexedStation will be the
+            distance from the point in kilometers.
+        """
+        point = self._unit_vector(latitude, longitude)
+        chord = self.GRID_SIZE
+        while True:  # expand the search until enough stations are found
+            matches = self._stations_within(point, chord)
+            if len(matches) >= count or chord >= 2:
+                break
+            chord *= 2
+        return [self._indexed_station(name, dist) for dist, name in matches[:count]]
+
+    def within(self, latitude, longitude, radius):
+        """Get the stations in the index that are within a radius of a point.
+
+        Args:
+            latitude: A number for the latitude of the point in degrees.
+            longitude: A number for the longitude of the point in degrees.
+            radius: A number for the distance from the point in kilometers.
+
+        Returns:
+            A list of IndexedStation sorted from the nearest to the farthest
+            station. The distance property of each IndexedStation will be the
+            distance from the point in kilometers.
+        """
+        point = self._unit_vector(latitude, longitude)
+        angle = min(radius / self.EARTH_RADIUS, math.pi)
+        matches = self._stations_within(point, 2 * math.sin(angle / 2))
+        return [self._indexed_station(name, dist) for dist, name in matches]
+
+    def to_dict(self):
+        """Get StationIndex as a dictionary."""
+        return {
+            'type': 'StationIndex',
+            'folder': self._folder,
+            'recursive': self._recursive,
+            'stations': self._stations
+        }
+
+    def write(self, file_path):
+        """Write the StationIndex to a JSON file, which can be loaded with from_file.
+
+        Args:
+            file_path: Text for the full path to where the JSON file will be written.
+
+        Returns:
+            The path to the written file.
+        """
+        with open(file_path, 'w') as fp:
+            json.dump(self.to_dict(), fp)
+        return file_path
+
+    def _stations_within(self, point, chord):
+        """Get a sorted list of (distance, name) for stations within a chord of a point.
+
+        The chord is the straight-line distance between two points on a unit sphere.
+        """
+        size, grid, points = self.GRID_SIZE, self._grid, self._points
+        ranges = [range(int(math.floor((v - chord) / size)),
+                        int(math.floor((v + chord) / size)) + 1) for v in point]
+        cell_count = len(ranges[0]) * len(ranges[1]) * len(ranges[2])
+        if cell_count > len(grid):  # faster to check all occupied cells
+            cells = list(grid)
+        else:
+            cells = [(i, j, k) for i in ranges[0] for j in ranges[1]
+                     for k in ranges[2] if (i, j, k) in grid]
+
+        chord_sq, matches = chord * chord + 1e-12, []
+        for cell in cells:
+            # skip cells where the nearest corner is farther than the chord
+            box_dist = 0
+            for v, c in zip(point, cell):
+                d = max(c * size - v, 0, v - (c + 1) * size)
+                box_dist += d * d
+            if box_dist > chord_sq:
+                continue
+            for name in grid[cell]:
+                pt = points[name]
+                dist = (pt[0] - point[0]) ** 2 + (pt[1] - point[1]) ** 2 + \
+                    (pt[2] - point[2]) ** 2
+                if dist <= chord_sq:
+                    matches.append((dist, name))
+        matches.sort()
+        to_km = 2 * self.EARTH_RADIUS
+        return [(to_km * math.asin(min(math.sqrt(d) / 2, 1)), name)
+                for d, name in matches]
+
+    def _add_station(self, name, entry):
+        """Add a station entry to the index and its grid."""
+        loc = entry['location']
+        point = self._unit_vector(loc['latitude'], loc['longitude'])
+        cell = tuple(int(math.floor(v / self.GRID_SIZE)) for v in point)
+        self._stations[name] = entry
+        self._points[name] = point
+        self._grid.setdefault(cell, []).append(name)
+
+    def _remove_station(self, name):
+        """Remove a station from the index and its grid if it exists."""
+        if name not in self._stations:
+            return
+        del self._stations[name]
+        point = self._points.pop(name)
+        cell = tuple(int(math.floor(v / self.GRID_SIZE)) for v in point)
+        self._grid[cell].remove(name)
+        if len(self._grid[cell]) == 0:
+            del self._grid[cell]
+
+    def _indexed_station(self, name, distance=None):
+        """Get an IndexedStation from the name of a station in the index."""
+        entry = self._stations[name]
+        epw_path = self._file_path(name, '.epw') \
+            if '.epw' in entry['extensions'] else None
+        stat_path = self._file_path(name, '.stat') \
+            if '.stat' in entry['extensions'] else None
+        return IndexedStation(epw_path, stat_path, entry['location'],
+                              entry['climate_zone'], distance)
+
+    def _file_path(self, name, extension):
+        """Get the full path to a station file from its name and extension."""
+        return os.path.join(self._folder, name + extension)
+
+    @staticmethod
+    def _unit_vector(latitude, longitude):
+        """Get a tuple for the unit vector of a latitude and longitude in degrees."""
+        lat, lon = math.radians(latitude), math.radians(longitude)
+        return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon),
+                math.sin(lat))
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __len__(self):
+        return len(self._stations)
+
+    def __repr__(self):
+        """StationIndex object representation."""
+        return 'Station Index - {} [# stations: {}]'.format(
+            self._folder, len(self._stations))
+
+
+class IndexedStation(object):
+    """A weather station of a StationIndex.
+
+    Args:
+        epw_path: Text for the path to the .epw file of the station or None.
+        stat_path: Text for the path to the .stat file of the station or None.
+        location: A dictionary of the Location of the station.
+        climate_zone: Text for the ASHRAE climate zone of the station or None.
+        distance: A number for the distance of the station from a queried
+            point in kilometers or None. (Default: None).
+
+    Properties:
+        * epw_path
+        * stat_path
+        * location
+        * station_id
+        * city
+        * latitude
+        * longitude
+        * elevation
+        * climate_zone
+        * distance
+    """
+    __slots__ = ('_epw_path', '_stat_path', '_location', '_climate_zone',
+                 '_distance')
+
+    def __init__(self, epw_path, stat_path, location, climate_zone, distance=None):
+        self._epw_path = epw_path
+        self._stat_path = stat_path
+        self._location = location
+        self._climate_zone = climate_zone
+        self._distance = distance
+
+    @property
+    def epw_path(self):
+        """Get the path to the .epw file of the station or None if it has none."""
+        return self._epw_path
+
+    @property
+    def stat_path(self):
+        """Get the path to the .stat file of the station or None if it has none."""
+        return self._stat_path
+
+    @property
+    def location(self):
+        """Get a Location object for the station."""
+        return Location.from_dict(self._location)
+
+    @property
+    def station_id(self):
+        """Get text for the ID of the station or None if it is not known."""
+        return self._location.get('station_id')
+
+    @property
+    def city(self):
+        """Get text for the city of the station."""
+        return self._location['city']
+
+    @property
+    def latitude(self):
+        """Get a number for the latitude of the station in degrees."""
+        return self._location['latitude']
+
+    @property
+    def longitude(self):
+        """Get a number for the longitude of the station in degrees."""
+        return self._location['longitude']
+
+    @property
+    def elevation(self):
+        """Get a number for the elevation of the station in meters."""
+        return self._location['elevation']
+
+    @property
+    def climate_zone(self):
+        """Get text for the ASHRAE climate zone of the station or None."""
+        return self._climate_zone
+
+    @property
+    def distance(self):
+        """Get the distance of the station from a queried point in kilometers.
+
+        This will be None if the station did not come from a query.
+        """
+        return self._distance
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """IndexedStation object representation."""
+        if self._distance is None:
+            return 'Indexed Station: {}'.format(self.city)
+        return 'Indexed Station: {} [{} km]'.format(self.city, round(self._distance, 1))
+
+
+def _load_weather_file(args):
+    """Load a weather file and pack its hourly data to be sent between processes.
+
+    This function is at the module level so that it can be used by a process Pool.
+
+    Args:
+        args: A tuple with the path to the weather file, a boolean for whether
+            only the header of EPW files should be loaded and a boolean for
+            whether the hourly data should be packed into arrays.
+
+    Returns:
+        A tuple with three items.
+
+        -   weather_object: The EPW, STAT, DDY or Wea object, which lacks the values
+            of its hourly data collections if they were packed. None if the file
+            failed to load.
+
+        -   packed: A list of arrays for the values of the hourly data collections
+            of the weather_object. None if the object has no hourly data or the
+            data was not packed.
+
+        -   error: Text for the error message if the file failed to load.
+    """
+    file_path, header_only, pack = args
+    try:
+        f_type = os.path.splitext(file_path)[-1].lower()
+        if f_type == '.epw':
+            w_obj = EPW(file_path)
+            w_obj._import_data(import_header_only=header_only)
+            collections = w_obj._data
+        elif f_type == '.stat':
+            w_obj, collections = STAT(file_path), []
+        elif f_type == '.ddy':
+            w_obj, collections = DDY.from_ddy_file(file_path), []
+        elif f_type == '.wea':
+            w_obj = Wea.from_file(file_path)
+            collections = (w_obj._direct_normal_irradiance,
+                           w_obj._diffuse_horizontal_irradiance)
+        else:
+            raise ValueError('Unrecognized weather file type "{}".'.format(f_type))
+    except Exception as e:
+        return None, None, '{}: {}'.format(e.__class__.__name__, e)
+    return w_obj, _pack_collections(collections) if pack else None, None
+
+
+def _pack_collections(collections):
+    """Replace the values of data collections with arrays for compact transfer.
+
+    Args:
+        collections: A list of data collections, which will have their values
+            removed by this function.
+
+    Returns:
+        A list of arrays (or lists for non-numeric data) for the values of each
+        collection. None if there are no collections.
+    """
+    if len(collections) == 0:
+        return None
+    packed = []
+    for coll in collections:
+        packed.append(_pack_values(coll._values))
+        coll._values = []
+    return packed
+
+
+def _pack_values(values):
+    """Get the smallest array that can hold a list of numbers without loss.
+
+    The input values will be returned unchanged if they are not all floats or
+    all integers.
+    """
+    if len(values) == 0:
+        return values
+    if all(type(v) is float for v in values):
+        return array('d', values)
+    if all(type(v) is int for v in values):
+        min_val, max_val = min(values), max(values)
+        for typecode in ('b', 'h', 'i', 'l'):
+            half_range = 2 ** (array(typecode).itemsize * 8 - 1)
+            if -half_range <= min_val and max_val < half_range:
+                return array(typecode, values)
+    return values
+
+
+def _unpack_collections(weather_object, packed):
+    """Restore the values of the data collections of a weather object from arrays."""
+    if isinstance(weather_object, EPW):
+        collections = weather_object._data
+    else:
+        collections = (weather_object._direct_normal_irradiance,
+                       weather_object._diffuse_horizontal_irradiance)
+    for coll, values in zip(collections, packed):
+        coll._values = values.tolist() if isinstance(values, array) else values
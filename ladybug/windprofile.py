@@ -244,14 +244,77 @@ class WindProfile(object):
             height: The height above the ground to be evaluated in
                 meters. (Default: 1).
         """
-        vals = tuple(self.calculate_wind(v, height) for v in meteorological_wind_data)
-        new_header = meteorological_wind_data.header.duplicate()
-        new_header.metadata['height'] = '{}m'.format(round(height, 1))
-        if isinstance(meteorological_wind_data, HourlyContinuousCollection):
-            return HourlyContinuousCollection(new_header, vals)
-        else:
-            dts = meteorological_wind_data.datetimes
-            return meteorological_wind_data.__class__(new_header, vals, dts)
+        return self.calculate_wind_data_at_heights(meteorological_wind_data, [height])[0]
+
+    def calculate_wind_matrix(self, meteorological_wind_speeds, heights):
+        """Calculate the wind speeds at several heights for several meteorological speeds.
+
+        The terms of the wind profile that do not change with the wind speed are
+        computed only once for each height, making this method much faster than
+        calling calculate_wind for each height and wind speed.
+
+        Args:
+            meteorological_wind_speeds: A list of numbers (or a data collection)
+                for meteorological wind speeds [m/s].
+            heights: A list of numbers for the heights above the ground to be
+                evaluated in meters.
+
+        Returns:
+            A list of lists with one sub-list for each of the input heights. Each
+            sub-list contains wind speeds that align with the meteorological_wind_speeds.
+        """
+        return self._wind_matrix(meteorological_wind_speeds, heights)
+
+    def calculate_wind_data_at_heights(self, meteorological_wind_data, heights):
+        """Get a list of data collections of wind speed at several heights.
+
+        Args:
+            meteorological_wind_data: A data collection of meteorological
+                wind speed [m/s].
+            heights: A list of numbers for the heights above the ground to be
+                evaluated in meters.
+
+        Returns:
+            A list of data collections with one collection for each of the heights.
+        """
+        matrix = self._wind_matrix(meteorological_wind_data.values, heights)
+        return [self._wind_data_collection(meteorological_wind_data, vals, height)
+                for vals, height in zip(matrix, heights)]
+
+    @classmethod
+    def calculate_wind_matrix_terrains(
+            cls, meteorological_wind_speeds, heights, terrains=None,
+            meteorological_terrain='country', meteorological_height=10, log_law=False):
+        """Calculate matrices of wind speeds at several heights for several terrains.
+
+        Args:
+            meteorological_wind_speeds: A list of numbers (or a data collection)
+                for meteorological wind speeds [m/s].
+            heights: A list of numbers for the heights above the ground to be
+                evaluated in meters.
+            terrains: A list of text for the terrains to be evaluated. If None,
+                all of the TERRAINS will be used. (Default: None).
+            meteorological_terrain: Text for the terrain class associated
+                with the meteorological wind speed. (Default: country).
+            meteorological_height: A number for the height above the ground at
+                which the meteorological wind speed is measured in meters.
+                (Default: 10 meters).
+            log_law: A boolean to note whether the wind profile should use a
+                logarithmic law instead of a power law. (Default: False).
+
+        Returns:
+            A dictionary with the terrains as keys and the output of the
+            calculate_wind_matrix method for each terrain as values.
+        """
+        terrains = cls.TERRAINS if terrains is None else terrains
+        profiles = [cls(ter, meteorological_terrain, meteorological_height, log_law)
+                    for ter in terrains]
+        met_scaled = None
+        if not log_law and len(profiles) != 0:  # speed terms shared by all terrains
+            met_denom = profiles[0]._met_power_denom
+            met_scaled = [v * met_denom for v in meteorological_wind_speeds]
+        return {prof.terrain: prof._wind_matrix(
+            meteorological_wind_speeds, heights, met_scaled) for prof in profiles}
 
     def wind_vector(
             self, meteorological_wind_speed, height, direction=None,
@@ -780,6 +843,47 @@ class WindProfile(object):
         h_ratio = self._meteorological_height / self._met_roughness_length
         self._met_log_denom = math.log(h_ratio)
 
+    def _wind_matrix(self, meteorological_wind_speeds, heights, met_scaled=None):
+        """Get a list of wind speeds for each height.
+
+        The arithmetic matches calculate_wind such that the results are identical.
+
+        Args:
+            meteorological_wind_speeds: A list of meteorological wind speeds.
+            heights: A list of heights above the ground.
+            met_scaled: An optional list of meteorological wind speeds that have
+                already been multiplied by the denominator of the power function.
+        """
+        if self._log_law:
+            matrix = []
+            for height in heights:
+                if height > self._roughness_length:
+                    met_log_num = math.log(height / self._roughness_length)
+                    factor = met_log_num / self._met_log_denom
+                    matrix.append([v * factor for v in meteorological_wind_speeds])
+                else:
+                    matrix.append([0] * len(meteorological_wind_speeds))
+            return matrix
+        if met_scaled is None:
+            met_denom = self._met_power_denom
+            met_scaled = [v * met_denom for v in meteorological_wind_speeds]
+        matrix = []
+        for height in heights:
+            h_ratio = (height / self._boundary_layer_height) ** self._power_law_exponent
+            matrix.append([h_ratio * v for v in met_scaled])
+        return matrix
+
+    @staticmethod
+    def _wind_data_collection(meteorological_wind_data, values, height):
+        """Get a data collection of wind speed from values at a given height."""
+        new_header = meteorological_wind_data.header.duplicate()
+        new_header.metadata['height'] = '{}m'.format(round(height, 1))
+        if isinstance(meteorological_wind_data, HourlyContinuousCollection):
+            return HourlyContinuousCollection(new_header, values)
+        else:
+            dts = meteorological_wind_data.datetimes
+            return meteorological_wind_data.__class__(new_header, values, dts)
+
     @staticmethod
     def _flip_direction(direction):
         """Flip the direction of a wind so it notes the orientation of arrows."""
@@ -2,6 +2,7 @@
 from __future__ import division
 
 import math
+from collections import OrderedDict
 
 from .color import ColorRange
 from .datacollection import HourlyContinuousCollection, HourlyDiscontinuousCollection
@@ -19,6 +20,9 @@ from ladybug_geometry.geometry2d.mesh import Mesh2D
 linspace = HourlyContinuousCollection.linspace
 histogram = HourlyContinuousCollection.histogram
 histogram_circular = HourlyContinuousCollection.histogram_circular
+histogram_circular_counts = HourlyContinuousCollection.histogram_circular_counts
+histogram_circular_bin_indices = \
+    HourlyContinuousCollection.histogram_circular_bin_indices
 
 
 class WindRose(object):
@@ -62,12 +66,22 @@ class WindRose(object):
         * frequency_intervals_mesh
         * frequency_maximum
         * frequency_hours
+
+    Note that the assignment of the direction values to the direction bins is
+    cached on the class for each unique set of direction values and direction_count.
+    So several wind roses of different analysis data collections that share the
+    same direction_data_collection only need to bin the directions once.
+    The DIRECTION_BIN_CACHE_SIZE sets the maximum number of entries in this cache.
+    The cache is keyed by a sample of the direction values and the full values
+    are only compared when the sample matches.
     """
 
     DEFAULT_FREQUENCY_SPACING = 10.0
     DEFAULT_FREQUENCY_HOURS = 200.0
     DEFAULT_BASE_POINT = Point2D()
     DEFAULT_NORTH = 0.0
+    DIRECTION_BIN_CACHE_SIZE = 16
+    _direction_bin_cache = OrderedDict()
 
     def __init__(self, direction_data_collection, analysis_data_collection,
                  direction_count=8):
@@ -110,9 +124,9 @@ class WindRose(object):
         self._angles = WindRose._compute_angles(direction_count)
         self._is_speed_data_type = isinstance(
             self._analysis_data_collection.header.data_type, Speed)
-        self._histogram_data, self._zero_count = \
-            self._compute_windrose_data(self.direction_values, self.analysis_values,
-                                        self.angles, (0, 360), self._is_speed_data_type)
+        direction_bins = self.direction_bins(self.direction_values, direction_count)
+        self._histogram_data, self._zero_count = self._compute_windrose_data(
+            direction_bins, self.analysis_values, self._is_speed_data_type)
 
         # Editable public properties for visualization
         self._legend_parameters = None
@@ -632,8 +646,7 @@ class WindRose(object):
             will have multiple values in the event of a tie.
         """
         bin_array = WindRose._compute_angles(directions_count)
-        hist_data = histogram_circular(data.values, bin_array, (0, 360))
-        freqs = [len(b) for b in hist_data]
+        freqs = histogram_circular_counts(data.values, bin_array, (0, 360))
         dirvs = [i / directions_count * 360.0 for i in range(directions_count)]
 
         # to ensure ties are captured, iterate through check all values.
@@ -647,6 +660,52 @@ class WindRose(object):
                 max_dirv.append(dirv)
         return max_dirv
 
+    @classmethod
+    def direction_bins(cls, direction_values, direction_count=8):
+        """Get the indices of the direction values that fall within each direction bin.
+
+        The result is cached for each unique set of direction_values and
+        direction_count such that it is only computed once for several wind roses
+        that share the same direction data.
+
+        Args:
+            direction_values: A list of wind direction values in degrees, which
+                are greater than or equal to 0 and less than 360.
+            direction_count: An integer for the number of directions around the
+                circle to bin the values by. (Default: 8).
+
+        Returns:
+            A tuple with a sub-tuple for each direction bin. Each sub-tuple contains
+            the indices of the direction_values that fall within the bin, ordered
+            from the lowest to the highest direction value.
+        """
+        direction_values = tuple(direction_values)
+        step = len(direction_values) // 64 + 1  # sample of about 64 values
+        key = (int(direction_count), len(direction_values), direction_values[::step])
+        # move the recently-used bins to the end of the cache
+        entry = cls._direction_bin_cache.pop(key, None)
+        if entry is None or (entry[0] is not direction_values and
+                             entry[0] != direction_values):
+            bin_array = WindRose._compute_angles(direction_count)
+            bin_ids = histogram_circular_bin_indices(
+                direction_values, bin_array, (0, 360))
+            bins = [[] for _ in range(len(bin_array) - 1)]
+            for j, i in enumerate(bin_ids):
+                if i is not None:
+                    bins[i].append(j)
+            dir_key = direction_values.__getitem__
+            bins = tuple(tuple(sorted(b, key=dir_key)) for b in bins)
+            entry = (direction_values, bins)
+            if len(cls._direction_bin_cache) >= cls.DIRECTION_BIN_CACHE_SIZE:
+                cls._direction_bin_cache.popitem(last=False)
+        cls._direction_bin_cache[key] = entry
+        return entry[1]
+
+    @classmethod
+    def clear_direction_bin_cache(cls):
+        """Remove all direction bins from the cache shared by all WindRoses."""
+        cls._direction_bin_cache.clear()
+
     @staticmethod
     def _compute_angles(num_of_dir):
         """Compute angles"""
@@ -790,45 +849,30 @@ class WindRose(object):
         return hist_coords
 
     @staticmethod
-    def _compute_windrose_data(direction_values, analysis_values, bin_array, bin_range,
-                               is_speed_data_type):
+    def _compute_windrose_data(direction_bins, analysis_values, is_speed_data_type):
         """
         Computes the histogram for the windrose.
 
         Args:
-            direction_values: Hourly direction values to bin analysis data by.
+            direction_bins: The indices of the values within each direction bin,
+                as output by the direction_bins method.
             analysis_values: Hourly analysis values.
-            bin_intervals: Number of bins for the histogram.
-            bin_array: Bin edges as list of direction values.
-            bin_range: Maximum and minimum range for histogram.
+            is_speed_data_type: Boolean to note whether zero values should be
+                filtered out of the histogram.
 
         Returns:
-            The histogram, a proxy histogram to represent zero values, and the
-                number of zeros in the analysis values, as a tuple.
+            The histogram and the number of zeros in the analysis values, as a tuple.
         """
         # Filter out zero values if looking at wind speed values
         if is_speed_data_type:
-            _direction_values = []
-            _analysis_values = []
-            for d, v in zip(direction_values, analysis_values):
-                if v > 1e-10:
-                    _direction_values.append(d)
-                    _analysis_values.append(v)
+            data = tuple(
+                tuple(v for v in (analysis_values[j] for j in bin) if v > 1e-10)
+                for bin in direction_bins)
+            zero_count = sum(1 for v in analysis_values if not v > 1e-10)
         else:
-            _direction_values = direction_values
-            _analysis_values = analysis_values
-
-        # Calculate zero rose properties
-        zero_count = (len(analysis_values) - len(_analysis_values))
-
-        # Regular hist data
-        data = histogram_circular(
-            zip(_direction_values, _analysis_values), bin_array, bin_range,
-            key=lambda v: v[0])
-
-        # Filter out the direction values and make immutable
-        data = tuple(tuple(val[1] for val in bin) for bin in data)
-
+            data = tuple(tuple(analysis_values[j] for j in bin)
+                         for bin in direction_bins)
+            zero_count = 0
         return data, zero_count
 
     @staticmethod
@@ -2,7 +2,7 @@
 import json
 
 from click.testing import CliRunner
-from ladybug.cli import viz, config
+from ladybug.cli import viz, config, extensions_report
 
 
 def test_viz():
@@ -19,3 +19,13 @@ def test_config():
     assert result.exit_code == 0
     config_dict = json.loads(result.output)
     assert len(config_dict) >= 2
+
+
+def test_extensions_report(monkeypatch, tmp_path):
+    monkeypatch.setenv('LADYBUG_EXTENSIONS_CACHE', str(tmp_path / 'extensions.json'))
+    runner = CliRunner()
+    result = runner.invoke(extensions_report)
+    assert result.exit_code == 0
+    report = json.loads(result.output)
+    assert report['mode'] in ('eager', 'lazy', 'disabled')
+    assert set(report['imports']) >= set(report['extensions'])
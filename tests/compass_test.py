@@ -1,5 +1,6 @@
 # coding=utf-8
 import math
+import pytest
 
 from ladybug.compass import Compass
 
@@ -118,6 +119,32 @@ def test_point3d_to_equisolid():
             Point2D(0, expected_large_radius), 0.01)
 
 
+def test_project_coordinates():
+    """Test the projection of flat coordinate lists against the point methods."""
+    points = [Point3D(0, 0, 100), Point3D(100, 0, 0), Point3D(10, 20, 30),
+              Point3D(-50, 40, 60), Point3D(10, 20, 80)]
+    coords = [c for pt in points for c in (pt.x, pt.y, pt.z)]
+    origin = Point3D(10, 20, 0)
+
+    for projection in Compass.PROJECTIONS:
+        proj_coords = Compass.project_coordinates(coords, projection, 90, origin)
+        assert len(proj_coords) == len(points) * 2
+        proj_pts = Compass.points3d_to_projection(points, projection, 90, origin)
+        for i, pt in enumerate(points):
+            if projection == 'Orthographic':
+                expected = Compass.point3d_to_orthographic(pt)
+            else:
+                func_name = 'point3d_to_{}'.format(projection.lower())
+                expected = getattr(Compass, func_name)(pt, 90, origin)
+            assert proj_coords[i * 2] == expected.x
+            assert proj_coords[i * 2 + 1] == expected.y
+            assert proj_pts[i] == expected
+            assert Compass.point3d_to_projection(pt, projection, 90, origin) == expected
+
+    with pytest.raises(ValueError):
+        Compass.project_coordinates(coords, 'Fisheye')
+
+
 def test_set_properties():
     """Test the initialization of Compass and basic properties."""
     compass = Compass()
@@ -14,6 +14,7 @@ from ladybug.datatype.fraction import RelativeHumidity, HumidityRatio
 from ladybug.datatype.energy import Energy
 from ladybug.datatype.energyintensity import EnergyIntensity
 from ladybug.datatype.power import Power
+from ladybug.datatype.energyflux import EnergyFlux, Irradiance
 from ladybug.datatype.speed import Speed
 from ladybug.datatype.distance import Distance
 
@@ -1504,6 +1505,50 @@ def test_histogram_circular():
             assert _chkh == pytest.approx(_h, abs=1e-10)
 
 
+def test_histogram_counts():
+    """Test the histogram_counts and histogram_circular_counts methods."""
+    vals = [0, 0, 0.9, 1, 1.5, 1.99, 2, 3]
+    assert BaseCollection.histogram_counts(vals, (0, 1, 2, 3)) == [0, 3, 3, 1, 1]
+    assert BaseCollection.histogram_bin_indices(vals, (0, 1, 2, 3)) == \
+        [1, 1, 1, 2, 2, 2, 3, 4]
+    weights = [1, 1, 1, 2, 2, 2, 3, 3]
+    assert BaseCollection.histogram_counts(vals, (0, 1, 2, 3), weights) == \
+        [0, 3, 6, 3, 3]
+    with pytest.raises(AssertionError):
+        BaseCollection.histogram_counts(vals, (0, 1, 2, 3), weights[:-1])
+
+    bin_arr = [315, 345, 15, 45]
+    vals = [315, 330, 331, 345, 350, 0, 0, 1, 16, 30, 44, 45]
+    hist = histogram_circular(vals, bin_arr, hist_range=(0, 360))
+    assert hist == [[315, 330, 331], [0, 0, 1, 345, 350], [16, 30, 44]]
+    counts = BaseCollection.histogram_circular_counts(vals, bin_arr, (0, 360))
+    assert counts == [len(h) for h in hist]
+    assert BaseCollection.histogram_circular_bin_indices(vals, bin_arr, (0, 360)) == \
+        [0, 0, 0, 1, 1, 1, 1, 1, 2, 2, 2, None]
+    assert BaseCollection.histogram_circular_counts(
+        [358, 359, 0, 1, 2, 3], (358, 0, 3)) == [2, 3]
+
+
+def test_histogram_stacked():
+    """Test the histogram_stacked and histogram_circular_stacked methods."""
+    vals = [0, 0.5, 1, 1.5, 2.5]
+    stack_vals = [10, 20, 10, 30, 20]
+    stacked = BaseCollection.histogram_stacked(vals, (0, 1, 2), stack_vals, (10, 20))
+    assert stacked == [[0, 0, 0], [0, 1, 1], [0, 1, 1], [0, 0, 1]]
+    weighted = BaseCollection.histogram_stacked(
+        vals, (0, 1, 2), stack_vals, (10, 20), weights=[2] * 5)
+    assert weighted == [[0, 0, 0], [0, 2, 2], [0, 2, 2], [0, 0, 2]]
+
+    dirs = [350, 10, 90, 100, 180, 270]
+    speeds = [1, 5, 2, 3, 0, 8]
+    stacked = BaseCollection.histogram_circular_stacked(
+        dirs, [315, 45, 135, 225, 315], speeds, (0, 4), hist_range=(0, 360))
+    assert stacked == [[0, 1, 1], [0, 2, 0], [0, 1, 0], [0, 0, 1]]
+    counts = BaseCollection.histogram_circular_counts(
+        dirs, [315, 45, 135, 225, 315], (0, 360))
+    assert [sum(s) for s in stacked] == counts
+
+
 def test_normalize_by_area():
     """Test the normalize_by_area method."""
     a_per = AnalysisPeriod(6, 21, 12, 6, 21, 13)
@@ -1518,3 +1563,22 @@ def test_normalize_by_area():
     assert isinstance(dc2.header.data_type, EnergyIntensity)
     assert dc2.header.unit == 'kWh/m2'
     assert dc2.header.metadata['type'] == 'Energy Intensity'
+
+
+def test_aggregate_by_area():
+    """Test that aggregate_by_area uses the base type that defines the normalization."""
+    a_per = AnalysisPeriod(6, 21, 12, 6, 21, 13)
+    dt1, dt2 = DateTime(6, 21, 12), DateTime(6, 21, 13)
+    dc1 = HourlyDiscontinuousCollection(
+        Header(EnergyFlux(), 'W/m2', a_per), [20, 25], [dt1, dt2])
+    dc2 = dc1.aggregate_by_area(10, 'm2')
+    assert type(dc2.header.data_type) is Power
+    assert dc2.header.unit == 'W'
+    assert dc2.values == (200, 250)
+
+    dc3 = HourlyDiscontinuousCollection(
+        Header(Irradiance(), 'W/m2', a_per), [20, 25], [dt1, dt2])
+    assert type(dc3.aggregate_by_area(10, 'm2').header.data_type) is Power
+    dc4 = HourlyDiscontinuousCollection(
+        Header(EnergyIntensity(), 'kWh/m2', a_per), [20, 25], [dt1, dt2])
+    assert type(dc4.aggregate_by_area(10, 'm2').header.data_type) is Energy
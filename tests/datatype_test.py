@@ -9,6 +9,10 @@ from ladybug.datatype import angle, area, distance, energy, energyflux, \
     thermalcondition, time, specificenergy, uvalue, volume, volumeflowrate, \
     volumeflowrateintensity, voltage, current
 
+import os
+import sys
+import importlib
+import subprocess
 import pytest
 import math
 PI = math.pi
@@ -22,6 +26,62 @@ def test_global_properties():
     assert isinstance(datatype.TYPESDICT, dict)
 
 
+def test_manifest():
+    """Test that the static manifest matches the data types in the package."""
+    from ladybug.datatype._manifest import TYPE_MODULES, BASE_TYPE_UNITS, \
+        NORMALIZED_TYPES
+    folder = os.path.dirname(datatype.__file__)
+    modules = [f[:-3] for f in os.listdir(folder) if f.endswith('.py') and
+               f not in ('__init__.py', 'base.py', 'generic.py', '_manifest.py')]
+    assert sorted(modules) == sorted(TYPE_MODULES)
+
+    for module_name, type_names in TYPE_MODULES.items():
+        module = importlib.import_module('ladybug.datatype.' + module_name)
+        module_types = [name for name, obj in vars(module).items()
+                        if isinstance(obj, type) and issubclass(obj, base.DataTypeBase)
+                        and obj.__module__ == module.__name__]
+        assert sorted(module_types) == sorted(type_names)
+    for type_name, units in BASE_TYPE_UNITS.items():
+        assert datatype.TYPESDICT[type_name]._units == units
+        assert base.DataTypeBase in datatype.TYPESDICT[type_name].__bases__
+
+    norm_types = [name for name, clss in datatype.TYPESDICT.items()
+                  if clss.__dict__.get('_normalized_type') is not None]
+    assert sorted(norm_types) == sorted(NORMALIZED_TYPES)
+    for type_name, norm_name in NORMALIZED_TYPES.items():
+        assert datatype.TYPESDICT[type_name]._normalized_type.__name__ == norm_name
+    type_names = list(datatype.TYPESDICT.keys())
+    assert type_names.index('Power') < type_names.index('ActivityLevel')
+
+    assert len(datatype.TYPESDICT) == len(datatype.TYPES)
+    assert sorted(datatype.TYPESDICT) == list(datatype.TYPES)
+    assert datatype.TYPESDICT.get('NotADataType') is None
+    assert 'NotADataType' not in datatype.TYPESDICT
+    with pytest.raises(KeyError):
+        datatype.TYPESDICT['NotADataType']
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='requires -X importtime')
+def test_lazy_import():
+    """Test that data type modules are only imported when they are requested.
+
+    The -X importtime output of this test can also be used to benchmark the time
+    that it takes to import the data types.
+    """
+    code = 'import sys\n' \
+        'from ladybug.datatype import TYPESDICT\n' \
+        'TYPESDICT["Temperature"]\n' \
+        'print(" ".join(m for m in sys.modules if m.startswith("ladybug.datatype.")))'
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    assert result.returncode == 0
+    assert 'ladybug.datatype' in result.stderr  # the import time of the package
+    dt_modules = result.stdout.split()
+    assert 'ladybug.datatype.temperature' in dt_modules
+    assert 'ladybug.datatype.area' not in dt_modules
+
+
 def test_from_dict():
     """Test the from dict method."""
     sample_dict = {'name': 'Temperature',
@@ -74,6 +134,23 @@ def test_temperature():
     assert temp_type.to_unit([1], 'C', 'K')[0] == pytest.approx(-272.15, rel=1e-1)
 
 
+def test_unit_converter():
+    """Test the unit_converter method."""
+    temp_type = temperature.Temperature()
+    c_to_f = temp_type.unit_converter('C', 'F')
+    assert c_to_f([0, 100]) == [32, 212]
+    assert temperature.DryBulbTemperature().unit_converter('C', 'F')([0]) == [32]
+    assert temp_type.unit_converter('C', 'F') is c_to_f
+    assert temperature.Temperature().unit_converter('C', 'F') is c_to_f
+
+    f_to_k = temp_type.unit_converter('F', 'K')
+    assert f_to_k([32])[0] == pytest.approx(273.15, rel=1e-5)
+    values = [1, 2, 3]
+    assert temp_type.unit_converter('C', 'C')(values) is values
+    with pytest.raises(ValueError):
+        temp_type.unit_converter('C', 'm')
+
+
 def test_temperaturedelta():
     """Test TemperatureDelta type."""
     temp_type = temperaturedelta.TemperatureDelta()
@@ -0,0 +1,79 @@
+# coding=utf-8
+from ladybug.datautil import collections_to_csv, collections_from_csv, \
+    collections_to_binary, collections_from_binary, headers_from_binary
+from ladybug.datacollection import HourlyContinuousCollection, \
+    HourlyDiscontinuousCollection, MonthlyCollection
+from ladybug.epw import EPW
+
+import os
+import pytest
+
+
+def test_collections_to_from_csv():
+    """Test the writing and reading of data collections to a CSV file."""
+    epw = EPW('./tests/assets/epw/chicago.epw')
+    colls = [epw.dry_bulb_temperature, epw.relative_humidity, epw.wind_speed]
+
+    folder = './tests/assets/csv'
+    file_path = collections_to_csv(colls, folder, 'chicago')
+    assert file_path.endswith('chicago.csv')
+
+    new_colls = collections_from_csv(file_path)
+    assert len(new_colls) == 3
+    for coll, new_coll in zip(colls, new_colls):
+        assert isinstance(new_coll, HourlyContinuousCollection)
+        assert new_coll.header.data_type.name == coll.header.data_type.name
+        assert new_coll.header.unit == coll.header.unit
+        assert new_coll.values == coll.values
+
+    sub_colls = collections_from_csv(file_path, columns=[2, 0])
+    assert len(sub_colls) == 2
+    assert sub_colls[0].header.data_type.name == 'Wind Speed'
+    assert sub_colls[0].values == epw.wind_speed.values
+    assert sub_colls[1].values == epw.dry_bulb_temperature.values
+
+    os.remove(file_path)
+    os.rmdir(folder)
+
+
+def test_collections_to_from_binary():
+    """Test the writing and reading of data collections to a binary file."""
+    epw = EPW('./tests/assets/epw/chicago.epw')
+    hot_temp = epw.dry_bulb_temperature.filter_by_conditional_statement('a > 25')
+    monthly_rh = epw.relative_humidity.average_monthly()
+    colls = [epw.dry_bulb_temperature, hot_temp, monthly_rh]
+
+    folder = './tests/assets/bin'
+    file_path = collections_to_binary(colls, folder, 'chicago')
+    assert file_path.endswith('chicago.bin')
+    assert os.path.isfile(file_path)
+
+    new_colls = collections_from_binary(file_path)
+    assert len(new_colls) == 3
+    assert isinstance(new_colls[0], HourlyContinuousCollection)
+    assert isinstance(new_colls[1], HourlyDiscontinuousCollection)
+    assert isinstance(new_colls[2], MonthlyCollection)
+    for coll, new_coll in zip(colls, new_colls):
+        assert new_coll.header == coll.header
+        assert new_coll.values == coll.values
+        assert new_coll.datetimes == coll.datetimes
+
+    headers = headers_from_binary(file_path)
+    assert [h.data_type.name for h in headers] == \
+        ['Dry Bulb Temperature', 'Dry Bulb Temperature', 'Relative Humidity']
+    sub_colls = collections_from_binary(file_path, [2])
+    assert len(sub_colls) == 1
+    assert sub_colls[0].values == monthly_rh.values
+    rep_colls = collections_from_binary(file_path, [1, 1])
+    assert len(rep_colls) == 2
+    assert rep_colls[0].values == rep_colls[1].values == hot_temp.values
+    assert rep_colls[0].datetimes == rep_colls[1].datetimes == hot_temp.datetimes
+
+    os.remove(file_path)
+    os.rmdir(folder)
+
+
+def test_collections_from_binary_invalid():
+    """Test that reading a file that is not a binary collection file fails."""
+    with pytest.raises(AssertionError):
+        collections_from_binary('./tests/assets/epw/chicago.epw')
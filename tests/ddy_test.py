@@ -1,12 +1,13 @@
 # coding=utf-8
 from pytest import approx
 import os
+import shutil
 from ladybug.location import Location
 from ladybug.dt import Date
 from ladybug.analysisperiod import AnalysisPeriod
 from ladybug.datacollection import HourlyContinuousCollection
 from ladybug.designday import DesignDay
-from ladybug.ddy import DDY
+from ladybug.ddy import DDY, DDYIndex
 
 
 def test_import_ddy():
@@ -215,3 +216,54 @@ def test_design_day_hourly_data():
     # sky cover values
     hi_data_collect = des_day.hourly_horizontal_infrared
     assert isinstance(hi_data_collect, HourlyContinuousCollection)
+
+
+def test_ddy_index():
+    """Test the DDYIndex of a folder of .ddy files."""
+    folder = './tests/assets/ddy'
+    ddy_index = DDYIndex(folder)
+    assert len(ddy_index) == 5
+    assert ddy_index.folder == os.path.abspath(folder)
+    assert len(ddy_index.locations) == 5
+
+    ddays = ddy_index.query(station='chicago', keyword='Condns DB', percentile=0.4)
+    assert len(ddays) == 2
+    for dday in ddays:
+        assert dday.name == 'Chicago Ohare Intl Ap Ann Clg .4% Condns DB=>MWB'
+        assert dday.day_type == 'SummerDesignDay'
+        assert dday.percentile == approx(0.4)
+    assert ddays[0].dry_bulb_max == approx(33.3, rel=1e-3)
+
+    ddy = DDY.from_ddy_file(ddays[0].file_path)
+    assert isinstance(ddays[0].design_day, DesignDay)
+    assert ddays[0].design_day == ddy[ddays[0].index]
+    assert len(ddy_index.query(station='725300', keyword='Condns DB', percentile=0.4)) \
+        == 1
+    assert len(ddy_index.query(station='tokyo', day_type='WinterDesignDay')) > 0
+    assert len(ddy_index.query(station='nowhere')) == 0
+
+    # test writing the index to a file and updating it with a new file
+    index_folder = './tests/assets/ddy_index'
+    if not os.path.isdir(index_folder):
+        os.makedirs(index_folder)
+    shutil.copy(os.path.join(folder, 'london.ddy'), index_folder)
+    ddy_index = DDYIndex(index_folder)
+    index_file = ddy_index.write(os.path.join(index_folder, 'index.json'))
+    shutil.copy(os.path.join(folder, 'tokyo.ddy'), index_folder)
+    new_index = DDYIndex.from_file(index_file)
+    assert len(new_index) == 1
+    assert new_index.update() == 1
+    assert len(new_index) == 2
+    assert len(new_index.design_days) == \
+        len(DDY.from_ddy_file(os.path.join(folder, 'london.ddy'))) + \
+        len(DDY.from_ddy_file(os.path.join(folder, 'tokyo.ddy')))
+
+    # test that a malformed .ddy file is skipped without stopping the indexing
+    with open(os.path.join(index_folder, 'bad.ddy'), 'w') as bad_f:
+        bad_f.write('Site:Location,\n  Bad,\n  1,\n  2,\n  0,\n  10;\n'
+                    'SizingPeriod:DesignDay,\n  Bad Day,\n  July;\n')
+    shutil.copy(os.path.join(folder, 'chicago.ddy'), index_folder)
+    assert new_index.update() == 1
+    assert len(new_index) == 3
+    assert all('bad.ddy' not in f for f in new_index.file_paths)
+    shutil.rmtree(index_folder)
@@ -416,6 +416,48 @@ def test_write_converted_epw():
     os.remove(modified_path)
 
 
+def test_write_epw_does_not_mutate():
+    """Test that writing the EPW does not change its data collections."""
+    relative_path = './tests/assets/epw/chicago.epw'
+    epw = EPW(relative_path)
+    epw.convert_to_ip()
+    dbt_values = epw.dry_bulb_temperature.values
+    epw_str = epw.to_file_string()
+    assert epw_str.count('\n') == 8768
+
+    modified_path = './tests/assets/epw/chicago_modified.epw'
+    assert epw.write(modified_path) == modified_path
+    with open(modified_path) as epw_f:
+        assert epw_f.read() == epw_str
+    assert epw.dry_bulb_temperature.header.unit == 'F'
+    assert epw.dry_bulb_temperature.values == dbt_values
+    os.remove(modified_path)
+
+
+def test_write_epw_partial_year():
+    """Test that a failed write of an EPW leaves any existing file unchanged."""
+    relative_path = './tests/assets/epw/chicago.epw'
+    epw = EPW(relative_path)
+    modified_path = './tests/assets/epw/chicago_partial.epw'
+    epw.write(modified_path)
+    with open(modified_path) as epw_f:
+        epw_str = epw_f.read()
+
+    jan = AnalysisPeriod(1, 1, 0, 1, 31, 23)
+    epw._data[6] = epw._data[6].filter_by_analysis_period(jan)
+    with pytest.raises(ValueError):
+        epw.write(modified_path)
+    with open(modified_path) as epw_f:
+        assert epw_f.read() == epw_str
+    os.remove(modified_path)
+
+
+def test_write_epw_signed_zero():
+    """Test that the text of zero values keeps the sign and type of each value."""
+    assert EPW._str_column([0.0, -0.0, 0, 0.0, -0.0, 1, 1.0]) == \
+        ['0.0', '-0.0', '0', '0.0', '-0.0', '1', '1.0']
+
+
 def test_to_ddy():
     """Test to_ddy."""
     path = './tests/assets/epw/chicago.epw'
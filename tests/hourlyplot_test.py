@@ -191,6 +191,34 @@ def test_hourlyplot_hour_reversed_analysis_period():
     assert len(hour_plot.hour_label_points2d) != 0
 
 
+def test_hourlyplot_reverse_y():
+    """Test that the values and mesh faces of HourlyPlot align with reverse_y."""
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    values = list(range(8760))
+    data_coll = HourlyContinuousCollection(header, values)
+    hour_plot = HourlyPlot(data_coll, y_dim=1, reverse_y=True)
+
+    plot_values = hour_plot.values
+    assert plot_values[:24] == list(range(23, -1, -1))
+    assert plot_values[24:48] == list(range(47, 23, -1))
+    assert len(hour_plot.colors) == 8760
+    new_plot = HourlyPlot(data_coll, y_dim=2, reverse_y=True)
+    assert new_plot._face_layout() is hour_plot._face_layout()
+    assert len(HourlyPlot._FACE_LAYOUTS) <= HourlyPlot.FACE_LAYOUT_CACHE_SIZE
+    assert next(reversed(HourlyPlot._FACE_LAYOUTS)) == (AnalysisPeriod(), True)
+
+    data_coll = data_coll.filter_by_conditional_statement('a >= 60')
+    hour_plot = HourlyPlot(data_coll, y_dim=1, reverse_y=True)
+    mesh = hour_plot.colored_mesh2d
+    assert len(mesh.faces) == 8700
+    plot_values = hour_plot.values
+    assert plot_values[:12] == list(range(71, 59, -1))
+    # the last hour of each day is at the bottom of the chart
+    assert mesh.face_centroids[0] == Point2D(2.5, 0.5)
+    assert mesh.face_centroids[12] == Point2D(3.5, 0.5)
+    assert plot_values[12] == 95
+
+
 def test_hourlyplot_conditional_statement():
     """Test the initialization of HourlyPlot with a conditional statement."""
     header = Header(Temperature(), 'C', AnalysisPeriod())
@@ -137,6 +137,43 @@ def test_monthlychart_set_min_max_by_index():
     assert month_chart.y_axis_labels2[-1] == '100'
 
 
+def test_monthlychart_update_data():
+    """Test the update_data method against a new MonthlyChart with the same data."""
+    header = Header(Temperature(), 'C', AnalysisPeriod())
+    data_coll = HourlyContinuousCollection(header, [i / 365 for i in range(8760)])
+    data_coll2 = HourlyContinuousCollection(header, [i / 100 for i in range(8760)])
+    l_par = LegendParameters(min=-20)
+    month_chart = MonthlyChart([data_coll], legend_parameters=l_par, x_dim=5)
+    month_lines = month_chart.month_lines
+    aggregate = month_chart._grouped_data[0][0]
+
+    month_chart.update_data([data_coll2, data_coll])
+    new_chart = MonthlyChart([data_coll2, data_coll], legend_parameters=l_par, x_dim=5)
+    assert month_chart.data_collections == new_chart.data_collections
+    assert month_chart.y_axis_labels1 == new_chart.y_axis_labels1
+    assert month_chart.y_axis_labels1[0] == '-20.00'
+    assert month_chart.month_lines == month_lines
+    assert month_chart._frame() is new_chart._frame()
+    assert len(MonthlyChart._FRAMES) <= MonthlyChart.FRAME_CACHE_SIZE
+    assert month_chart.colors == new_chart.colors
+    assert month_chart.data_polylines == new_chart.data_polylines
+    meshes, new_meshes = month_chart.data_meshes, new_chart.data_meshes
+    assert [m.vertices for m in meshes] == [m.vertices for m in new_meshes]
+    assert [m.colors for m in meshes] == [m.colors for m in new_meshes]
+    # the monthly-per-hour aggregates of the previous data should be reused
+    assert month_chart._grouped_data[0][1] is aggregate
+
+    # the legend should change with the number and type of the data collections
+    energy_header = Header(Energy(), 'kWh', AnalysisPeriod())
+    energy_coll = HourlyContinuousCollection(energy_header, [1] * 8760)
+    for data_colls in ([data_coll, energy_coll], [energy_coll]):
+        month_chart.update_data(data_colls)
+        new_chart = MonthlyChart(data_colls, legend_parameters=l_par, x_dim=5)
+        assert month_chart.legend.segment_text == new_chart.legend.segment_text
+        assert month_chart.legend.segment_colors == new_chart.legend.segment_colors
+    assert month_chart.legend.segment_text == ['Energy']
+
+
 def test_monthlychart_hourly_stack():
     """Test the initialization of MonthlyChart with hourly stacked data collections."""
     header = Header(Energy(), 'kWh', AnalysisPeriod())
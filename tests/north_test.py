@@ -45,3 +45,30 @@ def test_world_magnetic_model_results():
         dec_val = wmm_obj.magnetic_declination(
             values[2], values[3], values[1], values[0])
         assert dec_val == pytest.approx(values[4], rel=1e-2)
+
+
+def test_world_magnetic_model_declinations():
+    """Test the batch magnetic_declinations method of the WorldMagneticModel."""
+    wmm_obj = WorldMagneticModel('./tests/assets/txt/WMM.COF')
+    lats = [80, 80, 0, -80, 90]
+    lons = [0, 0, 120, 240, 0]
+    elevs = [0, 100000.0, 0, 0, 0]
+    years = [2015, 2015, 2017.5, 2017.5, 2016]
+    dec_vals = wmm_obj.magnetic_declinations(lats, lons, elevs, years)
+
+    assert len(dec_vals) == 5
+    for lat, lon, elev, year, dec_val in zip(lats, lons, elevs, years, dec_vals):
+        assert dec_val == wmm_obj.magnetic_declination(lat, lon, elev, year)
+    # repeated calls at the same latitude and elevation should give the same result
+    assert wmm_obj.magnetic_declination(80, 0, 0, 2015) == dec_vals[0]
+    assert wmm_obj.magnetic_declinations(80, [0, 0]) == \
+        [wmm_obj.magnetic_declination(80, 0)] * 2
+    # the least recently used years should be removed from the coefficient cache
+    cache_size = WorldMagneticModel.TIME_COEFFICIENT_CACHE_SIZE
+    for i in range(cache_size + 1):
+        wmm_obj.magnetic_declination(0, 0, 0, 2015 + i / 100)
+    assert len(wmm_obj._time_coefficients) == cache_size
+    assert 2015 not in wmm_obj._time_coefficients
+
+    with pytest.raises(AssertionError):
+        wmm_obj.magnetic_declinations([80, 0], [0, 0, 0])
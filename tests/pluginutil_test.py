@@ -0,0 +1,113 @@
+# coding=utf-8
+import os
+import sys
+import json
+import shutil
+
+import ladybug
+from ladybug.pluginutil import load_mode, manifest_path, discover_extensions, \
+    load_extensions, load_report, save_manifest
+
+
+def test_load_mode():
+    """Test the load_mode method with the LADYBUG_EXTENSIONS variable."""
+    original = os.environ.get('LADYBUG_EXTENSIONS')
+    try:
+        for mode in ('lazy', 'disabled', ' Eager '):
+            os.environ['LADYBUG_EXTENSIONS'] = mode
+            assert load_mode() == mode.strip().lower()
+        os.environ['LADYBUG_EXTENSIONS'] = 'not_a_mode'
+        assert load_mode() == 'eager'
+        del os.environ['LADYBUG_EXTENSIONS']
+        assert load_mode() == 'eager'
+    finally:
+        if original is not None:
+            os.environ['LADYBUG_EXTENSIONS'] = original
+
+
+def test_discover_extensions():
+    """Test that discover_extensions uses the manifest once it is written."""
+    cache_path = os.path.abspath('./tests/assets/extensions_manifest.json')
+    original = os.environ.get('LADYBUG_EXTENSIONS_CACHE')
+    os.environ['LADYBUG_EXTENSIONS_CACHE'] = cache_path
+    try:
+        if os.path.isfile(cache_path):
+            os.remove(cache_path)
+        assert manifest_path() == cache_path
+        names = discover_extensions()
+        assert not load_report()['from_cache']
+        assert all(n.startswith('ladybug_') and n.count('_') == 1 for n in names)
+        with open(cache_path) as inf:
+            assert json.load(inf)['extensions'] == names
+
+        assert discover_extensions() == names
+        assert load_report()['from_cache']
+        assert discover_extensions(use_cache=False) == names
+        assert not load_report()['from_cache']
+
+        # a manifest from another sys.path should be ignored
+        with open(cache_path, 'w') as outf:
+            json.dump({'fingerprint': [], 'extensions': ['ladybug_fake']}, outf)
+        assert discover_extensions() == names
+        assert not load_report()['from_cache']
+    finally:
+        if os.path.isfile(cache_path):
+            os.remove(cache_path)
+        if original is None:
+            del os.environ['LADYBUG_EXTENSIONS_CACHE']
+        else:
+            os.environ['LADYBUG_EXTENSIONS_CACHE'] = original
+
+
+def test_discover_extensions_cwd():
+    """Test that extensions in the current directory are not stored in the manifest."""
+    cache_path = os.path.abspath('./tests/assets/extensions_manifest.json')
+    ext_folder = os.path.abspath('./tests/assets/ladybug_localext')
+    original = os.environ.get('LADYBUG_EXTENSIONS_CACHE')
+    os.environ['LADYBUG_EXTENSIONS_CACHE'] = cache_path
+    original_cwd = os.getcwd()
+    sys.path.insert(0, '')
+    try:
+        os.mkdir(ext_folder)
+        with open(os.path.join(ext_folder, '__init__.py'), 'w') as outf:
+            outf.write('')
+        names = discover_extensions()
+        assert 'ladybug_localext' not in names
+        os.chdir(os.path.dirname(ext_folder))
+        assert 'ladybug_localext' in discover_extensions()
+        with open(cache_path) as inf:
+            assert 'ladybug_localext' not in json.load(inf)['extensions']
+        os.chdir(original_cwd)
+        assert discover_extensions() == names
+    finally:
+        os.chdir(original_cwd)
+        sys.path.remove('')
+        shutil.rmtree(ext_folder, ignore_errors=True)
+        if os.path.isfile(cache_path):
+            os.remove(cache_path)
+        if original is None:
+            del os.environ['LADYBUG_EXTENSIONS_CACHE']
+        else:
+            os.environ['LADYBUG_EXTENSIONS_CACHE'] = original
+
+
+def test_save_manifest(monkeypatch, tmp_path):
+    """Test that a manifest which was not written upon discovery can be saved later."""
+    cache_path = str(tmp_path / 'extensions.json')
+    monkeypatch.setenv('LADYBUG_EXTENSIONS_CACHE', cache_path)
+    names = discover_extensions(write_cache=False)
+    assert not os.path.isfile(cache_path)
+    assert save_manifest() == cache_path
+    with open(cache_path) as inf:
+        assert json.load(inf)['extensions'] == names
+    assert save_manifest() is None
+
+
+def test_load_extensions(monkeypatch, tmp_path):
+    """Test the load_extensions method."""
+    monkeypatch.setenv('LADYBUG_EXTENSIONS_CACHE', str(tmp_path / 'extensions.json'))
+    extensions = load_extensions({}, ['ladybug_geometry', 'ladybug_notaplugin'])
+    assert list(extensions.keys()) == ['ladybug_geometry']
+    assert set(load_report()['imports']) >= {'ladybug_geometry', 'ladybug_notaplugin'}
+    assert load_extensions(extensions, ['ladybug_geometry']) is extensions
+    assert load_extensions() is ladybug.extensions
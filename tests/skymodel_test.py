@@ -1,6 +1,8 @@
 # coding=utf-8
 from ladybug.skymodel import estimate_illuminance_from_irradiance, \
-    dirint, disc, _get_dirint_coeffs
+    estimate_illuminance_from_irradiance_batch, \
+    dirint, disc, clearness_index_zenith_independent, _get_dirint_coeffs, \
+    _dirint_bins, _disc_series
 
 import pytest
 import math
@@ -25,6 +27,25 @@ def test_estimate_illuminance_from_irradiance():
     assert z_lum == 0
 
 
+def test_estimate_illuminance_from_irradiance_batch():
+    """Test that the batch illuminance function matches the single one."""
+    altitudes = [[60, 0, 10, 45], [30, 75, -5, 5]]
+    dni = [[800, 0, 100, 0], [600, 900, 0, 50]]
+    dhi = [[200, 0, 50, 120], [0, 100, 0, 30]]
+    dew_point = [[15, 15, 10, 12], [-5, 0, 3, 20]]
+    ghi = [[dh + dn * math.sin(math.radians(alt)) for alt, dn, dh in zip(*site)]
+           for site in zip(altitudes, dni, dhi)]
+    results = estimate_illuminance_from_irradiance_batch(
+        altitudes, ghi, dni, dhi, dew_point)
+    assert len(results) == 4
+    for i in range(2):
+        for j in range(4):
+            single = estimate_illuminance_from_irradiance(
+                altitudes[i][j], ghi[i][j], dni[i][j], dhi[i][j], dew_point[i][j])
+            for k in range(4):
+                assert results[k][i][j] == single[k]
+
+
 def test_dirint():
     """Test the accuracy of the dirint model against pvlib results."""
     dirint_result = dirint(
@@ -61,6 +82,30 @@ def test_dirint_coeffs():
     assert coeffs[3][2][6][3] == 1.032260
 
 
+def test_dirint_bins():
+    """Test the binning of values for the dirint coefficients at the bin edges."""
+    ktp_bin, alt_bin, w_bin, dktp_bin = _dirint_bins(
+        [0, 0.24, 0.8, 1, 1.01], [90, 65, 10, -5, 91],
+        [-1, 0, 1.5, 3, -0.5], [-1, 0.015, 0.3, 1, 1.01])
+    assert ktp_bin == [0, 1, 5, 5, -1]
+    assert alt_bin == [0, 1, 5, 5, -1]
+    assert w_bin == [4, 0, 1, 3, -1]
+    assert dktp_bin == [6, 1, 5, 5, -1]
+
+
+def test_disc_series():
+    """Test that the disc series matches the disc model for each value."""
+    ghi = [0, 1000, 200, 3000, 50]
+    alts = [30, 80, 20, 90, 2]
+    doys = [1, 1, 150, 200, 200]
+    pressures = [101325, 101325, None, 93193., 101325]
+    disc_dni, kt_primes = _disc_series(ghi, alts, doys, pressures)
+    for i in range(len(ghi)):
+        dni, kt, am = disc(ghi[i], alts[i], doys[i], pressures[i])
+        assert disc_dni[i] == dni
+        assert kt_primes[i] == clearness_index_zenith_independent(kt, am, 1)
+
+
 def test_disc():
     """Test the accuracy of the disc model against pvlib results."""
     disc_result = disc(1000, 80, 1)
@@ -1,5 +1,6 @@
 import os
 import json
+import itertools
 
 from ladybug_geometry.geometry3d.face import Face3D
 from ladybug_geometry.geometry3d.mesh import Mesh3D
@@ -33,3 +34,82 @@ def test_init_solar_envelope():
     str(envelope)  # test the string representation
     envelope_mesh = envelope.envelope_mesh()
     assert isinstance(envelope_mesh, Mesh3D)
+
+
+def test_solar_envelope_point_heights():
+    """Test that the envelope heights match intersecting every sun ray and obstacle."""
+    sunpath = Sunpath(latitude=40.72, longitude=-74.02)
+    sun_vecs = []
+    for month in (3, 6, 12):
+        for hour in range(8, 17):
+            sun_vecs.append(sunpath.calculate_sun(month, 21, hour).sun_vector)
+    with open('./tests/assets/geo/mesh.json') as json_file:
+        site_mesh = Mesh3D.from_dict(json.load(json_file))
+    with open('./tests/assets/geo/faces.json') as json_file:
+        context_faces = [Face3D.from_dict(con) for con in json.load(json_file)]
+
+    for solar_rights in (True, False):
+        envelope = SolarEnvelope(
+            site_mesh, context_faces, sun_vecs, solar_rights=solar_rights)
+        vec2ds = envelope.sun_vector2ds if solar_rights else \
+            envelope.sun_vector2ds_reversed
+        altitudes = envelope._sun_altitudes()
+        obs_heights = [face[0].z for face in context_faces]
+        height_method = envelope._point_height_rights if solar_rights \
+            else envelope._point_height_collection
+        heights = []
+        for point in envelope.geometry_point2ds:
+            pt_height = envelope.base_height
+            for obs_poly, obs_h in zip(envelope.obstacle_polygon2ds, obs_heights):
+                for vec, alt in zip(vec2ds, altitudes):
+                    pt_height = height_method(
+                        point, vec, alt, obs_poly, obs_h, pt_height)
+            heights.append(pt_height)
+
+        envelope_mesh = envelope.envelope_mesh()
+        assert [pt.z for pt in envelope_mesh.vertices] == heights
+        assert envelope.envelope_mesh(processes=2).vertices == envelope_mesh.vertices
+
+
+def test_solar_envelope_progressive():
+    """Test the progressive_envelope_meshes method."""
+    sunpath = Sunpath(latitude=40.72, longitude=-74.02)
+    sun_vecs = []
+    for hour in range(8, 17):
+        sun_vecs.append(sunpath.calculate_sun(12, 21, hour).sun_vector)
+    with open('./tests/assets/geo/mesh.json') as json_file:
+        site_mesh = Mesh3D.from_dict(json.load(json_file))
+    with open('./tests/assets/geo/faces.json') as json_file:
+        context_faces = [Face3D.from_dict(con) for con in json.load(json_file)]
+    envelope = SolarEnvelope(site_mesh, context_faces, sun_vecs, solar_rights=True)
+
+    meshes = list(envelope.progressive_envelope_meshes(1, cell_count=4))
+    assert len(meshes) > 1
+    for mesh in meshes:
+        assert len(mesh.vertices) == len(site_mesh.vertices)
+        assert mesh.faces == site_mesh.faces
+
+    envelope_mesh = envelope.envelope_mesh()
+    meshes = list(envelope.progressive_envelope_meshes(-1, cell_count=4))
+    assert meshes[-1].vertices == envelope_mesh.vertices
+
+
+def test_solar_envelope_progressive_coincident_vertices():
+    """Test that progressive_envelope_meshes ends for meshes with coincident vertices."""
+    sunpath = Sunpath(latitude=40.72, longitude=-74.02)
+    sun_vecs = []
+    for hour in range(8, 17):
+        sun_vecs.append(sunpath.calculate_sun(12, 21, hour).sun_vector)
+    with open('./tests/assets/geo/mesh.json') as json_file:
+        site_mesh = Mesh3D.from_dict(json.load(json_file))
+    with open('./tests/assets/geo/faces.json') as json_file:
+        context_faces = [Face3D.from_dict(con) for con in json.load(json_file)]
+    vert_count = len(site_mesh.vertices)
+    double_faces = site_mesh.faces + \
+        tuple(tuple(i + vert_count for i in face) for face in site_mesh.faces)
+    double_mesh = Mesh3D(site_mesh.vertices + site_mesh.vertices, double_faces)
+    envelope = SolarEnvelope(double_mesh, context_faces, sun_vecs, solar_rights=True)
+
+    meshes = list(itertools.islice(envelope.progressive_envelope_meshes(-1), 100))
+    assert len(meshes) < 100
+    assert meshes[-1].vertices == envelope.envelope_mesh().vertices
@@ -5,6 +5,7 @@ from ladybug.designday import ASHRAEClearSky, ASHRAETau
 
 from pytest import approx
 import os
+import re
 
 
 def test_import_stat():
@@ -180,6 +181,53 @@ def test_typical_extreme_weeks():
     assert str(typical_autumn) == '10/27 to 11/2 between 0 and 23 @1'
 
 
+def test_lazy_monthly_tables():
+    """Test that the monthly tables are only parsed once they are requested."""
+    relative_path = './tests/assets/stat/chicago.stat'
+    stat = STAT(relative_path)
+    assert stat._monthly_text is not None
+    assert stat.ashrae_climate_zone == '5A'
+    assert stat.koppen_climate_zone == 'Dfa'
+    assert stat._monthly_text is not None
+
+    assert len(stat.monthly_tau_beam) == 12
+    assert stat._monthly_text is None
+    assert stat.monthly_tau_beam[0] == approx(0.302, rel=1e-3)
+    assert stat.monthly_ws_avg[0] == approx(4.9, rel=1e-3)
+    assert len(stat._monthly_wind_dirs) == 8
+    assert stat.monthly_db_temp_range_050[0] == approx(9.0, rel=1e-3)
+
+    # test a file without monthly wind directions
+    stat = STAT('./tests/assets/stat/antartica.stat')
+    assert stat._monthly_wind_dirs == [[0] * 12 for i in range(8)]
+
+
+def test_parse_body_regex_semantics():
+    """Test that the parsed body text matches regular expressions over the full text."""
+    body = (
+        'Heating\n1\t-20.0\n'
+        '   Spring\n  Typical Week Period selected: Apr 12:Apr 18,\n'
+        ' - Monthly Statistics for Wind Speed m/s\n'
+        '\tDaily Avg\t1.0\t2.0\n\tDaily Avg\t3.0\t4.0 Daily Avg\t5.0\n'
+        ' - Monthly Wind Direction % {N=0 or 360 deg}\n'
+        '\tNorth\t10\t20\n\tNorthEast\t1\t2\n\tEast North\t30\t40\n'
+        '\tSouth\n\t5\t6\n'
+    )
+    found = STAT(None)._parse_body(body)
+    assert found['heating'] == re.findall(r'Heating\s(\d.*)', body)[0] == '1\t-20.0'
+    assert found['typical_weeks'] == [('Spring', ('Apr', '12', 'Apr', '18'))]
+    assert found['_monthly_wind'] == re.findall(
+        r'Monthly Statistics for Wind Speed[\s\S]*Daily Avg(.*)', body)[0]
+    assert found['_monthly_wind'] == '\t5.0'
+    for dir_name in STAT._wind_dir_names:
+        matches = re.findall(r'Monthly Wind Direction %[\s\S]*' + dir_name + r'\s(.*)',
+                             body)
+        assert found[dir_name] == (matches[0] if matches else None)
+    assert found['North'] == '30\t40'
+    assert found['South'] == '\t5\t6'
+    assert found['SouthEast'] is None
+
+
 def test_dict_methods():
     """Test dictionary serialization methods."""
     relative_path = './tests/assets/stat/chicago.stat'
@@ -339,3 +339,21 @@ def test_sunpath_before_after_midnight_sunrise_sunset():
     sp = Sunpath.from_location(before_mid_loc)
     arc_geos = sp.monthly_day_arc3d()
     assert all(isinstance(arc, Arc3D) for arc in arc_geos)
+
+
+def test_calculate_sun_altitudes_batch():
+    """Test that batch sun altitudes match those of individual sun paths."""
+    locations = [Location('A', latitude=41.98, longitude=-87.92, time_zone=-6),
+                 Location('B', latitude=-33.9, longitude=151.2, time_zone=10),
+                 Location('C', latitude=90, longitude=-88.1, time_zone=-6)]
+    datetimes = AnalysisPeriod(6, 21, 0, 6, 22, 23, timestep=4).datetimes
+    for leap_year in (False, True):
+        altitudes = Sunpath.calculate_sun_altitudes_batch(
+            locations, datetimes, leap_year)
+        assert len(altitudes) == 3
+        for loc, alts in zip(locations, altitudes):
+            sp = Sunpath.from_location(loc)
+            sp.is_leap_year = leap_year
+            assert len(alts) == len(datetimes)
+            for dt, alt in zip(datetimes, alts):
+                assert alt == sp.calculate_sun_from_date_time(dt).altitude
@@ -1,8 +1,10 @@
 from ladybug_geometry.geometry3d.pointvector import Vector3D
 from ladybug_geometry.geometry3d.mesh import Mesh3D
 
-from ladybug.viewsphere import view_sphere
+from ladybug.color import Color
+from ladybug.viewsphere import ViewSphere, view_sphere
 
+import os
 import pytest
 
 
@@ -77,3 +79,65 @@ def test_dome_radial_patches():
     view_weights = view_sphere.dome_radial_patch_weights()
     assert len(view_weights) == 1296
     assert sum(view_weights) == pytest.approx(1, rel=1e-3)
+
+
+def test_pattern_batch():
+    """Test that the batch pattern methods match the single-plane methods."""
+    view_vecs = view_sphere.reinhart_sphere_vectors[:576]
+    normals = [Vector3D(0, -1, 0), Vector3D(1, 1, 0), Vector3D(-1, 0, 0.5)]
+
+    masks, angles = view_sphere.orientation_pattern_batch(normals, view_vecs)
+    assert len(masks) == len(angles) == 3
+    for norm, mask, ang in zip(normals, masks, angles):
+        s_mask, s_ang = view_sphere.orientation_pattern(norm, view_vecs)
+        assert mask == s_mask
+        assert ang == pytest.approx(s_ang, abs=1e-9)
+
+    masks = view_sphere.overhang_pattern_batch(normals, 30, view_vecs)
+    for norm, mask in zip(normals, masks):
+        assert mask == view_sphere.overhang_pattern(norm, 30, view_vecs)
+
+    masks = view_sphere.fin_pattern_batch(normals, [20, 30, 0], 45, view_vecs)
+    for norm, l_ang, mask in zip(normals, (20, 30, 0), masks):
+        assert mask == view_sphere.fin_pattern(norm, l_ang, 45, view_vecs)
+
+    masks = view_sphere.fin_pattern_batch([(0, -1, 0)], 30, 30, [(0, 0, 1)])
+    assert masks == [[True]]
+
+
+def test_patch_cache():
+    """Test that generated patches are cached and can be shared through a file."""
+    ViewSphere.clear_patch_cache()
+    mesh_1, vecs_1 = view_sphere.dome_patches(3)
+    mesh_2, vecs_2 = ViewSphere().dome_patches(3)
+    assert mesh_1.vertices is mesh_2.vertices
+    assert vecs_1 is vecs_2
+    # editing the output mesh should not affect the cache
+    assert mesh_1 is not mesh_2
+    mesh_1.colors = [Color(255, 0, 0)] * len(mesh_1.faces)
+    assert view_sphere.dome_patches(3)[0].colors is None
+    # properties computed for the cached mesh should be shared with the copies
+    cached_mesh = ViewSphere._cached_patches(('dome', 3, False))[0]
+    assert view_sphere.dome_patches(3)[0].face_normals is cached_mesh.face_normals
+    assert view_sphere.sphere_patches(3)[0] is not view_sphere.sphere_patches(3)[0]
+    weights = view_sphere.dome_radial_patch_weights(36, 9)
+    weights.append(0)  # mutating the output should not affect the cache
+    assert len(view_sphere.dome_radial_patch_weights(36, 9)) == 324
+
+    file_path = './tests/assets/viewsphere_patches.json'
+    ViewSphere.save_patch_cache(file_path)
+    ViewSphere.clear_patch_cache()
+    ViewSphere.load_patch_cache(file_path)
+    os.remove(file_path)
+    mesh_3, vecs_3 = view_sphere.dome_patches(3)
+    assert mesh_3 is not mesh_1
+    assert len(mesh_3.faces) == len(mesh_1.faces)
+    assert mesh_3.vertices[10].is_equivalent(mesh_1.vertices[10], 1e-9)
+    assert vecs_3[20].is_equivalent(vecs_1[20], 1e-9)
+    assert len(view_sphere.dome_radial_patch_weights(36, 9)) == 324
+
+    ViewSphere.PATCH_CACHE_SIZE = 2
+    for i in range(1, 5):
+        view_sphere.sphere_patches(i)
+    assert len(ViewSphere._patch_cache) == 2
+    ViewSphere.PATCH_CACHE_SIZE = 32
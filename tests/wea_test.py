@@ -59,6 +59,58 @@ def test_from_file_discontinuous():
     assert diff == 47
 
 
+def test_from_file_mixed_columns():
+    """Test import from a wea file with lines of different lengths."""
+    with open('./tests/assets/wea/chicago_filtered.wea') as wea_f:
+        header = wea_f.readlines()[:6]
+    wea_path = './tests/assets/wea/mixed_columns.wea'
+    with open(wea_path, 'w') as wea_f:
+        wea_f.writelines(header)
+        wea_f.write('1 1 7.500 22 10\n1 1 8.500 0 0 397 47\n\n')
+    wea = Wea.from_file(wea_path)
+    os.remove(wea_path)
+
+    assert len(wea) == 2
+    assert wea.direct_normal_irradiance.values == (22, 397)
+    assert wea.diffuse_horizontal_irradiance.values == (10, 47)
+    assert wea.datetimes[1].hour == 8
+
+
+def test_count_timesteps_line_endings():
+    """Test that count_timesteps counts lines with any type of line ending."""
+    with open('./tests/assets/wea/chicago_filtered.wea') as wea_f:
+        lines = wea_f.read().splitlines()[:9]
+    wea_path = './tests/assets/wea/line_endings.wea'
+    for line_end in ('\n', '\r\n', '\r'):
+        with open(wea_path, 'wb') as wea_f:
+            wea_f.write(line_end.join(lines).encode('utf-8'))
+        assert Wea.count_timesteps(wea_path) == 3
+    os.remove(wea_path)
+
+
+def test_file_string_round_trip():
+    """Test that Wea files written with to_file_string are read back the same."""
+    wea_file = './tests/assets/wea/san_francisco_10min.wea'
+    wea = Wea.from_file(wea_file, 6)
+    with open(wea_file) as wea_f:
+        data_lines = wea_f.readlines()[6:]
+    assert wea.to_file_string().splitlines(True)[6:] == data_lines
+
+    location = Location('Leap Year', latitude=40, longitude=-75, time_zone=-5)
+    leap_wea = Wea.from_annual_values(
+        location, list(range(8784)), [100] * 8784, is_leap_year=True)
+    wea_path = './tests/assets/wea/leap_year.wea'
+    leap_wea.write(wea_path)
+    assert Wea.count_timesteps(wea_path) == 8784
+    new_wea = Wea.from_file(wea_path, is_leap_year=True)
+    assert new_wea.is_annual
+    assert new_wea.is_leap_year
+    assert new_wea.direct_normal_irradiance.values == \
+        leap_wea.direct_normal_irradiance.values
+    assert new_wea.to_file_string() == leap_wea.to_file_string()
+    os.remove(wea_path)
+
+
 def test_from_file_daysim():
     """Test import from wea file with a shorter timestep as generated by DAYSIM."""
     wea_file = './tests/assets/wea/san_francisco_10min_daysim.wea'
@@ -184,6 +236,55 @@ def test_from_zhang_huang():
         pytest.approx(144.51, rel=1e-1)
 
 
+def test_from_clear_sky_batch():
+    """Test that the batch clear sky methods match the single location methods."""
+    locations = [
+        Location('Chicago', '-', 'USA', 41.98, -87.92, -6.0, 201.0),
+        Location('Sydney', '-', 'AUS', -33.9, 151.2, 10.0, 5.0),
+        Location('Rockford', '-', 'USA', 42.2, -89.1, -6.0, 221.0)]
+
+    weas = Wea.from_ashrae_clear_sky_batch(locations, [1, 1.05, 0.95])
+    assert len(weas) == 3
+    for loc, clr, wea in zip(locations, [1, 1.05, 0.95], weas):
+        s_wea = Wea.from_ashrae_clear_sky(loc, clr)
+        assert wea.location.city == loc.city
+        assert wea.direct_normal_irradiance.values == \
+            s_wea.direct_normal_irradiance.values
+        assert wea.diffuse_horizontal_irradiance.values == \
+            s_wea.diffuse_horizontal_irradiance.values
+
+    tau_b, tau_d = [0.3] * 12, [2.3] * 12
+    weas = Wea.from_ashrae_revised_clear_sky_batch(
+        locations, tau_b, tau_d, 2, True, processes=2)
+    for loc, wea in zip(locations, weas):
+        s_wea = Wea.from_ashrae_revised_clear_sky(loc, tau_b, tau_d, 2, True)
+        assert wea.timestep == 2
+        assert wea.is_leap_year
+        assert wea.direct_normal_irradiance.values == \
+            s_wea.direct_normal_irradiance.values
+
+
+def test_from_zhang_huang_batch():
+    """Test that the batch Zhang-Huang method matches the single location method."""
+    epw = EPW('./tests/assets/epw/chicago.epw')
+    locations = [epw.location, Location('Sydney', '-', 'AUS', -33.9, 151.2, 10.0)]
+    colls = (epw.total_sky_cover, epw.relative_humidity,
+             epw.dry_bulb_temperature, epw.wind_speed)
+    weas = Wea.from_zhang_huang_solar_batch(
+        locations, *[[coll] * 2 for coll in colls],
+        atmospheric_pressure=[epw.atmospheric_station_pressure] * 2)
+    for loc, wea in zip(locations, weas):
+        s_wea = Wea.from_zhang_huang_solar(
+            loc, *colls, atmospheric_pressure=epw.atmospheric_station_pressure)
+        assert wea.direct_normal_irradiance.values == \
+            s_wea.direct_normal_irradiance.values
+        assert wea.diffuse_horizontal_irradiance.values == \
+            s_wea.diffuse_horizontal_irradiance.values
+
+    with pytest.raises(AssertionError):
+        Wea.from_zhang_huang_solar_batch(locations, *[[coll] for coll in colls])
+
+
 def test_zhang_huang_accuracy():
     """Test zhang huang solar model to ensure that average error is within
     25% of actual solar."""
@@ -353,6 +454,14 @@ def test_estimate_illuminance():
     assert zen_lum.bounds[0] == pytest.approx(0, rel=1e-3)
     assert zen_lum.bounds[1] < 35000
 
+    altitudes = wea._sun_altitudes()
+    new_comps = wea.estimate_illuminance_components(
+        epw.dew_point_temperature, altitudes)
+    assert new_comps[0].values == glob_ill.values
+    assert new_comps[3].values == zen_lum.values
+    with pytest.raises(AssertionError):
+        wea.estimate_illuminance_components(epw.dew_point_temperature, altitudes[:10])
+
 
 def test_leap_year():
     """Test clear sky with leap year."""
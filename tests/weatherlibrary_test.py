@@ -0,0 +1,129 @@
+# coding=utf-8
+import os
+import shutil
+import pytest
+
+from ladybug.epw import EPW
+from ladybug.stat import STAT
+from ladybug.ddy import DDY
+from ladybug.wea import Wea
+from ladybug.weatherlibrary import weather_files, load_weather_files, \
+    load_weather_library, StationIndex
+
+
+def test_weather_files():
+    """Test the weather_files method."""
+    epw_files = weather_files('./tests/assets/epw')
+    assert len(epw_files) == 5
+    assert epw_files == sorted(epw_files)
+    assert all(f.endswith('.epw') for f in epw_files)
+
+    stat_ddy = weather_files('./tests/assets/stat', ('stat', 'ddy'))
+    assert all(f.endswith('.stat') for f in stat_ddy)
+
+    with pytest.raises(AssertionError):
+        weather_files('./tests/assets/not_a_folder')
+
+
+def test_load_weather_files():
+    """Test the load_weather_files method against loading each file directly."""
+    file_paths = [
+        './tests/assets/epw/chicago.epw', './tests/assets/epw/tokyo.epw',
+        './tests/assets/stat/chicago.stat', './tests/assets/ddy/chicago.ddy',
+        './tests/assets/wea/chicago.wea'
+    ]
+    progress = []
+
+    def report(loaded_count, total_count, file_path):
+        progress.append((loaded_count, total_count, file_path))
+
+    for processes in (1, 2):
+        progress = []
+        loaded = list(load_weather_files(
+            file_paths, processes=processes, batch_size=2, progress=report))
+        assert [f for f, _ in loaded] == file_paths
+        assert progress == [(i + 1, 5, f) for i, f in enumerate(file_paths)]
+
+        epw = EPW(file_paths[0])
+        assert loaded[0][1].dry_bulb_temperature.values == \
+            epw.dry_bulb_temperature.values
+        assert loaded[0][1].to_dict() == epw.to_dict()
+        assert isinstance(loaded[2][1], STAT)
+        assert loaded[2][1].to_dict() == STAT(file_paths[2]).to_dict()
+        assert isinstance(loaded[3][1], DDY)
+        assert loaded[3][1].to_dict() == DDY.from_ddy_file(file_paths[3]).to_dict()
+        assert isinstance(loaded[4][1], Wea)
+        assert loaded[4][1].to_dict() == Wea.from_file(file_paths[4]).to_dict()
+
+
+def test_load_weather_files_header_only():
+    """Test the load_weather_files method with header_only and skip_errors."""
+    file_paths = ['./tests/assets/epw/chicago.epw', './tests/assets/epw/not_a_file.epw']
+    with pytest.raises(ValueError):
+        list(load_weather_files(file_paths, processes=1))
+
+    loaded = list(load_weather_files(
+        file_paths, header_only=True, processes=1, skip_errors=True))
+    assert len(loaded) == 2
+    epw = loaded[0][1]
+    assert epw.is_header_loaded
+    assert not epw.is_data_loaded
+    assert epw.location.city == 'Chicago Ohare Intl Ap'
+    assert loaded[1][1] is None
+
+
+def test_load_weather_library():
+    """Test the load_weather_library method."""
+    folder = './tests/assets/ddy'
+    loaded = list(load_weather_library(folder, ('ddy',), processes=1))
+    assert len(loaded) == len(weather_files(folder, ('ddy',)))
+    assert all(os.path.isfile(f) for f, _ in loaded)
+    assert all(isinstance(ddy, DDY) for _, ddy in loaded)
+
+
+def test_station_index():
+    """Test the StationIndex class."""
+    folder = './tests/assets/station_index'
+    if os.path.isdir(folder):
+        shutil.rmtree(folder)
+    os.mkdir(folder)
+    try:
+        shutil.copy('./tests/assets/epw/chicago.epw', folder)
+        shutil.copy('./tests/assets/stat/chicago.stat', folder)
+        shutil.copy('./tests/assets/epw/tokyo.epw', folder)
+
+        index = StationIndex(folder)
+        assert len(index) == 2
+        chicago, tokyo = index.stations
+        assert chicago.epw_path == os.path.join(index.folder, 'chicago.epw')
+        assert chicago.stat_path == os.path.join(index.folder, 'chicago.stat')
+        assert chicago.station_id == '725300'
+        assert chicago.climate_zone == '5A'
+        assert tokyo.stat_path is None
+        assert tokyo.climate_zone is None
+
+        nearest = index.nearest(41.88, -87.63)
+        assert len(nearest) == 1
+        assert nearest[0].city == chicago.city
+        assert nearest[0].distance == pytest.approx(26.4, abs=0.1)
+        nearest = index.nearest(35.68, 139.69, 5)
+        assert [st.city for st in nearest] == [tokyo.city, chicago.city]
+        assert nearest[0].distance < nearest[1].distance
+        assert len(index.within(41.88, -87.63, 100)) == 1
+        assert len(index.within(41.88, -87.63, 20000)) == 2
+
+        # test that the index is only updated for new files
+        assert index.update() == 0
+        shutil.copy('./tests/assets/epw/mannheim.epw', folder)
+        os.remove(os.path.join(folder, 'tokyo.epw'))
+        assert index.update() == 1
+        assert [st.city for st in index.stations] == [chicago.city, 'Mannheim']
+
+        # test the serialization of the index
+        index_file = index.write(os.path.join(folder, 'index.json'))
+        new_index = StationIndex.from_file(index_file)
+        assert new_index.to_dict() == index.to_dict()
+        assert new_index.nearest(49.5, 8.5)[0].city == 'Mannheim'
+        assert new_index.update() == 0
+    finally:
+        shutil.rmtree(folder)
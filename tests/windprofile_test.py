@@ -44,6 +44,31 @@ def test_wind_profile_calculate_wind_data():
     assert data_at_height.average < met_data.average
 
 
+def test_wind_profile_calculate_wind_matrix():
+    """Test the WindProfile batch methods against the calculate_wind method."""
+    epw_file = './tests/assets/epw/chicago.epw'
+    met_data = EPW(epw_file).wind_speed
+    heights = [0.05, 1, 2, 10]
+
+    for log_law in (False, True):
+        profile = WindProfile('suburban', log_law=log_law)
+        matrix = profile.calculate_wind_matrix(met_data, heights)
+        assert len(matrix) == len(heights)
+        for height, speeds in zip(heights, matrix):
+            assert speeds == [profile.calculate_wind(v, height) for v in met_data]
+
+        terrain_matrices = WindProfile.calculate_wind_matrix_terrains(
+            met_data, heights, log_law=log_law)
+        assert sorted(terrain_matrices.keys()) == sorted(WindProfile.TERRAINS)
+        assert terrain_matrices['suburban'] == matrix
+
+    profile = WindProfile('city')
+    data_at_heights = profile.calculate_wind_data_at_heights(met_data, heights)
+    assert len(data_at_heights) == len(heights)
+    assert data_at_heights[1].header.metadata['height'] == '1m'
+    assert data_at_heights[1] == profile.calculate_wind_data(met_data, 1)
+
+
 def test_wind_profile_polyline3d():
     """Test the profile_polyline3d."""
     profile = WindProfile('suburban')
@@ -514,6 +514,39 @@ def test_prevailing_direction():
     assert w.prevailing_direction[0] == 216.0
 
 
+def test_direction_bins():
+    """Test the direction_bins method and its cache."""
+    dir_vals = [350, 10, 90, 100, 5, 180, 270, 355]
+    WindRose.clear_direction_bin_cache()
+    bins = WindRose.direction_bins(dir_vals, 4)
+    assert bins == ((4, 1, 0, 7), (2, 3), (5,), (6,))
+    assert len(WindRose._direction_bin_cache) == 1
+    assert WindRose.direction_bins(dir_vals, 4) is bins
+    assert WindRose.direction_bins(dir_vals, 8) is not bins
+    assert len(WindRose._direction_bin_cache) == 2
+    # values that only differ outside of the sampled cache key get their own bins
+    long_vals = [float(i % 360) for i in range(1000)]
+    long_bins = WindRose.direction_bins(long_vals, 4)
+    long_vals[1] = 180.0
+    new_bins = WindRose.direction_bins(long_vals, 4)
+    assert new_bins is not long_bins
+    assert 1 in new_bins[2] and 1 not in long_bins[2]
+
+    # test that wind roses of different analysis data share the direction bins
+    epw_path = os.path.join(os.getcwd(), 'tests/assets/epw/chicago.epw')
+    epw = EPW(epw_path)
+    WindRose.clear_direction_bin_cache()
+    w_spd = WindRose(epw.wind_direction, epw.wind_speed, 16)
+    w_temp = WindRose(epw.wind_direction, epw.dry_bulb_temperature, 16)
+    assert len(WindRose._direction_bin_cache) == 1
+    assert sum(len(b) for b in w_temp.histogram_data) == 8760
+    assert sum(len(b) for b in w_spd.histogram_data) + w_spd.zero_count == 8760
+    dir_bins = WindRose.direction_bins(w_temp.direction_values, 16)
+    assert [len(b) for b in w_temp.histogram_data] == [len(b) for b in dir_bins]
+    WindRose.clear_direction_bin_cache()
+    assert len(WindRose._direction_bin_cache) == 0
+
+
 def test_histogram_data_nested():
 
     # Testing vals